@@ -0,0 +1,44 @@
+"""Time /proc/interrupts parsing and analysis on a synthetic wide host.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_interrupts.py
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+
+from sysmatrix.collectors.interrupts import analyze, parse_table, table_deltas
+
+
+def synthetic_interrupts(cpus: int = 256, sources: int = 300, tick: int = 0) -> bytes:
+    """Build a /proc/interrupts-shaped table with ``sources`` rows after ``tick`` seconds."""
+    rng = random.Random(0)
+    lines = [" " * 11 + "".join(f"CPU{cpu:<8}" for cpu in range(cpus))]
+    for irq in range(sources):
+        counts = "".join(f"{rng.randrange(10**9) + tick * rng.randrange(1000):>11}" for _ in range(cpus))
+        lines.append(f"{irq:>4}:{counts}  IR-PCI-MSIX-0000:3b:00.0 {irq}-edge      eth0-TxRx-{irq}")
+    lines.append(f"ERR:{0:>11}")
+    return ("\n".join(lines) + "\n").encode()
+
+
+def main() -> None:
+    before = synthetic_interrupts(tick=0)
+    after = synthetic_interrupts(tick=1)
+    table_before, table_after = parse_table(before), parse_table(after)
+    number = 50
+    parse = timeit.timeit(lambda: parse_table(after), number=number) / number
+    deltas = timeit.timeit(lambda: table_deltas(table_before, table_after), number=number) / number
+    delta_values = table_deltas(table_before, table_after)
+    empty = parse_table(b"CPU0\n")
+    full = timeit.timeit(lambda: analyze((table_after, delta_values), (empty, []), 1.0), number=number) / number
+    print(f"input    {len(after) / 1024:8.0f} KiB, {len(table_after.labels)} rows x {len(table_after.cpus)} CPUs")
+    print(f"parse    {parse * 1e3:8.2f} ms")
+    print(f"deltas   {deltas * 1e3:8.2f} ms")
+    print(f"analyze  {full * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
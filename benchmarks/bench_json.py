@@ -0,0 +1,35 @@
+"""Compare JSON encoder backends and output styles.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_json.py
+
+Backends that are not installed (``orjson`` comes with the ``fast`` extra)
+are skipped.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from bench_serialize import sample_snapshot
+
+from sysmatrix.renderers.json_output import JSON_BACKENDS, JSON_STYLES, encode_json
+
+
+def main() -> None:
+    data = sample_snapshot(interfaces=16, processes=10).to_dict(redact=True)
+    number = 2000
+    for backend in JSON_BACKENDS:
+        for style in JSON_STYLES:
+            try:
+                size = len(encode_json(data, style, backend))
+            except ImportError:
+                print(f"{backend:<7} {style:<8} not installed")
+                continue
+            elapsed = timeit.timeit(lambda: encode_json(data, style, backend), number=number)
+            print(f"{backend:<7} {style:<8} {elapsed / number * 1e6:8.1f} us/op {size:8d} bytes")
+
+
+if __name__ == "__main__":
+    main()
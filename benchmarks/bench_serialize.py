@@ -0,0 +1,103 @@
+"""Compare snapshot serialization paths.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_serialize.py
+
+``one-shot`` renders a single pretty JSON document as ``--json`` does;
+``stream`` encodes compact NDJSON lines as a 10 Hz sampler would, using a
+snapshot with many interfaces and processes.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import timeit
+
+from sysmatrix import defaults
+from sysmatrix.models import REDACTED, InterfaceStats, ProcessStats, Snapshot
+
+
+def sample_snapshot(interfaces: int, processes: int) -> Snapshot:
+    network = defaults.default_network()
+    network.interfaces = [
+        InterfaceStats(
+            name=f"eth{index}",
+            virtual=False,
+            rx_bytes=index * 1000,
+            tx_bytes=index * 2000,
+            rx_bytes_per_s=1.0,
+            tx_bytes_per_s=2.0,
+            rx_packets_per_s=3.0,
+            tx_packets_per_s=4.0,
+            rx_errors=0,
+            tx_errors=0,
+            rx_dropped=0,
+            tx_dropped=0,
+            speed_mbps=10000,
+            utilization_percent=0.1,
+            addresses=[f"10.0.{index}.1/24", f"fe80::{index}/64"],
+        )
+        for index in range(interfaces)
+    ]
+    top = [ProcessStats(pid, f"proc{pid}", "S", 1.0, 100.0, 10.0, 20.0) for pid in range(processes)]
+    proc_data = defaults.default_processes()
+    proc_data.top_cpu = top
+    proc_data.top_memory = list(top)
+    proc_data.top_io = list(top)
+    return Snapshot(
+        system=defaults.default_system(),
+        cpu=defaults.default_cpu(),
+        memory=defaults.default_memory(),
+        gpu=defaults.default_gpu(),
+        storage=defaults.default_storage(),
+        motherboard=defaults.default_motherboard(),
+        network=network,
+        performance=defaults.default_performance(),
+        processes=proc_data,
+        pressure=defaults.default_pressure(),
+        cgroup=defaults.default_cgroup(),
+    )
+
+
+def _asdict_redacted(snapshot: Snapshot) -> dict:
+    """The previous path: deep copy, then a redaction pass over the copy."""
+    data = dataclasses.asdict(snapshot)
+    data["system"]["user"] = REDACTED
+    data["system"]["hostname"] = REDACTED
+    data["network"]["ip"] = REDACTED
+    for interface in data["network"]["interfaces"]:
+        interface["addresses"] = [REDACTED for _ in interface["addresses"]]
+    return data
+
+
+def _report(label: str, number: int, baseline: float, current: float) -> None:
+    print(
+        f"{label:<10} asdict {baseline / number * 1e6:8.1f} us/op"
+        f" | serializer {current / number * 1e6:8.1f} us/op"
+        f" | {baseline / current:4.1f}x"
+    )
+
+
+def main() -> None:
+    one_shot = sample_snapshot(interfaces=4, processes=5)
+    number = 2000
+    baseline = timeit.timeit(lambda: json.dumps(_asdict_redacted(one_shot), indent=2, sort_keys=True), number=number)
+    current = timeit.timeit(lambda: json.dumps(one_shot.to_dict(redact=True), indent=2, sort_keys=True), number=number)
+    _report("one-shot", number, baseline, current)
+
+    stream = sample_snapshot(interfaces=64, processes=20)
+    number = 1000
+    compact = {"separators": (",", ":")}
+    baseline = timeit.timeit(lambda: json.dumps(_asdict_redacted(stream), **compact), number=number)
+    current = timeit.timeit(lambda: json.dumps(stream.to_dict(redact=True), **compact), number=number)
+    _report("stream", number, baseline, current)
+
+    baseline = timeit.timeit(lambda: _asdict_redacted(stream), number=number)
+    current = timeit.timeit(lambda: stream.to_dict(redact=True), number=number)
+    _report("to-dict", number, baseline, current)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,13 @@
 """Public package metadata for sysmatrix."""
 
-__all__ = ["__version__"]
+__all__ = ["Sampler", "__version__"]
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> object:
+    # Loaded on first use so importing the package (and the CLI) stays cheap.
+    if name == "Sampler":
+        from sysmatrix.sampler import Sampler
+
+        return Sampler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
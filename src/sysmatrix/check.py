@@ -0,0 +1,335 @@
+"""Threshold rule engine behind ``sysmatrix check``.
+
+Rules compare one snapshot field against a constant::
+
+    [warn:|crit:] <domain>.<field>[.<item>...] <op> <value> [for <duration>] [clear <value>]
+
+``for`` requires the condition to hold across invocations for that long and
+``clear`` adds hysteresis: once firing, a rule stays active until the value
+crosses the clear level. Both keep state in a JSON state file. Exit codes
+follow the Nagios plugin convention (0 OK, 1 WARNING, 2 CRITICAL, 3 UNKNOWN).
+Only the domains referenced by the rules are collected, and collection
+stops as soon as a critical rule fires.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import operator
+import os
+import re
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from sysmatrix.models import DomainStatus
+from sysmatrix.registry import load_plugins
+from sysmatrix.snapshot import (
+    cancel_pending,
+    collection_runner,
+    domain_results,
+    expand_domains,
+    known_domains,
+    start_domain_tasks,
+)
+from sysmatrix.utils.durations import parse_duration
+
+LOGGER = logging.getLogger(__name__)
+
+OK, WARNING, CRITICAL, UNKNOWN = 0, 1, 2, 3
+STATUS_NAMES = {OK: "OK", WARNING: "WARNING", CRITICAL: "CRITICAL", UNKNOWN: "UNKNOWN"}
+
+# Domain states whose value was not measured by this run; rules on them are UNKNOWN.
+_UNMEASURED = {"fallback": "{} collector failed", "stale": "{} value is stale"}
+
+_OPERATORS: dict[str, Callable[[object, object], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+_VALUE = r"""(?:"[^"]*"|'[^']*'|\S+)"""
+_RULE = re.compile(
+    rf"""^\s*(?:(?P<severity>warn(?:ing)?|crit(?:ical)?)\s*:\s*)?
+    (?P<path>[a-z_]\w*(?:\.\w+)+)\s*
+    (?P<op>>=|<=|==|!=|>|<)\s*
+    (?P<value>{_VALUE})
+    (?:\s+for\s+(?P<duration>\S+))?
+    (?:\s+clear\s+(?P<clear>{_VALUE}))?\s*$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One parsed threshold rule."""
+
+    text: str
+    path: tuple[str, ...]
+    op: str
+    value: float | str
+    severity: int = CRITICAL
+    duration_s: float | None = None
+    clear: float | str | None = None
+
+    @property
+    def domain(self) -> str:
+        return self.path[0]
+
+    @property
+    def stateful(self) -> bool:
+        return self.duration_s is not None or self.clear is not None
+
+
+@dataclass
+class RuleResult:
+    """Outcome of evaluating one rule."""
+
+    rule: Rule
+    status: int
+    value: object = None
+    detail: str = ""
+
+
+def _literal(text: str) -> float | str:
+    """Return a quoted string's contents, or the text as a number when it parses."""
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+        return text[1:-1]
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def parse_rule(text: str) -> Rule:
+    """Parse one rule, raising ``ValueError`` with a readable message."""
+    match = _RULE.match(text)
+    if match is None:
+        raise ValueError(f"invalid rule: {text!r}")
+    path = tuple(match["path"].split("."))
+    if path[0] not in known_domains():
+        raise ValueError(f"unknown domain {path[0]!r} in rule: {text!r}")
+    severity = match["severity"]
+    return Rule(
+        text=text.strip(),
+        path=path,
+        op=match["op"],
+        value=_literal(match["value"]),
+        severity=WARNING if severity and severity.lower().startswith("warn") else CRITICAL,
+        duration_s=None if match["duration"] is None else parse_duration(match["duration"]),
+        clear=None if match["clear"] is None else _literal(match["clear"]),
+    )
+
+
+def load_rules(path: str) -> list[str]:
+    """Read rule lines from a file, skipping blanks and ``#`` comments."""
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
+def _resolve(value: object, path: tuple[str, ...]) -> object:
+    """Follow attribute names, dict keys and list indexes below a domain value."""
+    for part in path:
+        if isinstance(value, dict):
+            value = value[part]
+        elif isinstance(value, list):
+            value = value[int(part)]
+        else:
+            value = getattr(value, part)
+    return value
+
+
+def _compare(op: str, value: object, threshold: float | str) -> bool:
+    """Compare ``value`` with ``threshold`` as numbers when possible."""
+    if isinstance(threshold, float) and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _OPERATORS[op](value, threshold)
+    return _OPERATORS[op](str(value), str(threshold))
+
+
+def evaluate(rule: Rule, domain_value: object, state: dict[str, dict], now: float) -> RuleResult:
+    """Evaluate a rule against its domain's value, updating ``state`` in place."""
+    try:
+        value = _resolve(domain_value, rule.path[1:])
+    except (AttributeError, KeyError, IndexError, ValueError):
+        return RuleResult(rule, UNKNOWN, detail="field not found")
+    if value is None:
+        return RuleResult(rule, UNKNOWN, detail="value unavailable")
+
+    previous = state.get(rule.text, {})
+    active = bool(previous.get("active"))
+    threshold = rule.clear if active and rule.clear is not None else rule.value
+    breached = _compare(rule.op, value, threshold)
+
+    since = previous.get("since") if breached else None
+    if breached and since is None:
+        since = now
+    firing = breached and (rule.duration_s is None or now - since >= rule.duration_s)
+    if rule.stateful:
+        state[rule.text] = {"since": since, "active": firing or (active and breached)}
+
+    if firing:
+        return RuleResult(rule, rule.severity, value)
+    detail = "" if not breached else f"pending {now - since:.0f}s/{rule.duration_s:g}s"
+    return RuleResult(rule, OK, value, detail)
+
+
+def default_state_file() -> Path:
+    """Return the state file used when ``--state-file`` is not given."""
+    base = os.environ.get("XDG_STATE_HOME") or os.path.join(os.path.expanduser("~"), ".local", "state")
+    return Path(base) / "sysmatrix" / "check-state.json"
+
+
+def _load_state(path: Path) -> dict[str, dict]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_state(path: Path, state: dict[str, dict]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state, sort_keys=True), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        LOGGER.warning("could not write check state file %s", path, exc_info=True)
+
+
+def overall_status(results: list[RuleResult]) -> int:
+    """Combine rule outcomes: CRITICAL > WARNING > UNKNOWN > OK."""
+    statuses = {result.status for result in results}
+    for status in (CRITICAL, WARNING, UNKNOWN):
+        if status in statuses:
+            return status
+    return OK
+
+
+async def run_checks_async(
+    rules: list[Rule],
+    state: dict[str, dict],
+    deadline_s: float | None = None,
+) -> list[RuleResult]:
+    """Collect the domains the rules reference and evaluate rules as they complete.
+
+    Pending collectors are cancelled once a critical rule fires, since no
+    later result can change the exit status. Rules whose domains did not
+    finish, or whose collector failed (a fallback or stale value), are
+    reported as UNKNOWN rather than evaluated against defaults.
+    """
+    started = time.monotonic()
+    statuses: dict[str, DomainStatus] = {}
+    tasks = start_domain_tasks({rule.domain for rule in rules}, statuses)
+    by_domain = {rule.domain for rule in rules}
+    results: dict[Rule, RuleResult] = {}
+    pending = {tasks[domain] for domain in by_domain}
+    try:
+        while pending:
+            timeout = None if deadline_s is None else max(deadline_s - (time.monotonic() - started), 0.0)
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            values = domain_results({d: t for d, t in tasks.items() if t in done}, statuses)
+            now = time.time()
+            for rule in rules:
+                if rule in results or rule.domain not in values:
+                    continue
+                unmeasured = _UNMEASURED.get(statuses[rule.domain].state)
+                if unmeasured is None:
+                    results[rule] = evaluate(rule, values[rule.domain], state, now)
+                else:
+                    results[rule] = RuleResult(rule, UNKNOWN, detail=unmeasured.format(rule.domain))
+            if any(result.status == CRITICAL for result in results.values()):
+                break
+    finally:
+        await cancel_pending(tasks.values())
+    return [results.get(rule) or RuleResult(rule, UNKNOWN, detail="not evaluated") for rule in rules]
+
+
+def _format_value(value: object) -> str:
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+def render_results(results: list[RuleResult]) -> str:
+    """Render Nagios-style output: status line, perfdata, then one line per rule."""
+    status = overall_status(results)
+    problems = [result for result in results if result.status != OK]
+    if problems:
+        summary = "; ".join(
+            f"{result.rule.text} ({_format_value(result.value) if result.value is not None else result.detail})"
+            for result in problems
+        )
+    else:
+        summary = f"{len(results)} rule(s) OK"
+    perfdata = " ".join(
+        f"'{'.'.join(result.rule.path)}'={result.value:g}"
+        for result in results
+        if isinstance(result.value, (int, float)) and not isinstance(result.value, bool)
+    )
+    lines = [f"SYSMATRIX {STATUS_NAMES[status]} - {summary}" + (f" | {perfdata}" if perfdata else "")]
+    for result in results:
+        value = "N/A" if result.value is None else _format_value(result.value)
+        detail = f" ({result.detail})" if result.detail else ""
+        lines.append(f"[{STATUS_NAMES[result.status]}] {result.rule.text}: {value}{detail}")
+    return "\n".join(lines)
+
+
+def build_check_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for ``sysmatrix check``."""
+    parser = argparse.ArgumentParser(
+        prog="sysmatrix check",
+        description="Evaluate threshold rules against a partial snapshot (Nagios exit codes).",
+        epilog="Rule syntax: [warn:|crit:] DOMAIN.FIELD OP VALUE [for DURATION] [clear VALUE]",
+    )
+    parser.add_argument("--rule", "-r", action="append", default=[], help="Rule to evaluate (repeatable)")
+    parser.add_argument("--rules-file", "-f", help="File with one rule per line")
+    parser.add_argument(
+        "--state-file",
+        help="State for 'for'/'clear' rules (default: $XDG_STATE_HOME/sysmatrix/check-state.json)",
+    )
+    parser.add_argument("--deadline", metavar="DURATION", help="Give up on collection after DURATION")
+    parser.add_argument(
+        "--plugins",
+        action="store_true",
+        help="Load collector plugins so rules can reference their domains",
+    )
+    return parser
+
+
+def main(argv: list[str]) -> int:
+    """Run ``sysmatrix check`` and return a Nagios-style exit code."""
+    parser = build_check_parser()
+    args = parser.parse_args(argv)
+    if args.plugins:
+        load_plugins()
+    try:
+        texts = list(args.rule)
+        if args.rules_file:
+            texts.extend(load_rules(args.rules_file))
+        if not texts:
+            raise ValueError("no rules given; use --rule or --rules-file")
+        rules = [parse_rule(text) for text in texts]
+        expand_domains(rule.domain for rule in rules)
+        deadline_s = None if args.deadline is None else parse_duration(args.deadline)
+    except (OSError, ValueError) as exc:
+        print(f"SYSMATRIX UNKNOWN - {exc}")
+        return UNKNOWN
+
+    state_path = Path(args.state_file) if args.state_file else default_state_file()
+    stateful = any(rule.stateful for rule in rules)
+    state = _load_state(state_path) if stateful else {}
+    with collection_runner() as runner:
+        results = runner.run(run_checks_async(rules, state, deadline_s))
+    if stateful:
+        _save_state(state_path, state)
+    print(render_results(results))
+    sys.stdout.flush()
+    return overall_status(results)
@@ -3,15 +3,13 @@
 from __future__ import annotations
 
 import argparse
-from importlib.metadata import PackageNotFoundError, version
+import sys
+from typing import TYPE_CHECKING
 
-from sysmatrix.config import RuntimeConfig
-from sysmatrix import __version__
-from sysmatrix.renderers.json_output import render_json
-from sysmatrix.renderers.terminal_full import render_full
-from sysmatrix.renderers.terminal_short import render_short
-from sysmatrix.renderers.watch import run_watch
-from sysmatrix.snapshot import collect_snapshot
+# Only argparse is imported eagerly; collectors, renderers and package
+# metadata are imported once the selected mode needs them.
+if TYPE_CHECKING:
+    from sysmatrix.config import RuntimeConfig
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -19,18 +17,62 @@ def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="sysmatrix",
         description="Modular system information and diagnostics tool.",
+        epilog="Run 'sysmatrix check --help' for threshold checks with monitoring exit codes.",
     )
     parser.add_argument("--short", "-s", action="store_true", help="Minimal output")
     parser.add_argument("--plain", "-p", action="store_true", help="Disable colors")
     parser.add_argument("--opsec", "-o", action="store_true", help="Redact sensitive fields")
-    parser.add_argument("--json", "-j", action="store_true", help="Output JSON")
+    parser.add_argument(
+        "--json",
+        "-j",
+        nargs="?",
+        const="pretty",
+        choices=["pretty", "compact"],
+        help="Output JSON: pretty (default) or compact, schema-ordered single line",
+    )
     parser.add_argument(
         "--watch",
         "-w",
         nargs="?",
-        const=1,
-        type=int,
-        help="Refresh output every N seconds (default: 1)",
+        const=1.0,
+        type=float,
+        help="Refresh output every N seconds, fractions allowed down to 0.05 (default: 1)",
+    )
+    parser.add_argument(
+        "--burst",
+        nargs="?",
+        const=50.0,
+        type=float,
+        metavar="HZ",
+        help="With --watch, sample CPU/memory/network at HZ (10-100, default 50) and show per-tick peaks",
+    )
+    parser.add_argument(
+        "--publish",
+        nargs="?",
+        const="sysmatrix",
+        metavar="NAME",
+        help="Collect every --watch interval (default 1s) and publish to shared memory NAME instead of printing",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=_parse_duration,
+        metavar="DURATION",
+        help="Return within DURATION (e.g. 250ms, 1.5s); slow domains report last-known or default values",
+    )
+    parser.add_argument(
+        "--include-virtual",
+        action="store_true",
+        help="List virtual network interfaces (bridges, veth, tun, ...) alongside physical ones",
+    )
+    parser.add_argument(
+        "--plugins",
+        action="store_true",
+        help="Load collector plugins from installed packages ('sysmatrix.collectors' entry points)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-domain collection timings and failing tools to stderr",
     )
     parser.add_argument(
         "--logo",
@@ -38,40 +80,96 @@ def build_parser() -> argparse.ArgumentParser:
         choices=["debian", "corsair", "minimal", "none"],
         help="Reserved for output compatibility",
     )
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"%(prog)s {_runtime_version()}",
-    )
+    parser.add_argument("--version", action=_VersionAction)
     return parser
 
 
+def _parse_duration(text: str) -> float:
+    """Parse durations such as ``250ms``, ``1.5s`` or ``2`` (seconds) into seconds."""
+    from sysmatrix.utils.durations import parse_duration
+
+    try:
+        return parse_duration(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+class _VersionAction(argparse.Action):
+    """Print the version, resolving package metadata only when requested."""
+
+    def __init__(self, option_strings: list[str], dest: str = argparse.SUPPRESS, **kwargs: object) -> None:
+        super().__init__(
+            option_strings,
+            dest,
+            nargs=0,
+            default=argparse.SUPPRESS,
+            help="show program's version number and exit",
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: object,
+        option_string: str | None = None,
+    ) -> None:
+        sys.stdout.write(f"{parser.prog} {_runtime_version()}\n")
+        parser.exit()
+
+
 def _runtime_version() -> str:
     """Resolve installed package version, with source-tree fallback."""
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
         return version("sysmatrix")
     except PackageNotFoundError:
+        from sysmatrix import __version__
+
         return __version__
 
 
 def _config_from_args(args: argparse.Namespace) -> RuntimeConfig:
     """Convert parsed CLI arguments into runtime configuration."""
-    interval = args.watch if args.watch is not None else 1
-    if interval < 1:
-        raise ValueError("watch interval must be >= 1 second")
+    from sysmatrix.config import RuntimeConfig
+    from sysmatrix.utils.scheduling import MIN_INTERVAL_S
+
+    interval = args.watch if args.watch is not None else 1.0
+    if interval < MIN_INTERVAL_S:
+        raise ValueError(f"watch interval must be >= {MIN_INTERVAL_S} seconds")
+    if args.burst is not None:
+        if args.watch is None:
+            raise ValueError("--burst requires --watch")
+        if not 10 <= args.burst <= 100:
+            raise ValueError("burst rate must be between 10 and 100 Hz")
+    if args.publish is not None and not args.publish.strip("/"):
+        raise ValueError("--publish needs a segment name")
     return RuntimeConfig(
         short=args.short,
-        plain=args.plain or args.json,
+        plain=args.plain or args.json is not None,
         opsec=args.opsec,
-        json=args.json,
+        json=args.json is not None,
+        json_style=args.json or "pretty",
         watch=args.watch is not None,
         watch_interval=interval,
         logo=args.logo,
+        deadline_s=args.deadline,
+        profile=args.profile,
+        burst_hz=args.burst,
+        publish=args.publish,
+        include_virtual=args.include_virtual,
+        plugins=args.plugins,
     )
 
 
 def main(argv: list[str] | None = None) -> int:
     """Run the CLI and return process exit code."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "check":
+        from sysmatrix.check import main as check_main
+
+        return check_main(argv[1:])
+
     parser = build_parser()
     args = parser.parse_args(argv)
     try:
@@ -80,14 +178,40 @@ def main(argv: list[str] | None = None) -> int:
         parser.error(str(exc))
         return 2
 
+    if config.plugins:
+        from sysmatrix.registry import load_plugins
+
+        load_plugins()
+
+    if config.publish is not None:
+        from sysmatrix.shm import run_publisher
+
+        return run_publisher(config)
+
     if config.watch:
+        from sysmatrix.renderers.watch import run_watch
+
         return run_watch(config)
 
-    snapshot = collect_snapshot()
+    from sysmatrix.snapshot import collect_snapshot
+
+    snapshot = collect_snapshot(config.deadline_s, config.include_virtual)
     if config.json:
-        print(render_json(snapshot, config))
+        from sysmatrix.renderers.json_output import render_json_bytes
+
+        sys.stdout.flush()
+        sys.stdout.buffer.write(render_json_bytes(snapshot, config) + b"\n")
+        sys.stdout.flush()
     elif config.short:
+        from sysmatrix.renderers.terminal_short import render_short
+
         print(render_short(snapshot, config))
     else:
+        from sysmatrix.renderers.terminal_full import render_full
+
         print(render_full(snapshot, config))
+    if config.profile:
+        from sysmatrix.renderers.profile import render_profile
+
+        print(render_profile(snapshot), file=sys.stderr)
     return 0
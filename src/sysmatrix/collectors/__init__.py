@@ -1,13 +1,27 @@
 """Collector exports for snapshot assembly."""
 
+from sysmatrix.collectors.burst import BurstSampler
+from sysmatrix.collectors.cgroup import collect_cgroup
 from sysmatrix.collectors.cpu import collect_cpu
-from sysmatrix.collectors.gpu import collect_gpu
+from sysmatrix.collectors.gpu import collect_gpu, collect_gpu_async
+from sysmatrix.collectors.interrupts import collect_interrupts
 from sysmatrix.collectors.memory import collect_memory
-from sysmatrix.collectors.motherboard import collect_motherboard
-from sysmatrix.collectors.network import collect_network
-from sysmatrix.collectors.performance import collect_performance
-from sysmatrix.collectors.storage import collect_storage
-from sysmatrix.collectors.system import collect_system
+from sysmatrix.collectors.motherboard import (
+    collect_board_async,
+    collect_motherboard,
+    collect_motherboard_async,
+    read_vrm_temp_async,
+)
+from sysmatrix.collectors.network import collect_network, collect_network_async
+from sysmatrix.collectors.numa import collect_numa
+from sysmatrix.collectors.performance import collect_performance, collect_performance_async
+from sysmatrix.collectors.pressure import collect_pressure
+from sysmatrix.collectors.processes import collect_processes
+from sysmatrix.collectors.scheduler import collect_scheduler
+from sysmatrix.collectors.storage import collect_storage, collect_storage_async
+from sysmatrix.collectors.system import collect_system, collect_system_async
+from sysmatrix.collectors.tcp import collect_tcp
+from sysmatrix.collectors.thermal import collect_thermal
 
 __all__ = [
     "collect_system",
@@ -18,4 +32,21 @@ __all__ = [
     "collect_motherboard",
     "collect_network",
     "collect_performance",
+    "collect_processes",
+    "collect_pressure",
+    "collect_cgroup",
+    "collect_numa",
+    "collect_thermal",
+    "collect_interrupts",
+    "collect_scheduler",
+    "collect_tcp",
+    "collect_system_async",
+    "collect_gpu_async",
+    "collect_storage_async",
+    "collect_motherboard_async",
+    "collect_network_async",
+    "collect_performance_async",
+    "collect_board_async",
+    "read_vrm_temp_async",
+    "BurstSampler",
 ]
@@ -0,0 +1,146 @@
+"""cgroup v2 limit, usage, and CPU throttling collector for containers."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from sysmatrix.defaults import default_cgroup
+from sysmatrix.models import CgroupData
+from sysmatrix.utils.cgroups import cgroup_v2_dir
+from sysmatrix.utils.sampling import CounterBaseline
+
+
+def _read_text(path: Path) -> str | None:
+    """Read a cgroup interface file, returning None when absent."""
+    try:
+        return path.read_text(encoding="utf-8", errors="ignore").strip()
+    except OSError:
+        return None
+
+
+def _ancestors(path: Path) -> list[Path]:
+    """Return ``path`` and its parent cgroups up to the hierarchy root."""
+    dirs = []
+    for directory in (path, *path.parents):
+        if not (directory / "cgroup.controllers").exists():
+            break
+        dirs.append(directory)
+    return dirs
+
+
+def _memory_limit(dirs: list[Path]) -> int | None:
+    """Return the tightest memory.max along the hierarchy, None if unlimited."""
+    limits = []
+    for directory in dirs:
+        value = _read_text(directory / "memory.max")
+        if value and value != "max" and value.isdigit():
+            limits.append(int(value))
+    return min(limits) if limits else None
+
+
+def _cpu_quota(dirs: list[Path]) -> float | None:
+    """Return the tightest cpu.max quota in cores, None if unlimited."""
+    quotas = []
+    for directory in dirs:
+        value = _read_text(directory / "cpu.max")
+        if not value:
+            continue
+        parts = value.split()
+        if len(parts) == 2 and parts[0] != "max":
+            try:
+                quotas.append(int(parts[0]) / int(parts[1]))
+            except (ValueError, ZeroDivisionError):
+                continue
+    return round(min(quotas), 2) if quotas else None
+
+
+def _parse_cpuset(text: str) -> int:
+    """Count CPUs in a cpuset list such as ``0-3,8,10-11``."""
+    count = 0
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        count += int(end) - int(start) + 1 if end else 1
+    return count
+
+
+def _effective_cpus(path: Path) -> int | None:
+    """Return the number of CPUs this cgroup may run on."""
+    value = _read_text(path / "cpuset.cpus.effective")
+    if value:
+        try:
+            return _parse_cpuset(value)
+        except ValueError:
+            pass
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count()
+
+
+def _parse_cpu_stat(text: str) -> dict[str, int]:
+    """Parse cpu.stat key/value lines."""
+    out: dict[str, int] = {}
+    for line in text.splitlines():
+        key, _, value = line.partition(" ")
+        if value.strip().isdigit():
+            out[key] = int(value)
+    return out
+
+
+def _sample_cpu_stat() -> dict[str, int]:
+    """Read cpu.stat for the current cgroup, or an empty mapping."""
+    path = cgroup_v2_dir()
+    text = None if path is None else _read_text(path / "cpu.stat")
+    return _parse_cpu_stat(text) if text else {}
+
+
+_BASELINE: CounterBaseline[dict[str, int]] = CounterBaseline(_sample_cpu_stat, settle_s=0.1)
+
+
+def _delta(before: dict[str, int], now: dict[str, int], key: str) -> int | None:
+    """Return a non-negative counter delta, or None when the key is missing."""
+    if key not in before or key not in now:
+        return None
+    return max(now[key] - before[key], 0)
+
+
+def _percent(part: float | None, whole: float | None) -> float | None:
+    """Return ``part`` as a percentage of ``whole`` when both are known."""
+    if part is None or not whole:
+        return None
+    return round(part / whole * 100.0, 1)
+
+
+def collect_cgroup() -> CgroupData:
+    """Collect memory/CPU limits, usage, and throttling for the current cgroup v2."""
+    path = cgroup_v2_dir()
+    if path is None:
+        return default_cgroup()
+    dirs = _ancestors(path) or [path]
+    memory_max = _memory_limit(dirs)
+    current_text = _read_text(path / "memory.current")
+    memory_current = int(current_text) if current_text and current_text.isdigit() else None
+    quota = _cpu_quota(dirs)
+    cpus = _effective_cpus(path)
+    limits = [value for value in (quota, cpus) if value]
+    limit_cores = min(limits) if limits else None
+
+    before, now, elapsed = _BASELINE.pair()
+    usage_usec = _delta(before, now, "usage_usec")
+    return CgroupData(
+        path=str(path),
+        memory_max_bytes=memory_max,
+        memory_current_bytes=memory_current,
+        memory_usage_percent=_percent(memory_current, memory_max),
+        cpu_quota_cores=quota,
+        effective_cpus=cpus,
+        cpu_usage_percent=_percent(
+            None if usage_usec is None else usage_usec / 1_000_000,
+            None if limit_cores is None else limit_cores * elapsed,
+        ),
+        throttled_usec=_delta(before, now, "throttled_usec"),
+        throttled_periods_percent=_percent(_delta(before, now, "nr_throttled"), _delta(before, now, "nr_periods")),
+    )
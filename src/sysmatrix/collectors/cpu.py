@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import time
 from pathlib import Path
 
 from sysmatrix.models import CpuData
+from sysmatrix.utils.sampling import CounterBaseline
 
 
 def _read_cpu_model() -> str:
@@ -16,23 +16,28 @@ def _read_cpu_model() -> str:
     return "Unknown CPU"
 
 
-def _read_cpu_usage() -> float:
-    """Sample /proc/stat twice to estimate total CPU usage percentage."""
-    def sample() -> tuple[int, int]:
-        fields = Path("/proc/stat").read_text(encoding="utf-8", errors="ignore").splitlines()[0].split()
-        values = [int(x) for x in fields[1:8]]
-        idle = values[3]
-        total = sum(values)
-        return idle, total
-
-    idle1, total1 = sample()
-    time.sleep(0.12)
-    idle2, total2 = sample()
-    idle_delta = idle2 - idle1
-    total_delta = total2 - total1
+def _sample_cpu_times() -> tuple[int, ...]:
+    """Read aggregate user..steal jiffies from the first /proc/stat line."""
+    fields = Path("/proc/stat").read_text(encoding="utf-8", errors="ignore").splitlines()[0].split()
+    return tuple(int(x) for x in fields[1:9])
+
+
+_BASELINE: CounterBaseline[tuple[int, ...]] = CounterBaseline(_sample_cpu_times, settle_s=0.12)
+
+
+def _read_cpu_usage() -> tuple[float, float | None, float | None]:
+    """Return usage, iowait, and steal percentages from /proc/stat deltas."""
+    before, after, _elapsed = _BASELINE.pair()
+    deltas = [now - prev for now, prev in zip(after, before)]
+    # Usage keeps its historical definition over user..softirq; steal is reported separately.
+    total_delta = sum(deltas[:7])
     if total_delta <= 0:
-        return 0.0
-    return round(100.0 * (1.0 - (idle_delta / total_delta)), 1)
+        return 0.0, None, None
+    usage = round(100.0 * (1.0 - (deltas[3] / total_delta)), 1)
+    all_delta = sum(deltas)
+    iowait = round(100.0 * deltas[4] / all_delta, 1)
+    steal = round(100.0 * deltas[7] / all_delta, 1) if len(deltas) > 7 else None
+    return usage, iowait, steal
 
 
 def collect_cpu() -> CpuData:
@@ -41,8 +46,11 @@ def collect_cpu() -> CpuData:
     for line in Path("/proc/cpuinfo").read_text(encoding="utf-8", errors="ignore").splitlines():
         if line.startswith("processor"):
             cores += 1
+    usage, iowait, steal = _read_cpu_usage()
     return CpuData(
         model=_read_cpu_model(),
         cores=cores,
-        usage_percent=_read_cpu_usage(),
+        usage_percent=usage,
+        iowait_percent=iowait,
+        steal_percent=steal,
     )
@@ -6,7 +6,13 @@ import csv
 from pathlib import Path
 
 from sysmatrix.models import GpuData
-from sysmatrix.utils.commands import command_exists, run_command
+from sysmatrix.utils.commands import command_exists, run_command, run_command_async
+
+NVIDIA_QUERY = [
+    "nvidia-smi",
+    "--query-gpu=name,utilization.gpu,temperature.gpu,memory.used,memory.total,power.draw,fan.speed",
+    "--format=csv,noheader,nounits",
+]
 
 
 def _to_float(value: str) -> float | None:
@@ -27,7 +33,11 @@ def _to_int(value: str) -> int | None:
 
 def _vendor_from_lspci() -> tuple[str, str]:
     """Detect primary GPU vendor/model from lspci output."""
-    output = run_command(["lspci"])
+    return _vendor_from_output(run_command(["lspci"]))
+
+
+def _vendor_from_output(output: str) -> tuple[str, str]:
+    """Pick the first display controller from lspci text."""
     for line in output.splitlines():
         line_lower = line.lower()
         if not any(token in line_lower for token in ("vga", "3d", "display")):
@@ -44,7 +54,11 @@ def _vendor_from_lspci() -> tuple[str, str]:
 
 def _amd_temp_from_sensors() -> float | None:
     """Read AMD edge/junction temperature from sensors output."""
-    sensors = run_command(["sensors"])
+    return _amd_temp_from_output(run_command(["sensors"]))
+
+
+def _amd_temp_from_output(sensors: str) -> float | None:
+    """Extract AMD edge/junction temperature from sensors text."""
     for line in sensors.splitlines():
         stripped = line.strip().lower()
         if stripped.startswith("edge:") or stripped.startswith("junction:"):
@@ -158,22 +172,14 @@ def _pick_nvidia_row(rows: list[list[str]], detected_model: str) -> list[str] |
     return max(valid_rows, key=score)
 
 
-def collect_gpu() -> GpuData:
-    """Collect GPU model and telemetry with vendor-specific paths."""
-    vendor, model = _vendor_from_lspci()
+def _gpu_data(vendor: str, model: str, smi_output: str, sensors_output: str) -> GpuData:
+    """Assemble GPU telemetry from vendor probes and sysfs."""
     util = temp = power = None
     vram_used = vram_total = fan = None
 
-    if vendor == "nvidia" and command_exists("nvidia-smi"):
-        query = run_command(
-            [
-                "nvidia-smi",
-                "--query-gpu=name,utilization.gpu,temperature.gpu,memory.used,memory.total,power.draw,fan.speed",
-                "--format=csv,noheader,nounits",
-            ]
-        )
-        if query:
-            selected = _pick_nvidia_row(_parse_nvidia_smi_rows(query), model)
+    if vendor == "nvidia":
+        if smi_output:
+            selected = _pick_nvidia_row(_parse_nvidia_smi_rows(smi_output), model)
             if selected is not None:
                 model = selected[0] or model
                 util = _to_float(selected[1])
@@ -183,7 +189,7 @@ def collect_gpu() -> GpuData:
                 power = _to_float(selected[5])
                 fan = _to_int(selected[6])
     elif vendor == "amd":
-        temp = _amd_temp_from_sensors()
+        temp = _amd_temp_from_output(sensors_output)
         card_path = _detect_card_path("0x1002")
         if card_path is not None:
             util, vram_used, vram_total, power, fan = _read_amd_stats(card_path)
@@ -202,3 +208,19 @@ def collect_gpu() -> GpuData:
         power_watts=power,
         fan_rpm=None if fan == 0 else fan,
     )
+
+
+def collect_gpu() -> GpuData:
+    """Collect GPU model and telemetry with vendor-specific paths."""
+    vendor, model = _vendor_from_lspci()
+    smi = run_command(NVIDIA_QUERY) if vendor == "nvidia" and command_exists("nvidia-smi") else ""
+    sensors = run_command(["sensors"]) if vendor == "amd" else ""
+    return _gpu_data(vendor, model, smi, sensors)
+
+
+async def collect_gpu_async() -> GpuData:
+    """Async variant of ``collect_gpu``."""
+    vendor, model = _vendor_from_output(await run_command_async(["lspci"]))
+    smi = await run_command_async(NVIDIA_QUERY) if vendor == "nvidia" and command_exists("nvidia-smi") else ""
+    sensors = await run_command_async(["sensors"]) if vendor == "amd" else ""
+    return _gpu_data(vendor, model, smi, sensors)
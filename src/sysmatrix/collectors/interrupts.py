@@ -0,0 +1,203 @@
+"""Per-CPU hardware interrupt and softirq distribution from procfs."""
+
+from __future__ import annotations
+
+import operator
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+from sysmatrix.models import CpuInterrupts, InterruptData, InterruptSource
+from sysmatrix.utils.sampling import CounterBaseline
+
+INTERRUPTS_PATH = "/proc/interrupts"
+SOFTIRQS_PATH = "/proc/softirqs"
+
+# A CPU is hot when it handles this many times the per-CPU mean (and at least HOT_MIN_PER_S).
+HOT_FACTOR = 2.0
+HOT_MIN_PER_S = 1000.0
+# A source is imbalanced when one CPU takes this share of it (and it fires at least IMBALANCE_MIN_PER_S).
+IMBALANCE_SHARE = 80.0
+IMBALANCE_MIN_PER_S = 100.0
+TOP_N = 5
+# Global error counters printed as a single column.
+_GLOBAL_ROWS = frozenset({b"ERR", b"MIS"})
+# Per-CPU counters are unsigned int in the kernel and wrap at 2**32.
+_COUNTER_MOD = 1 << 32
+
+
+@dataclass(slots=True)
+class CounterTable:
+    """A /proc/interrupts-style table: one row per source, one column per CPU.
+
+    ``values`` is row-major, ``len(labels) * len(cpus)`` unsigned counters in
+    a single ``array``, so a 256-CPU table is one flat buffer rather than
+    tens of thousands of list cells.
+    """
+
+    cpus: list[int]
+    labels: list[bytes]
+    descriptions: list[str]
+    values: array
+
+
+def parse_table(data: bytes) -> CounterTable:
+    """Parse /proc/interrupts or /proc/softirqs.
+
+    Each row is split at most ``ncpu + 1`` times, so the trailing device
+    description is never tokenized, and counters are converted in one
+    ``array.extend`` call per row.
+    """
+    lines = data.splitlines()
+    if not lines:
+        return CounterTable([], [], [], array("Q"))
+    cpus = [int(token[3:]) for token in lines[0].split() if token.startswith(b"CPU")]
+    width = len(cpus)
+    labels: list[bytes] = []
+    descriptions: list[str] = []
+    values = array("Q")
+    for line in lines[1:]:
+        fields = line.split(None, width + 1)
+        if len(fields) <= width or not fields[width].isdigit():
+            continue
+        label = fields[0].rstrip(b":")
+        if label in _GLOBAL_ROWS:
+            continue
+        values.extend(map(int, fields[1 : width + 1]))
+        labels.append(label)
+        description = fields[width + 1].decode("utf-8", "replace") if len(fields) > width + 1 else ""
+        descriptions.append(" ".join(description.split()))
+    return CounterTable(cpus, labels, descriptions, values)
+
+
+def table_deltas(before: CounterTable, now: CounterTable) -> list[int]:
+    """Return row-major counter deltas laid out like ``now``.
+
+    The common case (same rows and CPUs) subtracts the two arrays in C and
+    only revisits counters that wrapped; rows that appeared since ``before``
+    (hotplugged devices) count from zero.
+    """
+    if before.labels == now.labels and before.cpus == now.cpus:
+        deltas = list(map(operator.sub, now.values, before.values))
+        if deltas and min(deltas) < 0:
+            deltas = [delta % _COUNTER_MOD for delta in deltas]
+        return deltas
+    width = len(now.cpus)
+    columns = {cpu: index for index, cpu in enumerate(before.cpus)}
+    rows = {label: index for index, label in enumerate(before.labels)}
+    old_width = len(before.cpus)
+    deltas = [0] * len(now.values)
+    for row, label in enumerate(now.labels):
+        old_row = rows.get(label)
+        if old_row is None:
+            continue
+        for col, cpu in enumerate(now.cpus):
+            old_col = columns.get(cpu)
+            if old_col is not None:
+                old = before.values[old_row * old_width + old_col]
+                deltas[row * width + col] = (now.values[row * width + col] - old) % _COUNTER_MOD
+    return deltas
+
+
+def _read(path: str) -> bytes:
+    return Path(path).read_bytes()
+
+
+def _sample() -> tuple[CounterTable, CounterTable]:
+    """Read both tables; a missing softirqs file yields an empty table."""
+    irqs = parse_table(_read(INTERRUPTS_PATH))
+    try:
+        softirqs = parse_table(_read(SOFTIRQS_PATH))
+    except OSError:
+        softirqs = CounterTable([], [], [], array("Q"))
+    return irqs, softirqs
+
+
+_BASELINE: CounterBaseline[tuple[CounterTable, CounterTable]] = CounterBaseline(_sample, settle_s=0.1)
+
+
+def _sources(
+    kind: str,
+    table: CounterTable,
+    deltas: list[int],
+    elapsed: float,
+) -> tuple[list[InterruptSource], list[int]]:
+    """Return per-row rates with their busiest CPU, and per-CPU event totals."""
+    width = len(table.cpus)
+    # Strided slices sum each CPU's column without a Python-level inner loop.
+    per_cpu = [sum(deltas[col::width]) for col in range(width)]
+    sources = []
+    for row, label in enumerate(table.labels):
+        counts = deltas[row * width : (row + 1) * width]
+        total = sum(counts)
+        if not total:
+            continue
+        top = max(counts)
+        sources.append(
+            InterruptSource(
+                kind=kind,
+                name=label.decode("ascii", "replace"),
+                description=table.descriptions[row],
+                per_s=round(total / elapsed, 1),
+                top_cpu=table.cpus[counts.index(top)],
+                top_cpu_percent=round(top / total * 100.0, 1),
+            )
+        )
+    return sources, per_cpu
+
+
+def analyze(
+    irqs: tuple[CounterTable, list[int]],
+    softirqs: tuple[CounterTable, list[int]],
+    elapsed: float,
+) -> InterruptData:
+    """Compute per-CPU load, hot CPUs and imbalanced sources from table deltas."""
+    irq_table, irq_deltas = irqs
+    soft_table, soft_deltas = softirqs
+    irq_sources, irq_per_cpu = _sources("irq", irq_table, irq_deltas, elapsed)
+    soft_sources, soft_per_cpu = _sources("softirq", soft_table, soft_deltas, elapsed)
+    soft_by_cpu = dict(zip(soft_table.cpus, soft_per_cpu))
+
+    cpus = []
+    for cpu, irq_count in zip(irq_table.cpus, irq_per_cpu):
+        soft_count = soft_by_cpu.get(cpu, 0)
+        cpus.append((cpu, irq_count / elapsed, soft_count / elapsed))
+    grand = sum(irq + soft for _cpu, irq, soft in cpus)
+    mean = grand / len(cpus) if cpus else 0.0
+    hot = [
+        CpuInterrupts(
+            cpu=cpu,
+            irq_per_s=round(irq, 1),
+            softirq_per_s=round(soft, 1),
+            share_percent=round((irq + soft) / grand * 100.0, 1),
+        )
+        for cpu, irq, soft in sorted(cpus, key=lambda item: item[1] + item[2], reverse=True)
+        if len(cpus) > 1 and irq + soft >= max(HOT_MIN_PER_S, HOT_FACTOR * mean)
+    ]
+
+    sources = sorted(irq_sources + soft_sources, key=lambda item: item.per_s, reverse=True)
+    imbalanced = [
+        source
+        for source in sources
+        if len(cpus) > 1 and source.per_s >= IMBALANCE_MIN_PER_S and source.top_cpu_percent >= IMBALANCE_SHARE
+    ]
+    return InterruptData(
+        available=bool(irq_table.cpus),
+        window_s=round(elapsed, 3),
+        cpu_count=len(irq_table.cpus),
+        irq_per_s=round(sum(irq_per_cpu) / elapsed, 1),
+        softirq_per_s=round(sum(soft_per_cpu) / elapsed, 1),
+        hot_cpus=hot[:TOP_N],
+        imbalanced=imbalanced[:TOP_N],
+        top_sources=sources[:TOP_N],
+    )
+
+
+def collect_interrupts() -> InterruptData:
+    """Collect interrupt and softirq distribution across CPUs over the sample window."""
+    (irq_before, soft_before), (irq_now, soft_now), elapsed = _BASELINE.pair()
+    return analyze(
+        (irq_now, table_deltas(irq_before, irq_now)),
+        (soft_now, table_deltas(soft_before, soft_now)),
+        elapsed,
+    )
@@ -2,30 +2,117 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
 
-from sysmatrix.models import MemoryData
+from sysmatrix.models import MemoryBreakdown, MemoryData, VmstatRates
+from sysmatrix.utils.sampling import CounterBaseline
 
+# /proc/vmstat counters turned into rates: output field -> counter name prefixes summed.
+_VMSTAT_RATES = {
+    "pgfault_per_s": (b"pgfault",),
+    "pgmajfault_per_s": (b"pgmajfault",),
+    "pswpin_per_s": (b"pswpin",),
+    "pswpout_per_s": (b"pswpout",),
+    "direct_reclaim_pages_per_s": (b"pgscan_direct",),
+    "allocstall_per_s": (b"allocstall",),
+    "compact_stall_per_s": (b"compact_stall",),
+}
 
-def _parse_meminfo() -> dict[str, int]:
-    """Parse /proc/meminfo into a key->value(kB) mapping."""
+
+def _read(path: str) -> bytes:
+    """Read a procfs file in one syscall loop, without text decoding."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _parse_meminfo_bytes(data: bytes) -> dict[str, int]:
+    """Parse meminfo lines (``Key:   value [kB]``) into a key->value mapping."""
     out: dict[str, int] = {}
-    for line in Path("/proc/meminfo").read_text(encoding="utf-8", errors="ignore").splitlines():
-        if ":" not in line:
-            continue
-        key, rest = line.split(":", 1)
-        value_kb = rest.strip().split()[0]
-        out[key] = int(value_kb)
+    for line in data.splitlines():
+        fields = line.split()
+        if len(fields) >= 2 and fields[0].endswith(b":"):
+            out[fields[0][:-1].decode("ascii", "replace")] = int(fields[1])
     return out
 
 
+def _parse_meminfo() -> dict[str, int]:
+    """Parse /proc/meminfo into a key->value(kB) mapping."""
+    return _parse_meminfo_bytes(_read("/proc/meminfo"))
+
+
+def _parse_vmstat(data: bytes) -> dict[bytes, int]:
+    """Parse /proc/vmstat, whose layout is strictly ``name value`` per line."""
+    tokens = data.split()
+    return dict(zip(tokens[::2], map(int, tokens[1::2])))
+
+
+def _sample_vmstat() -> dict[bytes, int]:
+    """Read the vmstat counters behind ``_VMSTAT_RATES``."""
+    counters = _parse_vmstat(_read("/proc/vmstat"))
+    prefixes = tuple(prefix for group in _VMSTAT_RATES.values() for prefix in group)
+    # pgscan_direct_throttle counts throttling events, not scanned pages.
+    return {
+        name: value
+        for name, value in counters.items()
+        if name.startswith(prefixes) and not name.endswith(b"_throttle")
+    }
+
+
+_BASELINE: CounterBaseline[dict[bytes, int]] = CounterBaseline(_sample_vmstat, settle_s=0.1)
+
+
+def _vmstat_rates(before: dict[bytes, int], now: dict[bytes, int], elapsed: float) -> VmstatRates:
+    """Turn two vmstat samples into per-second rates; absent counters stay None."""
+
+    def rate(prefixes: tuple[bytes, ...]) -> float | None:
+        names = [name for name in now if name.startswith(prefixes) and name in before]
+        if not names:
+            return None
+        return round(sum(max(now[name] - before[name], 0) for name in names) / elapsed, 1)
+
+    return VmstatRates(window_s=round(elapsed, 3), **{field: rate(group) for field, group in _VMSTAT_RATES.items()})
+
+
 def _kb_to_gb(value: int) -> float:
     """Convert a kB value to GiB with one decimal place."""
     return round(value / 1024 / 1024, 1)
 
 
+def _kb_to_mb(value: int | None) -> float | None:
+    """Convert a kB value to MiB with one decimal place, keeping None."""
+    return None if value is None else round(value / 1024, 1)
+
+
+def _breakdown(mem: dict[str, int]) -> MemoryBreakdown:
+    """Build the detailed meminfo breakdown; fields missing on this kernel stay None."""
+    return MemoryBreakdown(
+        free_mb=_kb_to_mb(mem.get("MemFree")),
+        available_mb=_kb_to_mb(mem.get("MemAvailable")),
+        cached_mb=_kb_to_mb(mem.get("Cached")),
+        buffers_mb=_kb_to_mb(mem.get("Buffers")),
+        dirty_mb=_kb_to_mb(mem.get("Dirty")),
+        writeback_mb=_kb_to_mb(mem.get("Writeback")),
+        anon_mb=_kb_to_mb(mem.get("AnonPages")),
+        shmem_mb=_kb_to_mb(mem.get("Shmem")),
+        slab_mb=_kb_to_mb(mem.get("Slab")),
+        slab_reclaimable_mb=_kb_to_mb(mem.get("SReclaimable")),
+        anon_huge_mb=_kb_to_mb(mem.get("AnonHugePages")),
+        hugepages_total=mem.get("HugePages_Total"),
+        hugepages_free=mem.get("HugePages_Free"),
+        hugepage_size_kb=mem.get("Hugepagesize"),
+        zswap_mb=_kb_to_mb(mem.get("Zswap")),
+        zswapped_mb=_kb_to_mb(mem.get("Zswapped")),
+    )
+
+
 def collect_memory() -> MemoryData:
-    """Collect RAM and swap usage derived from /proc/meminfo."""
+    """Collect RAM and swap usage, the meminfo breakdown and vmstat rates."""
     mem = _parse_meminfo()
     total = mem.get("MemTotal", 0)
     available = mem.get("MemAvailable", 0)
@@ -34,10 +121,13 @@ def collect_memory() -> MemoryData:
     swap_free = mem.get("SwapFree", 0)
     swap_used = max(swap_total - swap_free, 0)
     usage = (used / total * 100.0) if total else 0.0
+    before, now, elapsed = _BASELINE.pair()
     return MemoryData(
         total_gb=_kb_to_gb(total),
         used_gb=_kb_to_gb(used),
         usage_percent=round(usage, 1),
         swap_total_gb=_kb_to_gb(swap_total),
         swap_used_gb=_kb_to_gb(swap_used),
+        breakdown=_breakdown(mem),
+        vmstat=_vmstat_rates(before, now, elapsed),
     )
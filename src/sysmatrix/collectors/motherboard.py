@@ -2,25 +2,50 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from sysmatrix.models import MotherboardData
-from sysmatrix.utils.commands import run_command
+from sysmatrix.utils.commands import run_command, run_command_async
 
+_BOARD_VENDOR = Path("/sys/class/dmi/id/board_vendor")
+_BOARD_NAME = Path("/sys/class/dmi/id/board_name")
 
-def _read_dmi_value(path: Path, fallback_cmd: list[str]) -> str:
-    """Read a DMI value from sysfs, with a command fallback."""
+
+def _read_dmi_sysfs(path: Path) -> str | None:
+    """Read a DMI value from sysfs, returning None when empty or missing."""
     if path.exists():
         value = path.read_text(encoding="utf-8", errors="ignore").strip()
         if value:
             return value
+    return None
+
+
+def _read_dmi_value(path: Path, fallback_cmd: list[str]) -> str:
+    """Read a DMI value from sysfs, with a command fallback."""
+    value = _read_dmi_sysfs(path)
+    if value:
+        return value
     output = run_command(fallback_cmd)
     return output if output else "Unknown"
 
 
+async def _read_dmi_value_async(path: Path, fallback_cmd: list[str]) -> str:
+    """Async variant of ``_read_dmi_value``."""
+    value = _read_dmi_sysfs(path)
+    if value:
+        return value
+    output = await run_command_async(fallback_cmd)
+    return output if output else "Unknown"
+
+
 def _parse_vrm_temp() -> float | None:
     """Best-effort parse of VRM/MOS temperature from sensors output."""
-    sensors = run_command(["sensors"])
+    return _vrm_temp_from_output(run_command(["sensors"]))
+
+
+def _vrm_temp_from_output(sensors: str) -> float | None:
+    """Extract the first plausible VRM/MOS temperature from sensors text."""
     for line in sensors.splitlines():
         if not any(token in line.lower() for token in ("vrm", "mos")):
             continue
@@ -37,12 +62,26 @@ def _parse_vrm_temp() -> float | None:
 
 def collect_motherboard() -> MotherboardData:
     """Collect motherboard identity and optional VRM temperature."""
-    vendor = _read_dmi_value(
-        Path("/sys/class/dmi/id/board_vendor"),
-        ["dmidecode", "-s", "baseboard-manufacturer"],
-    )
-    model = _read_dmi_value(
-        Path("/sys/class/dmi/id/board_name"),
-        ["dmidecode", "-s", "baseboard-product-name"],
-    )
+    vendor = _read_dmi_value(_BOARD_VENDOR, ["dmidecode", "-s", "baseboard-manufacturer"])
+    model = _read_dmi_value(_BOARD_NAME, ["dmidecode", "-s", "baseboard-product-name"])
     return MotherboardData(vendor=vendor, model=model, vrm_temp_c=_parse_vrm_temp())
+
+
+async def collect_board_async() -> MotherboardData:
+    """Collect the board identity only; DMI values do not change while the host runs."""
+    vendor, model = await asyncio.gather(
+        _read_dmi_value_async(_BOARD_VENDOR, ["dmidecode", "-s", "baseboard-manufacturer"]),
+        _read_dmi_value_async(_BOARD_NAME, ["dmidecode", "-s", "baseboard-product-name"]),
+    )
+    return MotherboardData(vendor=vendor, model=model, vrm_temp_c=None)
+
+
+async def read_vrm_temp_async() -> float | None:
+    """Read the current VRM/MOS temperature from ``sensors``."""
+    return _vrm_temp_from_output(await run_command_async(["sensors"]))
+
+
+async def collect_motherboard_async() -> MotherboardData:
+    """Async variant of ``collect_motherboard``."""
+    board, vrm_temp_c = await asyncio.gather(collect_board_async(), read_vrm_temp_async())
+    return MotherboardData(vendor=board.vendor, model=board.model, vrm_temp_c=vrm_temp_c)
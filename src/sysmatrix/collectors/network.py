@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
-import time
+import logging
+import os
+import socket
 from pathlib import Path
 
-from sysmatrix.models import NetworkData
-from sysmatrix.utils.commands import run_command
+from sysmatrix.models import InterfaceStats, NetworkData
+from sysmatrix.utils.commands import run_command, run_command_async
+from sysmatrix.utils.netlink import RT_SCOPE_UNIVERSE, RoutingState, read_routing_state
+from sysmatrix.utils.sampling import CounterBaseline
+
+LOGGER = logging.getLogger(__name__)
+
+_WIFI_PCI_TOKENS = ("network", "wireless", "wifi")
+_WIFI_USB_TOKENS = ("wireless", "wifi", "wlan")
+
+# Column offsets in /proc/net/dev for the counters kept per interface.
+_NET_DEV_COLUMNS = (0, 1, 2, 3, 8, 9, 10, 11)
+_RX_BYTES, _RX_PACKETS, _RX_ERRORS, _RX_DROPPED = 0, 1, 2, 3
+_TX_BYTES, _TX_PACKETS, _TX_ERRORS, _TX_DROPPED = 4, 5, 6, 7
 
 
 def _preferred_ip(text: str) -> str | None:
@@ -32,27 +47,127 @@ def _preferred_ip(text: str) -> str | None:
     return None
 
 
-def _active_interface() -> str:
-    """Return the first active non-loopback interface, if any."""
-    net_dir = Path("/sys/class/net")
-    if not net_dir.exists():
-        return "N/A"
-    for iface in sorted(net_dir.iterdir()):
-        if iface.name == "lo":
+def _parse_net_dev(text: str) -> dict[str, tuple[int, ...]]:
+    """Parse /proc/net/dev into interface -> RX/TX bytes, packets, errors, drops."""
+    counters: dict[str, tuple[int, ...]] = {}
+    for line in text.splitlines()[2:]:
+        name, sep, rest = line.partition(":")
+        if not sep:
             continue
-        state = iface / "operstate"
-        if state.exists() and state.read_text(encoding="utf-8", errors="ignore").strip() == "up":
-            return iface.name
-    return "N/A"
+        fields = rest.split()
+        if len(fields) < 16:
+            continue
+        try:
+            counters[name.strip()] = tuple(int(fields[idx]) for idx in _NET_DEV_COLUMNS)
+        except ValueError:
+            continue
+    return counters
+
+
+def _read_net_dev() -> dict[str, tuple[int, ...]]:
+    """Read all interface counters with a single /proc/net/dev read."""
+    try:
+        text = Path("/proc/net/dev").read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return {}
+    return _parse_net_dev(text)
+
+
+def _virtual_interfaces() -> set[str]:
+    """Return names of virtual interfaces (bridges, veth, tun, lo, ...)."""
+    try:
+        return set(os.listdir("/sys/devices/virtual/net"))
+    except OSError:
+        return set()
+
+
+def _default_route_interface() -> str | None:
+    """Return the interface carrying the lowest-metric IPv4 default route."""
+    try:
+        lines = Path("/proc/net/route").read_text(encoding="utf-8", errors="ignore").splitlines()
+    except OSError:
+        return None
+    best: tuple[int, str] | None = None
+    for line in lines[1:]:
+        fields = line.split()
+        if len(fields) < 8 or fields[1] != "00000000" or fields[7] != "00000000":
+            continue
+        try:
+            metric = int(fields[6])
+        except ValueError:
+            continue
+        if best is None or metric < best[0]:
+            best = (metric, fields[0])
+    return best[1] if best else None
+
+
+def _link_speed(interface: str) -> int | None:
+    """Read negotiated link speed in Mb/s, or None when unknown."""
+    try:
+        speed = int(Path(f"/sys/class/net/{interface}/speed").read_text(encoding="utf-8", errors="ignore").strip())
+    except (OSError, ValueError):
+        return None
+    return speed if speed > 0 else None
+
+
+def _active_interface(stats: list[InterfaceStats], routing: RoutingState | None = None) -> str:
+    """Pick the default-route interface, else the busiest physical interface."""
+    if routing is not None and routing.default_routes:
+        # Prefer IPv4, then the lowest route metric.
+        route = min(routing.default_routes, key=lambda item: (item.family != socket.AF_INET, item.priority))
+        default = route.name
+    else:
+        default = _default_route_interface()
+    if default and any(item.name == default for item in stats):
+        return default
+    physical = [item for item in stats if item.name != "lo" and not item.virtual]
+    if not physical:
+        return "N/A"
+    return max(physical, key=lambda item: item.rx_bytes + item.tx_bytes).name
+
+
+def _routing_state() -> RoutingState | None:
+    """Query addresses and default routes over rtnetlink, if available."""
+    try:
+        return read_routing_state()
+    except (OSError, ValueError):
+        LOGGER.debug("rtnetlink query failed; using command fallbacks", exc_info=True)
+        return None
+
+
+def _netlink_ip(routing: RoutingState) -> str | None:
+    """Return the source address of the preferred default route."""
+    for route in sorted(routing.default_routes, key=lambda item: (item.family != socket.AF_INET, item.priority)):
+        if route.prefsrc:
+            return route.prefsrc
+        for item in routing.addresses_for(route.index):
+            if item.family == route.family and item.scope == RT_SCOPE_UNIVERSE:
+                return item.address
+    # No default route: any globally scoped address, IPv4 first.
+    universe = [item for item in routing.addresses if item.scope == RT_SCOPE_UNIVERSE]
+    universe.sort(key=lambda item: item.family != socket.AF_INET)
+    return universe[0].address if universe else None
+
+
+def _ip_address(routing: RoutingState | None = None) -> str:
+    """Resolve primary host IP from netlink, with hostname/ip route fallbacks."""
+    if routing is not None:
+        return _netlink_ip(routing) or "N/A"
+    return _command_ip_address()
 
 
-def _ip_address() -> str:
-    """Resolve primary host IP using hostname/ip route fallbacks."""
-    output = run_command(["hostname", "-I"])
-    preferred = _preferred_ip(output)
+async def _ip_address_async(routing: RoutingState | None = None) -> str:
+    """Async variant of ``_ip_address``."""
+    if routing is not None:
+        return _netlink_ip(routing) or "N/A"
+    preferred = _preferred_ip(await run_command_async(["hostname", "-I"]))
     if preferred:
         return preferred
-    output = run_command(["ip", "route", "get", "1"])
+    return _route_src_ip(await run_command_async(["ip", "route", "get", "1"]))
+
+
+def _route_src_ip(output: str) -> str:
+    """Extract the ``src`` address from ``ip route get`` output."""
     parts = output.split()
     if "src" in parts:
         idx = parts.index("src")
@@ -63,77 +178,179 @@ def _ip_address() -> str:
     return "N/A"
 
 
-def _throughput(interface: str) -> str:
-    """Estimate RX/TX throughput from sysfs byte counters."""
-    if interface == "N/A":
-        return "N/A"
-    rx_file = Path(f"/sys/class/net/{interface}/statistics/rx_bytes")
-    tx_file = Path(f"/sys/class/net/{interface}/statistics/tx_bytes")
-    if not rx_file.exists() or not tx_file.exists():
-        return "N/A"
-    try:
-        rx1 = int(rx_file.read_text(encoding="utf-8", errors="ignore").strip())
-        tx1 = int(tx_file.read_text(encoding="utf-8", errors="ignore").strip())
-    except (OSError, ValueError):
-        return "N/A"
-    started = time.perf_counter()
-    time.sleep(0.25)
-    try:
-        rx2 = int(rx_file.read_text(encoding="utf-8", errors="ignore").strip())
-        tx2 = int(tx_file.read_text(encoding="utf-8", errors="ignore").strip())
-    except (OSError, ValueError):
+def _command_ip_address() -> str:
+    """Resolve primary host IP using hostname/ip route commands."""
+    preferred = _preferred_ip(run_command(["hostname", "-I"]))
+    if preferred:
+        return preferred
+    return _route_src_ip(run_command(["ip", "route", "get", "1"]))
+
+
+def _interface_stats(
+    first: dict[str, tuple[int, ...]],
+    second: dict[str, tuple[int, ...]],
+    elapsed: float,
+    virtual: set[str],
+) -> list[InterfaceStats]:
+    """Derive per-interface rates from two /proc/net/dev samples."""
+    stats: list[InterfaceStats] = []
+    for name in sorted(second):
+        now = second[name]
+        before = first.get(name, now)
+        rx_rate = max(now[_RX_BYTES] - before[_RX_BYTES], 0) / elapsed
+        tx_rate = max(now[_TX_BYTES] - before[_TX_BYTES], 0) / elapsed
+        is_virtual = name in virtual
+        # Virtual links report no meaningful speed; skip their sysfs reads entirely.
+        speed = None if is_virtual else _link_speed(name)
+        utilization = None
+        if speed:
+            utilization = round(max(rx_rate, tx_rate) * 8 / (speed * 1_000_000) * 100.0, 1)
+        stats.append(
+            InterfaceStats(
+                name=name,
+                virtual=is_virtual,
+                rx_bytes=now[_RX_BYTES],
+                tx_bytes=now[_TX_BYTES],
+                rx_bytes_per_s=round(rx_rate, 1),
+                tx_bytes_per_s=round(tx_rate, 1),
+                rx_packets_per_s=round(max(now[_RX_PACKETS] - before[_RX_PACKETS], 0) / elapsed, 1),
+                tx_packets_per_s=round(max(now[_TX_PACKETS] - before[_TX_PACKETS], 0) / elapsed, 1),
+                rx_errors=now[_RX_ERRORS],
+                tx_errors=now[_TX_ERRORS],
+                rx_dropped=now[_RX_DROPPED],
+                tx_dropped=now[_TX_DROPPED],
+                speed_mbps=speed,
+                utilization_percent=utilization,
+            )
+        )
+    return stats
+
+
+_BASELINE: CounterBaseline[dict[str, tuple[int, ...]]] = CounterBaseline(_read_net_dev, settle_s=0.25)
+
+
+def _throughput(stats: InterfaceStats | None) -> str:
+    """Format RX/TX throughput for the primary interface."""
+    if stats is None:
         return "N/A"
-    elapsed = max(time.perf_counter() - started, 1e-6)
-    rx_delta = max(rx2 - rx1, 0)
-    tx_delta = max(tx2 - tx1, 0)
-    rx_rate_mb = rx_delta / elapsed / 1024 / 1024
-    tx_rate_mb = tx_delta / elapsed / 1024 / 1024
-    return f"down {rx_rate_mb:.2f} MB/s | up {tx_rate_mb:.2f} MB/s ({interface})"
+    rx_rate_mb = stats.rx_bytes_per_s / 1024 / 1024
+    tx_rate_mb = stats.tx_bytes_per_s / 1024 / 1024
+    return f"down {rx_rate_mb:.2f} MB/s | up {tx_rate_mb:.2f} MB/s ({stats.name})"
 
 
-def _wifi_chipset() -> str:
-    """Best-effort lookup of Wi-Fi chipset from PCI/USB inventory."""
+def _first_match(output: str, tokens: tuple[str, ...]) -> str | None:
+    """Return the device description of the first inventory row matching a token."""
+    for row in output.splitlines():
+        lowered = row.lower()
+        if any(tok in lowered for tok in tokens):
+            return row.split(":", 2)[-1].strip()
+    return None
+
+
+def _has_wireless() -> bool:
+    """Return True when any interface exposes a wireless sysfs directory."""
     net_dir = Path("/sys/class/net")
     if not net_dir.exists():
+        return False
+    return any((iface / "wireless").exists() for iface in net_dir.iterdir())
+
+
+def _wifi_chipset() -> str:
+    """Best-effort lookup of Wi-Fi chipset from PCI/USB inventory."""
+    if not _has_wireless():
         return "N/A"
-    for iface in net_dir.iterdir():
-        if (iface / "wireless").exists():
-            line = run_command(["lspci"])
-            for row in line.splitlines():
-                lowered = row.lower()
-                if any(tok in lowered for tok in ("network", "wireless", "wifi")):
-                    return row.split(":", 2)[-1].strip()
-            usb = run_command(["lsusb"])
-            for row in usb.splitlines():
-                lowered = row.lower()
-                if any(tok in lowered for tok in ("wireless", "wifi", "wlan")):
-                    return row.split(":", 2)[-1].strip()
-    return "N/A"
+    return (
+        _first_match(run_command(["lspci"]), _WIFI_PCI_TOKENS)
+        or _first_match(run_command(["lsusb"]), _WIFI_USB_TOKENS)
+        or "N/A"
+    )
+
+
+async def _wifi_chipset_async() -> str:
+    """Async variant of ``_wifi_chipset``."""
+    if not _has_wireless():
+        return "N/A"
+    return (
+        _first_match(await run_command_async(["lspci"]), _WIFI_PCI_TOKENS)
+        or _first_match(await run_command_async(["lsusb"]), _WIFI_USB_TOKENS)
+        or "N/A"
+    )
 
 
 def _bluetooth_chipset() -> str:
     """Best-effort lookup of Bluetooth controller from PCI/USB inventory."""
-    bt_dir = Path("/sys/class/bluetooth")
-    if not bt_dir.exists():
+    if not Path("/sys/class/bluetooth").exists():
         return "N/A"
-    pci = run_command(["lspci"])
-    for row in pci.splitlines():
-        if "bluetooth" in row.lower():
-            return row.split(":", 2)[-1].strip()
-    usb = run_command(["lsusb"])
-    for row in usb.splitlines():
-        if "bluetooth" in row.lower():
-            return row.split(":", 2)[-1].strip()
-    return "N/A"
+    return (
+        _first_match(run_command(["lspci"]), ("bluetooth",))
+        or _first_match(run_command(["lsusb"]), ("bluetooth",))
+        or "N/A"
+    )
 
 
-def collect_network() -> NetworkData:
-    """Collect network summary used by text and JSON renderers."""
-    interface = _active_interface()
+async def _bluetooth_chipset_async() -> str:
+    """Async variant of ``_bluetooth_chipset``."""
+    if not Path("/sys/class/bluetooth").exists():
+        return "N/A"
+    return (
+        _first_match(await run_command_async(["lspci"]), ("bluetooth",))
+        or _first_match(await run_command_async(["lsusb"]), ("bluetooth",))
+        or "N/A"
+    )
+
+
+def _network_data(
+    stats: list[InterfaceStats],
+    routing: RoutingState | None,
+    ip: str,
+    wifi: str,
+    bluetooth: str,
+    include_virtual: bool,
+) -> NetworkData:
+    """Assemble NetworkData from sampled rates and discovery results."""
+    if routing is not None:
+        for item in stats:
+            item.addresses = [addr.address for addr in routing.addresses if addr.name == item.name]
+    by_name = {item.name: item for item in stats}
+    interface = _active_interface(stats, routing)
     return NetworkData(
-        ip=_ip_address(),
+        ip=ip,
         interface=interface,
-        throughput=_throughput(interface),
-        wifi_chipset=_wifi_chipset(),
-        bluetooth_chipset=_bluetooth_chipset(),
+        throughput=_throughput(by_name.get(interface)),
+        wifi_chipset=wifi,
+        bluetooth_chipset=bluetooth,
+        interfaces=[item for item in stats if include_virtual or not item.virtual],
+    )
+
+
+def collect_network(include_virtual: bool = False) -> NetworkData:
+    """Collect network summary used by text and JSON renderers.
+
+    Virtual interfaces (bridges, veth pairs, tunnels, loopback) are left out
+    of the per-interface list unless ``include_virtual`` is set; the primary
+    interface is still chosen from all of them.
+    """
+    virtual = _virtual_interfaces()
+    stats = _interface_stats(*_BASELINE.pair(), virtual)
+    routing = _routing_state()
+    return _network_data(
+        stats,
+        routing,
+        _ip_address(routing),
+        _wifi_chipset(),
+        _bluetooth_chipset(),
+        include_virtual,
+    )
+
+
+async def collect_network_async(include_virtual: bool = False) -> NetworkData:
+    """Async variant of ``collect_network``; inventory commands run concurrently."""
+    virtual = _virtual_interfaces()
+    routing = await asyncio.to_thread(_routing_state)
+    ip, wifi, bluetooth = await asyncio.gather(
+        _ip_address_async(routing),
+        _wifi_chipset_async(),
+        _bluetooth_chipset_async(),
     )
+    stats = _interface_stats(*await _BASELINE.pair_async(), virtual)
+    return _network_data(stats, routing, ip, wifi, bluetooth, include_virtual)
@@ -0,0 +1,112 @@
+"""NUMA per-node memory and allocation-locality collector."""
+
+from __future__ import annotations
+
+import os
+
+from sysmatrix.models import NumaData, NumaNode
+from sysmatrix.utils.sampling import CounterBaseline
+
+NODE_ROOT = "/sys/devices/system/node"
+_MEMINFO_KEYS = (b"MemTotal:", b"MemFree:")
+_NUMASTAT_KEYS = (b"numa_hit", b"numa_miss", b"numa_foreign", b"local_node", b"other_node")
+
+# Per-node sample: (cpu count, meminfo kB by key, numastat counters by key)
+_NodeSample = tuple[int, dict[bytes, int], dict[bytes, int]]
+
+
+def _read(path: str) -> bytes:
+    """Read a small sysfs file with a raw fd."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 65536)
+    finally:
+        os.close(fd)
+
+
+def _parse_node_meminfo(data: bytes) -> dict[bytes, int]:
+    """Parse ``Node N Key: value kB`` lines, keeping MemTotal and MemFree."""
+    out: dict[bytes, int] = {}
+    for line in data.splitlines():
+        fields = line.split()
+        if len(fields) >= 4 and fields[2] in _MEMINFO_KEYS:
+            out[fields[2][:-1]] = int(fields[3])
+    return out
+
+
+def _parse_numastat(data: bytes) -> dict[bytes, int]:
+    """Parse numastat ``name value`` pairs."""
+    tokens = data.split()
+    return {name: int(value) for name, value in zip(tokens[::2], tokens[1::2]) if name in _NUMASTAT_KEYS}
+
+
+def _count_cpus(cpulist: bytes) -> int:
+    """Count CPUs in a sysfs cpulist such as ``0-3,8``."""
+    count = 0
+    for part in cpulist.strip().split(b","):
+        if not part:
+            continue
+        start, _, end = part.partition(b"-")
+        count += int(end) - int(start) + 1 if end else 1
+    return count
+
+
+def _nodes() -> list[int]:
+    """Return online node ids."""
+    try:
+        names = os.listdir(NODE_ROOT)
+    except OSError:
+        return []
+    return sorted(int(name[4:]) for name in names if name.startswith("node") and name[4:].isdigit())
+
+
+def _sample() -> dict[int, _NodeSample]:
+    """Read meminfo, numastat and cpulist once per node."""
+    samples: dict[int, _NodeSample] = {}
+    for node in _nodes():
+        base = f"{NODE_ROOT}/node{node}"
+        try:
+            meminfo = _parse_node_meminfo(_read(f"{base}/meminfo"))
+            numastat = _parse_numastat(_read(f"{base}/numastat"))
+            cpus = _count_cpus(_read(f"{base}/cpulist"))
+        except (OSError, ValueError):
+            continue
+        samples[node] = (cpus, meminfo, numastat)
+    return samples
+
+
+_BASELINE: CounterBaseline[dict[int, _NodeSample]] = CounterBaseline(_sample, settle_s=0.1)
+
+
+def _node_stats(node: int, before: _NodeSample | None, now: _NodeSample, elapsed: float) -> NumaNode:
+    """Build one node's memory figures and numastat rates."""
+    cpus, meminfo, numastat = now
+
+    def rate(key: bytes) -> float | None:
+        if before is None or key not in numastat or key not in before[2]:
+            return None
+        return round(max(numastat[key] - before[2][key], 0) / elapsed, 1)
+
+    total = meminfo.get(b"MemTotal")
+    free = meminfo.get(b"MemFree")
+    local, other = rate(b"local_node"), rate(b"other_node")
+    allocations = None if local is None or other is None else local + other
+    return NumaNode(
+        node=node,
+        cpus=cpus,
+        mem_total_mb=None if total is None else round(total / 1024, 1),
+        mem_free_mb=None if free is None else round(free / 1024, 1),
+        mem_used_percent=round((total - free) / total * 100.0, 1) if total and free is not None else None,
+        numa_hit_per_s=rate(b"numa_hit"),
+        numa_miss_per_s=rate(b"numa_miss"),
+        numa_foreign_per_s=rate(b"numa_foreign"),
+        other_node_per_s=other,
+        local_percent=round(local / allocations * 100.0, 1) if allocations else None,
+    )
+
+
+def collect_numa() -> NumaData:
+    """Collect per-node memory totals and allocation-locality rates."""
+    before, now, elapsed = _BASELINE.pair()
+    nodes = [_node_stats(node, before.get(node), sample, elapsed) for node, sample in sorted(now.items())]
+    return NumaData(available=bool(nodes), window_s=round(elapsed, 3), nodes=nodes)
@@ -4,8 +4,19 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from sysmatrix.models import PerformanceData
-from sysmatrix.utils.commands import run_command
+from sysmatrix.models import PerformanceData, PressureData, PressureStats, SchedulerData, ThermalData
+from sysmatrix.utils.commands import run_command, run_command_async
+
+# Stall thresholds (percent of wall time) used by the bottleneck heuristic.
+MEMORY_FULL_STALL = 5.0
+IO_FULL_STALL = 10.0
+CPU_SOME_STALL = 25.0
+IOWAIT_LIMIT = 20.0
+STEAL_LIMIT = 10.0
+# Run-queue wait per CPU (ms of waiting per second) that counts as contention.
+RUNQUEUE_WAIT_LIMIT_MS = 100.0
+# Temperature assumed to trigger throttling when no throttle counters exist.
+THROTTLE_TEMP_C = 95.0
 
 
 def _load_average() -> str:
@@ -33,7 +44,11 @@ def _read_cpu_freq_pair() -> tuple[float | None, float | None]:
 
 def _cpu_temp_from_sensors() -> float | None:
     """Best-effort CPU package temperature from sensors output."""
-    data = run_command(["sensors"])
+    return _cpu_temp_from_output(run_command(["sensors"]))
+
+
+def _cpu_temp_from_output(data: str) -> float | None:
+    """Extract the CPU package temperature from sensors text."""
     keys = ("tctl", "tdie", "package id 0", "core 0")
     for line in data.splitlines():
         lowered = line.strip().lower()
@@ -47,27 +62,146 @@ def _cpu_temp_from_sensors() -> float | None:
     return None
 
 
-def collect_performance(cpu_usage: float, gpu_usage: float | None) -> PerformanceData:
+def _throttle_events(thermal: ThermalData | None) -> int | None:
+    """Return throttle events across all packages, or None when not measured."""
+    if thermal is None or not thermal.available:
+        return None
+    counts = [
+        count
+        for package in thermal.packages
+        for count in (package.core_throttle_events, package.package_throttle_events)
+        if count is not None
+    ]
+    return sum(counts) if counts else None
+
+
+def _thermal_status(headroom: float | None, events: int | None) -> str:
+    """Classify thermal state, preferring measured throttle events over temperature.
+
+    With throttle counters, THROTTLING means the CPU actually throttled in
+    the sample window; temperature then only grades the remaining headroom.
+    Without counters a temperature above ``THROTTLE_TEMP_C`` is assumed to
+    throttle.
+    """
+    if events:
+        return "THROTTLING"
+    if headroom is None:
+        return "N/A" if events is None else "OK"
+    if headroom < 0 and events is None:
+        return "THROTTLING"
+    if headroom < 10:
+        return "Critical"
+    if headroom < 20:
+        return "Warm"
+    return "OK"
+
+
+def _stall_percent(stats: PressureStats, kind: str, window_s: float) -> float | None:
+    """Return the stall share over the sample window, else the kernel's avg10."""
+    stall_us = stats.some_stall_us if kind == "some" else stats.full_stall_us
+    if stall_us is not None and window_s > 0:
+        return round(stall_us / (window_s * 1_000_000) * 100.0, 1)
+    return stats.some_avg10 if kind == "some" else stats.full_avg10
+
+
+def _run_queue_bottleneck(scheduler: SchedulerData | None) -> str | None:
+    """Report run-queue contention from schedstat wait time.
+
+    ``procs_running`` alone is not used: it is an instantaneous count that
+    includes the collector's own threads. Without schedstat the PSI CPU
+    check covers the same condition.
+    """
+    if scheduler is None or scheduler.run_queue_wait_ms_per_s is None or not scheduler.cpu_count:
+        return None
+    per_cpu = scheduler.run_queue_wait_ms_per_s / scheduler.cpu_count
+    if per_cpu < RUNQUEUE_WAIT_LIMIT_MS:
+        return None
+    avg = "N/A" if scheduler.avg_wait_us is None else f"{scheduler.avg_wait_us:.0f} us"
+    return f"Run-Queue Contention (wait: {per_cpu:.0f} ms/s per CPU, avg {avg})"
+
+
+def _pressure_bottleneck(
+    pressure: PressureData | None,
+    iowait: float | None,
+    steal: float | None,
+    scheduler: SchedulerData | None = None,
+) -> str | None:
+    """Classify memory, I/O, or CPU starvation from PSI, iowait, steal and run-queue wait."""
+    stalls: dict[str, tuple[float | None, float | None]] = {}
+    if pressure is not None and pressure.available:
+        for stats in pressure.system:
+            stalls[stats.resource] = (
+                _stall_percent(stats, "some", pressure.window_s),
+                _stall_percent(stats, "full", pressure.window_s),
+            )
+    _mem_some, mem_full = stalls.get("memory", (None, None))
+    _io_some, io_full = stalls.get("io", (None, None))
+    cpu_some, _cpu_full = stalls.get("cpu", (None, None))
+
+    if mem_full is not None and mem_full >= MEMORY_FULL_STALL:
+        return f"Memory Pressure (PSI full: {mem_full:.1f}%)"
+    if (io_full is not None and io_full >= IO_FULL_STALL) or (iowait is not None and iowait >= IOWAIT_LIMIT):
+        io_text = "N/A" if io_full is None else f"{io_full:.1f}%"
+        wait_text = "N/A" if iowait is None else f"{iowait:.1f}%"
+        return f"I/O Bound (PSI full: {io_text}, iowait: {wait_text})"
+    if steal is not None and steal >= STEAL_LIMIT:
+        return f"CPU Steal (hypervisor: {steal:.1f}%)"
+    run_queue = _run_queue_bottleneck(scheduler)
+    if run_queue is not None:
+        return run_queue
+    if cpu_some is not None and cpu_some >= CPU_SOME_STALL:
+        return f"CPU Starved (PSI some: {cpu_some:.1f}%)"
+    return None
+
+
+def collect_performance(
+    cpu_usage: float,
+    gpu_usage: float | None,
+    iowait: float | None = None,
+    steal: float | None = None,
+    pressure: PressureData | None = None,
+    thermal: ThermalData | None = None,
+    scheduler: SchedulerData | None = None,
+) -> PerformanceData:
     """Compute performance summary fields for rendering and JSON export."""
+    cpu_temp = _cpu_temp_from_sensors()
+    return _performance_data(cpu_usage, gpu_usage, iowait, steal, pressure, cpu_temp, thermal, scheduler)
+
+
+async def collect_performance_async(
+    cpu_usage: float,
+    gpu_usage: float | None,
+    iowait: float | None = None,
+    steal: float | None = None,
+    pressure: PressureData | None = None,
+    thermal: ThermalData | None = None,
+    scheduler: SchedulerData | None = None,
+) -> PerformanceData:
+    """Async variant of ``collect_performance``."""
+    cpu_temp = _cpu_temp_from_output(await run_command_async(["sensors"]))
+    return _performance_data(cpu_usage, gpu_usage, iowait, steal, pressure, cpu_temp, thermal, scheduler)
+
+
+def _performance_data(
+    cpu_usage: float,
+    gpu_usage: float | None,
+    iowait: float | None,
+    steal: float | None,
+    pressure: PressureData | None,
+    cpu_temp: float | None,
+    thermal: ThermalData | None = None,
+    scheduler: SchedulerData | None = None,
+) -> PerformanceData:
+    """Derive performance fields from collected inputs."""
     cur, maxf = _read_cpu_freq_pair()
     cpu_perf = round((cur / maxf) * 100.0, 1) if cur is not None and maxf else None
 
-    cpu_temp = _cpu_temp_from_sensors()
-    thermal_headroom = None
-    thermal_status = "N/A"
-    if cpu_temp is not None:
-        thermal_headroom = round(95.0 - cpu_temp, 1)
-        if thermal_headroom < 0:
-            thermal_status = "THROTTLING"
-        elif thermal_headroom < 10:
-            thermal_status = "Critical"
-        elif thermal_headroom < 20:
-            thermal_status = "Warm"
-        else:
-            thermal_status = "OK"
-
-    bottleneck = "None detected"
-    if gpu_usage is not None:
+    thermal_headroom = None if cpu_temp is None else round(THROTTLE_TEMP_C - cpu_temp, 1)
+    events = _throttle_events(thermal)
+    thermal_status = _thermal_status(thermal_headroom, events)
+
+    bottleneck = _pressure_bottleneck(pressure, iowait, steal, scheduler) or "None detected"
+    if bottleneck == "None detected" and gpu_usage is not None:
         if cpu_usage > 85 and gpu_usage < 50:
             bottleneck = f"CPU Limited (CPU: {cpu_usage:.0f}%, GPU: {gpu_usage:.0f}%)"
         elif gpu_usage > 95 and cpu_usage < 50:
@@ -81,4 +215,5 @@ def collect_performance(cpu_usage: float, gpu_usage: float | None) -> Performanc
         thermal_headroom_c=thermal_headroom,
         thermal_status=thermal_status,
         bottleneck=bottleneck,
+        throttle_events=events,
     )
@@ -0,0 +1,101 @@
+"""Pressure stall information (PSI) collector for system and cgroup scopes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from sysmatrix.models import PressureData, PressureStats
+from sysmatrix.utils.cgroups import cgroup_v2_dir
+from sysmatrix.utils.sampling import CounterBaseline
+
+RESOURCES = ("cpu", "memory", "io")
+
+# Parsed PSI file: {"some": (avg10, avg60, total_us), "full": (...)}
+_Psi = dict[str, tuple[float, float, int]]
+
+
+def _parse_psi(text: str) -> _Psi:
+    """Parse a PSI file into some/full (avg10, avg60, total) tuples."""
+    out: _Psi = {}
+    for line in text.splitlines():
+        kind, _, rest = line.partition(" ")
+        if kind not in ("some", "full"):
+            continue
+        values = dict(part.split("=", 1) for part in rest.split() if "=" in part)
+        try:
+            out[kind] = (float(values["avg10"]), float(values["avg60"]), int(values["total"]))
+        except (KeyError, ValueError):
+            continue
+    return out
+
+
+def _read_psi(path: Path) -> _Psi | None:
+    """Read one PSI file, returning None when it is missing or unreadable."""
+    try:
+        return _parse_psi(path.read_text(encoding="utf-8", errors="ignore"))
+    except OSError:
+        return None
+
+
+def _pressure_files() -> dict[tuple[str, str], Path]:
+    """Map (scope, resource) to the PSI files available on this host."""
+    files = {("system", res): Path(f"/proc/pressure/{res}") for res in RESOURCES}
+    cgroup = cgroup_v2_dir()
+    if cgroup is not None:
+        for res in RESOURCES:
+            path = cgroup / f"{res}.pressure"
+            if path.exists():
+                files[("cgroup", res)] = path
+    return files
+
+
+def _sample() -> dict[tuple[str, str], _Psi]:
+    """Read every available PSI file once."""
+    samples = {}
+    for key, path in _pressure_files().items():
+        parsed = _read_psi(path)
+        if parsed:
+            samples[key] = parsed
+    return samples
+
+
+_BASELINE: CounterBaseline[dict[tuple[str, str], _Psi]] = CounterBaseline(_sample, settle_s=0.1)
+
+
+def _stats(resource: str, before: _Psi | None, now: _Psi) -> PressureStats:
+    """Build stats for one resource, with total-stall deltas when a baseline exists."""
+    def delta(kind: str) -> int | None:
+        if kind not in now or before is None or kind not in before:
+            return None
+        return max(now[kind][2] - before[kind][2], 0)
+
+    some = now.get("some", (0.0, 0.0, 0))
+    full = now.get("full")
+    return PressureStats(
+        resource=resource,
+        some_avg10=some[0],
+        some_avg60=some[1],
+        some_stall_us=delta("some"),
+        full_avg10=None if full is None else full[0],
+        full_avg60=None if full is None else full[1],
+        full_stall_us=delta("full"),
+    )
+
+
+def collect_pressure() -> PressureData:
+    """Collect PSI averages and stall-time deltas for the host and own cgroup."""
+    previous, current, elapsed = _BASELINE.pair()
+    scopes: dict[str, list[PressureStats]] = {"system": [], "cgroup": []}
+    for res in RESOURCES:
+        for scope in scopes:
+            now = current.get((scope, res))
+            if now:
+                scopes[scope].append(_stats(res, previous.get((scope, res)), now))
+    cgroup = cgroup_v2_dir() if scopes["cgroup"] else None
+    return PressureData(
+        available=bool(scopes["system"]),
+        window_s=round(elapsed, 3),
+        system=scopes["system"],
+        cgroup=scopes["cgroup"],
+        cgroup_path=None if cgroup is None else str(cgroup),
+    )
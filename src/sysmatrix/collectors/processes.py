@@ -0,0 +1,146 @@
+"""Top-N process collector built from /proc/[pid] counters."""
+
+from __future__ import annotations
+
+import heapq
+import os
+
+from sysmatrix.models import ProcessData, ProcessStats
+from sysmatrix.utils.sampling import CounterBaseline
+
+PROC_ROOT = "/proc"
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Per-pid sample: (name, state, start_time, cpu_ticks, rss_pages, read_bytes, write_bytes)
+_Sample = tuple[str, str, bytes, int, int, int | None, int | None]
+
+
+def _read(path: str) -> bytes:
+    """Read a small procfs file with raw fds, skipping Python's io stack."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 4096)
+    finally:
+        os.close(fd)
+
+
+def _parse_stat(data: bytes) -> tuple[str, str, bytes, int, int] | None:
+    """Parse /proc/[pid]/stat into name, state, start time, CPU ticks and RSS pages."""
+    # comm may contain spaces or parentheses, so split around the last ')'.
+    lparen = data.find(b"(")
+    rparen = data.rfind(b")")
+    if lparen < 0 or rparen < lparen:
+        return None
+    fields = data[rparen + 2 :].split()
+    if len(fields) < 22:
+        return None
+    name = data[lparen + 1 : rparen].decode("utf-8", "replace")
+    return name, fields[0].decode("ascii", "replace"), fields[19], int(fields[11]) + int(fields[12]), int(fields[21])
+
+
+def _parse_io(data: bytes) -> tuple[int, int] | None:
+    """Parse read_bytes/write_bytes from /proc/[pid]/io."""
+    read_bytes = write_bytes = None
+    for line in data.splitlines():
+        if line.startswith(b"read_bytes:"):
+            read_bytes = int(line[11:])
+        elif line.startswith(b"write_bytes:"):
+            write_bytes = int(line[12:])
+    if read_bytes is None or write_bytes is None:
+        return None
+    return read_bytes, write_bytes
+
+
+class _ProcessScanner:
+    """Scan /proc once per sample, remembering pids whose io file is unreadable."""
+
+    def __init__(self) -> None:
+        self._io_denied: set[int] = set()
+
+    def scan(self) -> dict[int, _Sample]:
+        """Return one sample per live pid; pids that vanish mid-scan are skipped."""
+        samples: dict[int, _Sample] = {}
+        denied: set[int] = set()
+        with os.scandir(PROC_ROOT) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.isdigit():
+                    continue
+                pid = int(name)
+                base = f"{PROC_ROOT}/{name}"
+                try:
+                    parsed = _parse_stat(_read(f"{base}/stat"))
+                except (OSError, ValueError):
+                    # The process exited between scandir and the read.
+                    continue
+                if parsed is None:
+                    continue
+                io = None
+                if pid not in self._io_denied:
+                    try:
+                        io = _parse_io(_read(f"{base}/io"))
+                    except PermissionError:
+                        denied.add(pid)
+                    except (OSError, ValueError):
+                        pass
+                else:
+                    denied.add(pid)
+                comm, state, start, ticks, rss = parsed
+                samples[pid] = (comm, state, start, ticks, rss, *(io or (None, None)))
+        # Only keep denials for pids that still exist, so reused pids get retried.
+        self._io_denied = denied
+        return samples
+
+
+_SCANNER = _ProcessScanner()
+_BASELINE: CounterBaseline[dict[int, _Sample]] = CounterBaseline(_SCANNER.scan, settle_s=0.25)
+
+
+def _rate(now: int | None, before: int | None, elapsed: float) -> float | None:
+    """Return a per-second delta, or None when either side is unknown."""
+    if now is None or before is None:
+        return None
+    return round(max(now - before, 0) / elapsed, 1)
+
+
+def _process_stats(previous: dict[int, _Sample], current: dict[int, _Sample], elapsed: float) -> list[ProcessStats]:
+    """Combine two scans into per-process rates."""
+    stats: list[ProcessStats] = []
+    for pid, (name, state, start, ticks, rss, read_b, write_b) in current.items():
+        before = previous.get(pid)
+        if before is None or before[2] != start:
+            # New process (or a reused pid): rates start from zero.
+            before = (name, state, start, ticks, rss, read_b, write_b)
+        stats.append(
+            ProcessStats(
+                pid=pid,
+                name=name,
+                state=state,
+                cpu_percent=round(max(ticks - before[3], 0) / _CLK_TCK / elapsed * 100.0, 1),
+                rss_mb=round(rss * _PAGE_SIZE / 1024 / 1024, 1),
+                read_bytes_per_s=_rate(read_b, before[5], elapsed),
+                write_bytes_per_s=_rate(write_b, before[6], elapsed),
+            )
+        )
+    return stats
+
+
+def collect_processes(top_n: int = 5) -> ProcessData:
+    """Collect process counts and the top N processes by CPU, memory and I/O."""
+    previous, current, elapsed = _BASELINE.pair()
+    stats = _process_stats(previous, current, elapsed)
+    busy = [item for item in stats if item.cpu_percent > 0]
+    with_io = [item for item in stats if (item.read_bytes_per_s or 0.0) + (item.write_bytes_per_s or 0.0) > 0]
+    return ProcessData(
+        total=len(stats),
+        running=sum(1 for item in stats if item.state == "R"),
+        uninterruptible=sum(1 for item in stats if item.state == "D"),
+        top_cpu=heapq.nlargest(top_n, busy, key=lambda item: item.cpu_percent),
+        top_memory=heapq.nlargest(top_n, stats, key=lambda item: item.rss_mb),
+        top_io=heapq.nlargest(
+            top_n,
+            with_io,
+            key=lambda item: (item.read_bytes_per_s or 0.0) + (item.write_bytes_per_s or 0.0),
+        ),
+    )
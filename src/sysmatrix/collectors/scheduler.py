@@ -0,0 +1,123 @@
+"""Scheduler activity and run-queue wait collector."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from sysmatrix.models import SchedCpu, SchedulerData
+from sysmatrix.utils.sampling import CounterBaseline
+
+STAT_PATH = "/proc/stat"
+SCHEDSTAT_PATH = "/proc/schedstat"
+TOP_N = 5
+_STAT_KEYS = (b"ctxt", b"processes", b"procs_running", b"procs_blocked")
+
+# Per-CPU schedstat counters: cpu id -> (run_delay ns, timeslices)
+_SchedSample = dict[int, tuple[int, int]]
+# (/proc/stat counters by key, schedstat counters)
+_Sample = tuple[dict[bytes, int], _SchedSample]
+
+
+def parse_stat(data: bytes) -> dict[bytes, int]:
+    """Pick scheduler counters out of /proc/stat.
+
+    The file carries a per-IRQ ``intr`` line that is very long on large
+    hosts, so keys are located with ``bytes.find`` instead of splitting
+    every line.
+    """
+    out: dict[bytes, int] = {}
+    for key in _STAT_KEYS:
+        start = data.find(b"\n" + key + b" ")
+        if start < 0:
+            continue
+        start += len(key) + 2
+        end = data.find(b"\n", start)
+        out[key] = int(data[start : end if end >= 0 else None])
+    return out
+
+
+def parse_schedstat(data: bytes) -> _SchedSample:
+    """Parse per-CPU run_delay and timeslice counts from /proc/schedstat.
+
+    ``cpuN`` lines end with ``rq_cpu_time run_delay pcount`` in every
+    schedstat version since 15; ``domainN`` lines are ignored.
+    """
+    out: _SchedSample = {}
+    for line in data.splitlines():
+        if not line.startswith(b"cpu"):
+            continue
+        fields = line.split()
+        if len(fields) < 4 or not fields[0][3:].isdigit():
+            continue
+        out[int(fields[0][3:])] = (int(fields[-2]), int(fields[-1]))
+    return out
+
+
+def _sample() -> _Sample:
+    stat = parse_stat(Path(STAT_PATH).read_bytes())
+    try:
+        schedstat = parse_schedstat(Path(SCHEDSTAT_PATH).read_bytes())
+    except OSError:
+        # Kernels built without CONFIG_SCHEDSTATS have no /proc/schedstat.
+        schedstat = {}
+    return stat, schedstat
+
+
+_BASELINE: CounterBaseline[_Sample] = CounterBaseline(_sample, settle_s=0.1)
+
+
+def _rate(before: dict[bytes, int], now: dict[bytes, int], key: bytes, elapsed: float) -> float | None:
+    if key not in before or key not in now:
+        return None
+    return round(max(now[key] - before[key], 0) / elapsed, 1)
+
+
+def _cpu_waits(before: _SchedSample, now: _SchedSample, elapsed: float) -> list[SchedCpu]:
+    """Return run-queue wait per CPU over the window."""
+    cpus = []
+    for cpu, (delay, slices) in sorted(now.items()):
+        if cpu not in before:
+            continue
+        delay_ns = max(delay - before[cpu][0], 0)
+        slice_count = max(slices - before[cpu][1], 0)
+        cpus.append(
+            SchedCpu(
+                cpu=cpu,
+                wait_ms_per_s=round(delay_ns / 1e6 / elapsed, 2),
+                avg_wait_us=round(delay_ns / slice_count / 1e3, 1) if slice_count else None,
+                timeslices_per_s=round(slice_count / elapsed, 1),
+            )
+        )
+    return cpus
+
+
+def scheduler_data(before: _Sample, now: _Sample, elapsed: float) -> SchedulerData:
+    """Build scheduler rates and run-queue wait from two samples."""
+    stat_before, sched_before = before
+    stat_now, sched_now = now
+    cpus = _cpu_waits(sched_before, sched_now, elapsed)
+    waits = None
+    avg_wait = None
+    if cpus:
+        waits = round(sum(cpu.wait_ms_per_s for cpu in cpus), 2)
+        slices = sum(cpu.timeslices_per_s for cpu in cpus)
+        avg_wait = round(waits * 1e3 / slices, 1) if slices else None
+    return SchedulerData(
+        available=bool(stat_now),
+        window_s=round(elapsed, 3),
+        cpu_count=len(sched_now) or os.cpu_count() or 0,
+        context_switches_per_s=_rate(stat_before, stat_now, b"ctxt", elapsed),
+        forks_per_s=_rate(stat_before, stat_now, b"processes", elapsed),
+        procs_running=stat_now.get(b"procs_running"),
+        procs_blocked=stat_now.get(b"procs_blocked"),
+        run_queue_wait_ms_per_s=waits,
+        avg_wait_us=avg_wait,
+        top_wait_cpus=sorted(cpus, key=lambda cpu: cpu.wait_ms_per_s, reverse=True)[:TOP_N],
+    )
+
+
+def collect_scheduler() -> SchedulerData:
+    """Collect context switch/fork rates, runnable/blocked counts and run-queue wait."""
+    before, now, elapsed = _BASELINE.pair()
+    return scheduler_data(before, now, elapsed)
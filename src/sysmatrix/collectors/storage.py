@@ -7,7 +7,7 @@ import shutil
 from pathlib import Path
 
 from sysmatrix.models import StorageData
-from sysmatrix.utils.commands import run_command
+from sysmatrix.utils.commands import run_command, run_command_async
 
 
 def _to_float(value: str) -> float | None:
@@ -34,6 +34,15 @@ def _last_number(text: str) -> float | None:
     return _to_float(matches[-1])
 
 
+def _normalize_device(source: str) -> str:
+    """Reduce a mount source such as /dev/nvme0n1p2 to its whole-disk name."""
+    if source.startswith("/dev/"):
+        source = source[5:]
+    if source.startswith("nvme") and "p" in source:
+        return source.split("p", 1)[0]
+    return source.rstrip("0123456789")
+
+
 def _root_block_device() -> str:
     """Resolve root filesystem backing block device name."""
     source = run_command(["findmnt", "-no", "SOURCE", "/"])
@@ -43,11 +52,19 @@ def _root_block_device() -> str:
     if source.startswith("/dev/mapper/"):
         mapped = run_command(["lsblk", "-no", "pkname", source])
         source = f"/dev/{mapped}" if mapped else source
-    if source.startswith("/dev/"):
-        source = source[5:]
-    if source.startswith("nvme") and "p" in source:
-        return source.split("p", 1)[0]
-    return source.rstrip("0123456789")
+    return _normalize_device(source)
+
+
+async def _root_block_device_async() -> str:
+    """Async variant of ``_root_block_device``."""
+    source = await run_command_async(["findmnt", "-no", "SOURCE", "/"])
+    if not source:
+        lines = (await run_command_async(["df", "/", "--output=source"])).splitlines()
+        source = lines[-1] if lines else ""
+    if source.startswith("/dev/mapper/"):
+        mapped = await run_command_async(["lsblk", "-no", "pkname", source])
+        source = f"/dev/{mapped}" if mapped else source
+    return _normalize_device(source)
 
 
 def _device_type(device: str) -> str:
@@ -63,11 +80,20 @@ def _device_type(device: str) -> str:
     return "Unknown"
 
 
+def _smart_attributes(device: str) -> str:
+    """Return ``smartctl -A`` output for a device, or "" when unknown."""
+    return run_command(["smartctl", "-A", f"/dev/{device}"]) if device else ""
+
+
 def _temperature_from_smart(device: str) -> float | None:
     """Read disk temperature from SMART output or NVMe hwmon fallback."""
     if not device:
         return None
-    out = run_command(["smartctl", "-A", f"/dev/{device}"])
+    return _temperature_from_output(device, _smart_attributes(device))
+
+
+def _temperature_from_output(device: str, out: str) -> float | None:
+    """Parse disk temperature from SMART text, falling back to NVMe hwmon."""
     for line in out.splitlines():
         lowered = line.lower()
         if any(
@@ -96,7 +122,11 @@ def _wear_from_smart(device: str) -> int | None:
     """Read disk wear percentage from SMART fields when available."""
     if not device:
         return None
-    out = run_command(["smartctl", "-A", f"/dev/{device}"])
+    return _wear_from_output(_smart_attributes(device))
+
+
+def _wear_from_output(out: str) -> int | None:
+    """Parse disk wear percentage from SMART text."""
     for line in out.splitlines():
         lowered = line.lower()
         number = _last_number(line)
@@ -115,20 +145,33 @@ def _wear_from_smart(device: str) -> int | None:
     return None
 
 
-def collect_storage() -> StorageData:
-    """Collect root storage usage and optional health indicators."""
+def _storage_data(root_device: str, smart: str) -> StorageData:
+    """Assemble root storage usage with SMART-derived health fields."""
     usage = shutil.disk_usage("/")
     total_gb = round(usage.total / 1024 / 1024 / 1024, 1)
     used_gb = round(usage.used / 1024 / 1024 / 1024, 1)
     usage_percent = round((usage.used / usage.total * 100.0), 1) if usage.total else 0.0
 
-    root_device = _root_block_device()
     return StorageData(
         root_mount="/",
         device_type=_device_type(root_device),
         total_gb=total_gb,
         used_gb=used_gb,
         usage_percent=usage_percent,
-        temperature_c=_temperature_from_smart(root_device),
-        wear_percent=_wear_from_smart(root_device),
+        temperature_c=_temperature_from_output(root_device, smart) if root_device else None,
+        wear_percent=_wear_from_output(smart) if root_device else None,
     )
+
+
+def collect_storage() -> StorageData:
+    """Collect root storage usage and optional health indicators."""
+    root_device = _root_block_device()
+    # One smartctl run feeds both the temperature and wear parsers.
+    return _storage_data(root_device, _smart_attributes(root_device))
+
+
+async def collect_storage_async() -> StorageData:
+    """Async variant of ``collect_storage``."""
+    root_device = await _root_block_device_async()
+    smart = await run_command_async(["smartctl", "-A", f"/dev/{root_device}"]) if root_device else ""
+    return _storage_data(root_device, smart)
@@ -9,7 +9,7 @@ import socket
 from pathlib import Path
 
 from sysmatrix.models import SystemData
-from sysmatrix.utils.commands import run_command
+from sysmatrix.utils.commands import run_command, run_command_async
 
 
 def _read_os_name() -> str:
@@ -22,20 +22,61 @@ def _read_os_name() -> str:
     return platform.platform()
 
 
+_UPTIME = Path("/proc/uptime")
+# Units of ``uptime -p`` output, in minutes, largest first.
+_UPTIME_UNITS = (("year", 525_600), ("week", 10_080), ("day", 1_440), ("hour", 60))
+
+
+def _format_uptime(data: str) -> str:
+    """Strip the ``up`` prefix from ``uptime -p`` output."""
+    return data.replace("up ", "", 1) if data else "unknown"
+
+
+def _format_uptime_seconds(seconds: float) -> str:
+    """Format seconds of uptime the way ``uptime -p`` does, without the ``up`` prefix."""
+    minutes = int(seconds // 60)
+    parts = []
+    for unit, size in _UPTIME_UNITS:
+        count, minutes = divmod(minutes, size)
+        if count:
+            parts.append(f"{count} {unit}{'' if count == 1 else 's'}")
+    if minutes or not parts:
+        parts.append(f"{minutes} minute{'' if minutes == 1 else 's'}")
+    return ", ".join(parts)
+
+
+def _proc_uptime() -> str | None:
+    """Read uptime from /proc/uptime, or None where it is unavailable."""
+    try:
+        return _format_uptime_seconds(float(_UPTIME.read_text(encoding="ascii").split()[0]))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
 def _read_uptime() -> str:
     """Read human-readable uptime from the host."""
-    data = run_command(["uptime", "-p"])
-    return data.replace("up ", "", 1) if data else "unknown"
+    return _proc_uptime() or _format_uptime(run_command(["uptime", "-p"]))
 
 
-def collect_system() -> SystemData:
-    """Collect baseline system metadata for display and JSON output."""
+def _system_data(uptime: str) -> SystemData:
+    """Assemble system metadata around a resolved uptime string."""
     return SystemData(
         user=getpass.getuser(),
         hostname=socket.gethostname(),
         os=_read_os_name(),
         kernel=platform.release(),
         arch=platform.machine(),
-        uptime=_read_uptime(),
+        uptime=uptime,
         shell=os.path.basename(os.environ.get("SHELL", "unknown")),
     )
+
+
+def collect_system() -> SystemData:
+    """Collect baseline system metadata for display and JSON output."""
+    return _system_data(_read_uptime())
+
+
+async def collect_system_async() -> SystemData:
+    """Async variant of ``collect_system``; only runs ``uptime -p`` without /proc/uptime."""
+    uptime = _proc_uptime() or _format_uptime(await run_command_async(["uptime", "-p"]))
+    return _system_data(uptime)
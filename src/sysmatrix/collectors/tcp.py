@@ -0,0 +1,248 @@
+"""TCP socket states and retransmit/reset/listen-queue rates."""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import Counter
+from operator import itemgetter
+from pathlib import Path
+
+from sysmatrix.models import TcpData, TcpRates
+from sysmatrix.utils.netlink import read_tcp_states
+from sysmatrix.utils.sampling import CounterBaseline
+
+LOGGER = logging.getLogger(__name__)
+
+SNMP_PATH = "/proc/net/snmp"
+NETSTAT_PATH = "/proc/net/netstat"
+TCP_PATHS = ("/proc/net/tcp", "/proc/net/tcp6")
+
+# Kernel TCP state numbers (include/net/tcp_states.h).
+TCP_STATES = {
+    1: "ESTABLISHED",
+    2: "SYN_SENT",
+    3: "SYN_RECV",
+    4: "FIN_WAIT1",
+    5: "FIN_WAIT2",
+    6: "TIME_WAIT",
+    7: "CLOSE",
+    8: "CLOSE_WAIT",
+    9: "LAST_ACK",
+    10: "LISTEN",
+    11: "CLOSING",
+    12: "NEW_SYN_RECV",
+}
+
+# /proc/net/snmp and /proc/net/netstat counters turned into rates: output field -> (table, counter).
+_TCP_RATES = {
+    "active_opens_per_s": (b"Tcp", b"ActiveOpens"),
+    "passive_opens_per_s": (b"Tcp", b"PassiveOpens"),
+    "attempt_fails_per_s": (b"Tcp", b"AttemptFails"),
+    "estab_resets_per_s": (b"Tcp", b"EstabResets"),
+    "resets_sent_per_s": (b"Tcp", b"OutRsts"),
+    "in_segs_per_s": (b"Tcp", b"InSegs"),
+    "out_segs_per_s": (b"Tcp", b"OutSegs"),
+    "retrans_segs_per_s": (b"Tcp", b"RetransSegs"),
+    "in_errs_per_s": (b"Tcp", b"InErrs"),
+    "listen_overflows_per_s": (b"TcpExt", b"ListenOverflows"),
+    "listen_drops_per_s": (b"TcpExt", b"ListenDrops"),
+    "syn_retrans_per_s": (b"TcpExt", b"TCPSynRetrans"),
+    "timeouts_per_s": (b"TcpExt", b"TCPTimeouts"),
+    "syncookies_sent_per_s": (b"TcpExt", b"SyncookiesSent"),
+}
+
+# /proc/net/tcp{,6} rows: "  sl: local:port remote:port st ..." with fixed-width hex fields.
+_STATE_LINE = re.compile(rb"\s*\d+: [0-9A-Fa-f]+:[0-9A-Fa-f]+ [0-9A-Fa-f]+:[0-9A-Fa-f]+ ([0-9A-Fa-f]{2}) ")
+_CHUNK = 1 << 20
+_COLON = ord(":")
+
+_Counters = dict[tuple[bytes, bytes], int]
+
+
+def parse_snmp(data: bytes) -> _Counters:
+    """Parse /proc/net/snmp or /proc/net/netstat.
+
+    Both files are pairs of lines, a ``Table: Name ...`` header followed by
+    ``Table: value ...``; counters are keyed by ``(table, name)``.
+    """
+    out: _Counters = {}
+    lines = data.splitlines()
+    for header, values in zip(lines[::2], lines[1::2]):
+        names = header.split()
+        numbers = values.split()
+        if not names or not numbers or names[0] != numbers[0]:
+            continue
+        table = names[0].rstrip(b":")
+        for name, value in zip(names[1:], numbers[1:]):
+            out[(table, name)] = int(value)
+    return out
+
+
+def _census(highs: bytes, lows: bytes) -> dict[int, int] | None:
+    """Count states from their two hex digits, gathered one byte per row.
+
+    Every TCP state is below 16, so the high digit must be ``0`` and the
+    low digit alone names the state.
+    """
+    if highs.count(b"0") != len(lows):
+        return None
+    try:
+        return {int(chr(digit), 16): lows.count(digit) for digit in set(lows)}
+    except ValueError:
+        return None
+
+
+def _count_lines(lines: list[bytes], counts: Counter[int]) -> None:
+    """Add the states of a batch of /proc/net/tcp{,6} rows to ``counts``.
+
+    Fields up to the state are fixed-width once the slot number column is,
+    so when every row has its ``sl:`` colon in the same column the state
+    digits are gathered with ``itemgetter`` passes in C. Batches where the
+    slot width changes (around 10**k rows) or that do not look like the
+    kernel layout are matched row by row instead.
+    """
+    first = _STATE_LINE.match(lines[0])
+    if first is not None:
+        high = first.start(1)
+        try:
+            if bytes(map(itemgetter(lines[0].index(b":")), lines)).count(b":") == len(lines):
+                batch = _census(bytes(map(itemgetter(high), lines)), bytes(map(itemgetter(high + 1), lines)))
+                if batch is not None:
+                    counts.update(batch)
+                    return
+        except IndexError:
+            pass
+    for line in lines:
+        match = _STATE_LINE.match(line)
+        if match is not None:
+            counts[int(match[1], 16)] += 1
+
+
+def _fixed_states(data: bytes, start: int, end: int) -> dict[int, int] | None:
+    """Count the states of rows ``data[start:end]`` laid out at one stride.
+
+    The kernel pads /proc/net/tcp rows to 150 bytes, so every row's newline,
+    ``sl:`` colon and two-digit state sit at the same offset modulo the row
+    width: each check and the state census is a strided slice counted in C.
+    A batch in which the slot number gains a digit is split there. Returns
+    None when the rows are not uniform, as in /proc/net/tcp6.
+    """
+    first = _STATE_LINE.match(data, start)
+    width = data.find(b"\n", start, end) + 1 - start
+    if first is None or width <= 0 or (end - start) % width:
+        return None
+    rows = (end - start) // width
+    if data[start + width - 1 : end : width].count(b"\n") != rows:
+        return None
+    colons = data[data.index(b":", start) : end : width]
+    uniform = len(colons) - len(colons.lstrip(b":"))
+    if uniform < rows:
+        split = start + uniform * width
+        head = _fixed_states(data, start, split) if uniform else None
+        tail = _fixed_states(data, split, end) if head is not None else None
+        return None if tail is None else dict(Counter(head) + Counter(tail))
+    high = first.start(1)
+    return _census(data[high:end:width], data[high + 1 : end : width])
+
+
+def count_proc_states(path: str, counts: Counter[int]) -> None:
+    """Stream a /proc/net/tcp{,6} file into per-state counts.
+
+    The file is read in 1 MiB chunks that are scanned in place (only a row
+    straddling two chunks is copied) and rows are never decoded, so a
+    500k-socket table is not held in memory whole or as Python strings.
+    """
+    with open(path, "rb", buffering=0) as handle:
+        header = True
+        tail = b""
+        while chunk := handle.read(_CHUNK):
+            start = chunk.find(b"\n") + 1
+            if not start:
+                tail += chunk
+                continue
+            row = tail + chunk[: start - 1]
+            if header:
+                header = False
+            elif row.strip():
+                _count_lines([row], counts)
+            end = chunk.rfind(b"\n") + 1
+            if end > start:
+                batch = _fixed_states(chunk, start, end)
+                if batch is None:
+                    _count_lines(chunk[start : end - 1].split(b"\n"), counts)
+                else:
+                    counts.update(batch)
+            tail = chunk[end:]
+        if tail.strip() and not header:
+            _count_lines([tail], counts)
+
+
+def tcp_state_counts() -> tuple[Counter[int], str | None]:
+    """Count TCP sockets by state, preferring sock_diag over /proc/net/tcp{,6}."""
+    try:
+        return read_tcp_states(), "sock_diag"
+    except OSError:
+        LOGGER.debug("sock_diag dump failed; parsing /proc/net/tcp", exc_info=True)
+    counts: Counter[int] = Counter()
+    found = False
+    for path in TCP_PATHS:
+        try:
+            count_proc_states(path, counts)
+        except OSError:
+            continue
+        found = True
+    return counts, "procfs" if found else None
+
+
+def _sample() -> _Counters:
+    counters = parse_snmp(Path(SNMP_PATH).read_bytes())
+    try:
+        counters.update(parse_snmp(Path(NETSTAT_PATH).read_bytes()))
+    except OSError:
+        pass
+    return counters
+
+
+_BASELINE: CounterBaseline[_Counters] = CounterBaseline(_sample, settle_s=0.1)
+
+
+def _tcp_rates(before: _Counters, now: _Counters, elapsed: float) -> TcpRates:
+    """Turn two counter samples into per-second rates; absent counters stay None."""
+
+    def rate(key: tuple[bytes, bytes]) -> float | None:
+        if key not in before or key not in now:
+            return None
+        return round(max(now[key] - before[key], 0) / elapsed, 1)
+
+    return TcpRates(window_s=round(elapsed, 3), **{field: rate(key) for field, key in _TCP_RATES.items()})
+
+
+def tcp_data(
+    before: _Counters,
+    now: _Counters,
+    elapsed: float,
+    states: Counter[int],
+    source: str | None,
+) -> TcpData:
+    """Build TCP health from two counter samples and a socket state census."""
+    rates = _tcp_rates(before, now, elapsed)
+    retrans_percent = None
+    if rates.retrans_segs_per_s is not None and rates.out_segs_per_s:
+        retrans_percent = round(rates.retrans_segs_per_s / rates.out_segs_per_s * 100.0, 2)
+    return TcpData(
+        available=bool(now) or source is not None,
+        state_source=source,
+        sockets=sum(states.values()),
+        established=now.get((b"Tcp", b"CurrEstab")),
+        retrans_percent=retrans_percent,
+        states={TCP_STATES.get(state, str(state)): count for state, count in states.most_common()},
+        rates=rates,
+    )
+
+
+def collect_tcp() -> TcpData:
+    """Collect TCP socket state counts and retransmit, reset and listen-queue rates."""
+    before, now, elapsed = _BASELINE.pair()
+    states, source = tcp_state_counts()
+    return tcp_data(before, now, elapsed, states, source)
@@ -0,0 +1,185 @@
+"""Thermal-throttle event counts and RAPL energy-based power per CPU package."""
+
+from __future__ import annotations
+
+import os
+
+from sysmatrix.models import PackageThermal, ThermalData
+from sysmatrix.utils.sampling import CounterBaseline
+
+CPU_ROOT = "/sys/devices/system/cpu"
+POWERCAP_ROOT = "/sys/class/powercap"
+# RAPL subzones reported per package, by their sysfs ``name``.
+_RAPL_DOMAINS = ("package", "core", "dram")
+
+# Throttle sample: package -> (summed core_throttle_count, package_throttle_count)
+_ThrottleSample = dict[int, tuple[int | None, int | None]]
+# RAPL sample: (package, domain) -> (energy_uj, max_energy_range_uj)
+_RaplSample = dict[tuple[int, str], tuple[int, int]]
+
+
+def _read(path: str) -> bytes:
+    """Read a small sysfs file with a raw fd."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 4096)
+    finally:
+        os.close(fd)
+
+
+def _read_int(path: str) -> int | None:
+    """Read one integer attribute, or None if it is missing or unreadable."""
+    try:
+        return int(_read(path))
+    except (OSError, ValueError):
+        return None
+
+
+def _cpus() -> list[str]:
+    """Return ``cpuN`` directory names."""
+    try:
+        names = os.listdir(CPU_ROOT)
+    except OSError:
+        return []
+    return [name for name in names if name.startswith("cpu") and name[3:].isdigit()]
+
+
+def _sample_throttle() -> _ThrottleSample:
+    """Sum core throttle events once per physical core and read each package's count.
+
+    ``core_throttle_count`` is shared by SMT siblings and
+    ``package_throttle_count`` by every CPU of a package, so each is counted
+    once per (package, core) and once per package respectively.
+    """
+    cores: dict[tuple[int, int], int] = {}
+    packages: dict[int, int | None] = {}
+    for cpu in _cpus():
+        base = f"{CPU_ROOT}/{cpu}"
+        package = _read_int(f"{base}/topology/physical_package_id")
+        core = _read_int(f"{base}/topology/core_id")
+        if package is None or core is None:
+            continue
+        core_count = _read_int(f"{base}/thermal_throttle/core_throttle_count")
+        if core_count is not None:
+            cores.setdefault((package, core), core_count)
+        if packages.get(package) is None:
+            packages[package] = _read_int(f"{base}/thermal_throttle/package_throttle_count")
+    sample: _ThrottleSample = {}
+    for package, package_count in packages.items():
+        counts = [count for (pkg, _core), count in cores.items() if pkg == package]
+        sample[package] = (sum(counts) if counts else None, package_count)
+    return sample
+
+
+def _zone_name(zone: str) -> str | None:
+    try:
+        return _read(f"{POWERCAP_ROOT}/{zone}/name").decode("ascii", "ignore").strip()
+    except OSError:
+        return None
+
+
+def _sample_rapl() -> _RaplSample:
+    """Read energy counters of RAPL package zones and their core/DRAM subzones.
+
+    Top-level zones are named ``package-N``; subzones ``intel-rapl:N:M``
+    inherit the package of zone ``N``. Platform (``psys``) and MMIO zones
+    are skipped. ``energy_uj`` is root-only on recent kernels, in which case
+    the sample is empty.
+    """
+    try:
+        zones = sorted(name for name in os.listdir(POWERCAP_ROOT) if name.startswith("intel-rapl:"))
+    except OSError:
+        return {}
+    packages: dict[str, int] = {}
+    sample: _RaplSample = {}
+    for zone in zones:
+        parts = zone.split(":")
+        name = _zone_name(zone)
+        if name is None:
+            continue
+        if len(parts) == 2:
+            if not name.startswith("package-") or not name[8:].isdigit():
+                continue
+            package, domain = int(name[8:]), "package"
+            packages[parts[1]] = package
+        elif parts[1] in packages and name in _RAPL_DOMAINS:
+            package, domain = packages[parts[1]], name
+        else:
+            continue
+        energy = _read_int(f"{POWERCAP_ROOT}/{zone}/energy_uj")
+        max_range = _read_int(f"{POWERCAP_ROOT}/{zone}/max_energy_range_uj")
+        if energy is not None:
+            sample[(package, domain)] = (energy, max_range or 0)
+    return sample
+
+
+def _sample() -> tuple[_ThrottleSample, _RaplSample]:
+    return _sample_throttle(), _sample_rapl()
+
+
+_BASELINE: CounterBaseline[tuple[_ThrottleSample, _RaplSample]] = CounterBaseline(_sample, settle_s=0.1)
+
+
+def energy_delta_uj(before: int, now: int, max_range_uj: int) -> int | None:
+    """Return energy used between two ``energy_uj`` readings, allowing one wrap.
+
+    The counter wraps to zero after ``max_energy_range_uj``; without a known
+    range a backwards step cannot be interpreted and yields None.
+    """
+    if now >= before:
+        return now - before
+    if max_range_uj <= 0:
+        return None
+    return now + max_range_uj - before
+
+
+def _count_delta(before: int | None, now: int | None) -> int | None:
+    if before is None or now is None:
+        return None
+    return max(now - before, 0)
+
+
+def _package(
+    package: int,
+    throttle_before: tuple[int | None, int | None] | None,
+    throttle_now: tuple[int | None, int | None] | None,
+    rapl_before: _RaplSample,
+    rapl_now: _RaplSample,
+    elapsed: float,
+) -> PackageThermal:
+    """Build one package's throttle deltas and average power over the window."""
+    before = throttle_before or (None, None)
+    now = throttle_now or (None, None)
+
+    def watts(domain: str) -> float | None:
+        key = (package, domain)
+        if key not in rapl_before or key not in rapl_now:
+            return None
+        delta = energy_delta_uj(rapl_before[key][0], rapl_now[key][0], rapl_now[key][1])
+        return None if delta is None else round(delta / elapsed / 1_000_000, 2)
+
+    return PackageThermal(
+        package=package,
+        core_throttle_events=_count_delta(before[0], now[0]),
+        package_throttle_events=_count_delta(before[1], now[1]),
+        package_watts=watts("package"),
+        core_watts=watts("core"),
+        dram_watts=watts("dram"),
+    )
+
+
+def collect_thermal() -> ThermalData:
+    """Collect throttle-event deltas and RAPL power per CPU package."""
+    (throttle_before, rapl_before), (throttle_now, rapl_now), elapsed = _BASELINE.pair()
+    ids = sorted(set(throttle_now) | {package for package, _domain in rapl_now})
+    packages = [
+        _package(package, throttle_before.get(package), throttle_now.get(package), rapl_before, rapl_now, elapsed)
+        for package in ids
+    ]
+    available = any(
+        value is not None
+        for item in packages
+        for value in (item.core_throttle_events, item.package_throttle_events, item.package_watts)
+    )
+    return ThermalData(available=available, window_s=round(elapsed, 3), packages=packages if available else [])
+
@@ -1,5 +1,7 @@
 """Runtime configuration model derived from CLI arguments."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 
 
@@ -10,6 +12,13 @@ class RuntimeConfig:
     plain: bool = False
     opsec: bool = False
     json: bool = False
+    json_style: str = "pretty"
     watch: bool = False
-    watch_interval: int = 1
+    watch_interval: float = 1.0
     logo: str = "debian"
+    deadline_s: float | None = None
+    profile: bool = False
+    burst_hz: float | None = None
+    publish: str | None = None
+    include_virtual: bool = False
+    plugins: bool = False
@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 from sysmatrix.models import (
+    CgroupData,
     CpuData,
     GpuData,
+    InterruptData,
     MemoryData,
     MotherboardData,
     NetworkData,
+    NumaData,
     PerformanceData,
+    PressureData,
+    ProcessData,
+    SchedulerData,
     StorageData,
     SystemData,
+    TcpData,
+    ThermalData,
 )
 
 
@@ -95,3 +103,63 @@ def default_performance() -> PerformanceData:
         thermal_status="N/A",
         bottleneck="None detected",
     )
+
+
+def default_processes() -> ProcessData:
+    """Return an empty process summary."""
+    return ProcessData(total=0, running=0, uninterruptible=0, top_cpu=[], top_memory=[], top_io=[])
+
+
+def default_pressure() -> PressureData:
+    """Return a PSI summary marked as unavailable."""
+    return PressureData(available=False, window_s=0.0, system=[], cgroup=[], cgroup_path=None)
+
+
+def default_cgroup() -> CgroupData:
+    """Return a cgroup summary with no detected hierarchy."""
+    return CgroupData(
+        path=None,
+        memory_max_bytes=None,
+        memory_current_bytes=None,
+        memory_usage_percent=None,
+        cpu_quota_cores=None,
+        effective_cpus=None,
+        cpu_usage_percent=None,
+        throttled_usec=None,
+        throttled_periods_percent=None,
+    )
+
+
+def default_numa() -> NumaData:
+    """Return a NUMA summary with no nodes detected."""
+    return NumaData(available=False, window_s=0.0)
+
+
+def default_thermal() -> ThermalData:
+    """Return a thermal summary with no throttle or RAPL counters detected."""
+    return ThermalData(available=False, window_s=0.0)
+
+
+def default_interrupts() -> InterruptData:
+    """Return an interrupt summary marked as unavailable."""
+    return InterruptData(available=False, window_s=0.0, cpu_count=0, irq_per_s=0.0, softirq_per_s=0.0)
+
+
+def default_scheduler() -> SchedulerData:
+    """Return a scheduler summary marked as unavailable."""
+    return SchedulerData(
+        available=False,
+        window_s=0.0,
+        cpu_count=0,
+        context_switches_per_s=None,
+        forks_per_s=None,
+        procs_running=None,
+        procs_blocked=None,
+        run_queue_wait_ms_per_s=None,
+        avg_wait_us=None,
+    )
+
+
+def default_tcp() -> TcpData:
+    """Return a TCP summary marked as unavailable."""
+    return TcpData(available=False, state_source=None, sockets=0, established=None, retrans_percent=None)
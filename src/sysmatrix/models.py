@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import types
+import typing
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields, is_dataclass
 
+# Field metadata marking values that --opsec replaces with REDACTED.
+SENSITIVE = {"sensitive": True}
+REDACTED = "[REDACTED]"
 
-@dataclass
+
+@dataclass(slots=True)
 class SystemData:
     """Basic host and runtime identity data."""
-    user: str
-    hostname: str
+    user: str = field(metadata=SENSITIVE)
+    hostname: str = field(metadata=SENSITIVE)
     os: str
     kernel: str
     arch: str
@@ -17,15 +24,51 @@ class SystemData:
     shell: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CpuData:
     """CPU model and utilization fields."""
     model: str
     cores: int
     usage_percent: float
+    iowait_percent: float | None = None
+    steal_percent: float | None = None
+
+
+@dataclass(slots=True)
+class MemoryBreakdown:
+    """Detailed /proc/meminfo fields; None when the kernel does not report one."""
+    free_mb: float | None
+    available_mb: float | None
+    cached_mb: float | None
+    buffers_mb: float | None
+    dirty_mb: float | None
+    writeback_mb: float | None
+    anon_mb: float | None
+    shmem_mb: float | None
+    slab_mb: float | None
+    slab_reclaimable_mb: float | None
+    anon_huge_mb: float | None
+    hugepages_total: int | None
+    hugepages_free: int | None
+    hugepage_size_kb: int | None
+    zswap_mb: float | None
+    zswapped_mb: float | None
+
 
+@dataclass(slots=True)
+class VmstatRates:
+    """Paging, swapping and reclaim rates from /proc/vmstat deltas."""
+    window_s: float
+    pgfault_per_s: float | None
+    pgmajfault_per_s: float | None
+    pswpin_per_s: float | None
+    pswpout_per_s: float | None
+    direct_reclaim_pages_per_s: float | None
+    allocstall_per_s: float | None
+    compact_stall_per_s: float | None
 
-@dataclass
+
+@dataclass(slots=True)
 class MemoryData:
     """Memory and swap capacity/usage fields."""
     total_gb: float
@@ -33,9 +76,11 @@ class MemoryData:
     usage_percent: float
     swap_total_gb: float
     swap_used_gb: float
+    breakdown: MemoryBreakdown | None = None
+    vmstat: VmstatRates | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GpuData:
     """GPU identity and telemetry fields."""
     vendor: str
@@ -48,7 +93,7 @@ class GpuData:
     fan_rpm: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageData:
     """Storage capacity and health fields."""
     root_mount: str
@@ -60,7 +105,7 @@ class StorageData:
     wear_percent: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class MotherboardData:
     """Motherboard identity and VRM telemetry."""
     vendor: str
@@ -68,17 +113,38 @@ class MotherboardData:
     vrm_temp_c: float | None
 
 
-@dataclass
+@dataclass(slots=True)
+class InterfaceStats:
+    """Per-interface traffic counters and sampled rates."""
+    name: str
+    virtual: bool
+    rx_bytes: int
+    tx_bytes: int
+    rx_bytes_per_s: float
+    tx_bytes_per_s: float
+    rx_packets_per_s: float
+    tx_packets_per_s: float
+    rx_errors: int
+    tx_errors: int
+    rx_dropped: int
+    tx_dropped: int
+    speed_mbps: int | None
+    utilization_percent: float | None
+    addresses: list[str] = field(default_factory=list, metadata=SENSITIVE)
+
+
+@dataclass(slots=True)
 class NetworkData:
     """Network state and adapter metadata."""
-    ip: str
+    ip: str = field(metadata=SENSITIVE)
     interface: str
     throughput: str
     wifi_chipset: str
     bluetooth_chipset: str
+    interfaces: list[InterfaceStats] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceData:
     """Derived performance metrics and heuristics."""
     load_average: str
@@ -86,9 +152,237 @@ class PerformanceData:
     thermal_headroom_c: float | None
     thermal_status: str
     bottleneck: str
+    throttle_events: int | None = None
+
+
+@dataclass(slots=True)
+class NumaNode:
+    """Memory and allocation locality of one NUMA node."""
+    node: int
+    cpus: int
+    mem_total_mb: float | None
+    mem_free_mb: float | None
+    mem_used_percent: float | None
+    numa_hit_per_s: float | None
+    numa_miss_per_s: float | None
+    numa_foreign_per_s: float | None
+    other_node_per_s: float | None
+    local_percent: float | None
+
+
+@dataclass(slots=True)
+class NumaData:
+    """Per-node NUMA memory and numastat rates."""
+    available: bool
+    window_s: float
+    nodes: list[NumaNode] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PackageThermal:
+    """Throttle events and RAPL power of one CPU package over the sample window."""
+    package: int
+    core_throttle_events: int | None
+    package_throttle_events: int | None
+    package_watts: float | None
+    core_watts: float | None
+    dram_watts: float | None
+
+
+@dataclass(slots=True)
+class ThermalData:
+    """Per-package thermal-throttle deltas and RAPL power."""
+    available: bool
+    window_s: float
+    packages: list[PackageThermal] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class CpuInterrupts:
+    """Hardware interrupt and softirq rates handled by one CPU."""
+    cpu: int
+    irq_per_s: float
+    softirq_per_s: float
+    share_percent: float
+
+
+@dataclass(slots=True)
+class InterruptSource:
+    """One IRQ line or softirq type and the CPU that handles most of it."""
+    kind: str
+    name: str
+    description: str
+    per_s: float
+    top_cpu: int
+    top_cpu_percent: float
+
+
+@dataclass(slots=True)
+class InterruptData:
+    """Interrupt distribution across CPUs: totals, hot CPUs and imbalanced sources."""
+    available: bool
+    window_s: float
+    cpu_count: int
+    irq_per_s: float
+    softirq_per_s: float
+    hot_cpus: list[CpuInterrupts] = field(default_factory=list)
+    imbalanced: list[InterruptSource] = field(default_factory=list)
+    top_sources: list[InterruptSource] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SchedCpu:
+    """Run-queue wait on one CPU over the sample window."""
+    cpu: int
+    wait_ms_per_s: float
+    avg_wait_us: float | None
+    timeslices_per_s: float
+
+
+@dataclass(slots=True)
+class SchedulerData:
+    """Scheduler activity: switch/fork rates, runnable tasks and run-queue wait."""
+    available: bool
+    window_s: float
+    cpu_count: int
+    context_switches_per_s: float | None
+    forks_per_s: float | None
+    procs_running: int | None
+    procs_blocked: int | None
+    run_queue_wait_ms_per_s: float | None
+    avg_wait_us: float | None
+    top_wait_cpus: list[SchedCpu] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class TcpRates:
+    """TCP open, reset, retransmit and listen-queue rates from /proc/net/snmp and netstat deltas."""
+    window_s: float
+    active_opens_per_s: float | None
+    passive_opens_per_s: float | None
+    attempt_fails_per_s: float | None
+    estab_resets_per_s: float | None
+    resets_sent_per_s: float | None
+    in_segs_per_s: float | None
+    out_segs_per_s: float | None
+    retrans_segs_per_s: float | None
+    in_errs_per_s: float | None
+    listen_overflows_per_s: float | None
+    listen_drops_per_s: float | None
+    syn_retrans_per_s: float | None
+    timeouts_per_s: float | None
+    syncookies_sent_per_s: float | None
+
+
+@dataclass(slots=True)
+class TcpData:
+    """TCP health: socket counts by state and protocol error rates."""
+    available: bool
+    state_source: str | None
+    sockets: int
+    established: int | None
+    retrans_percent: float | None
+    states: dict[str, int] = field(default_factory=dict)
+    rates: TcpRates | None = None
 
 
-@dataclass
+@dataclass(slots=True)
+class BurstData:
+    """Peaks seen by the high-frequency sampler over one watch tick."""
+    hz: float
+    samples: int
+    window_s: float
+    cpu_peak_percent: float | None
+    memory_peak_percent: float | None
+    rx_peak_bytes_per_s: float | None
+    tx_peak_bytes_per_s: float | None
+
+
+@dataclass(slots=True)
+class ProcessStats:
+    """Per-process CPU, memory, and I/O rates."""
+    pid: int
+    name: str
+    state: str
+    cpu_percent: float
+    rss_mb: float
+    read_bytes_per_s: float | None
+    write_bytes_per_s: float | None
+
+
+@dataclass(slots=True)
+class ProcessData:
+    """Process counts and top consumers by resource."""
+    total: int
+    running: int
+    uninterruptible: int
+    top_cpu: list[ProcessStats]
+    top_memory: list[ProcessStats]
+    top_io: list[ProcessStats]
+
+
+@dataclass(slots=True)
+class PressureStats:
+    """PSI averages and stall-time deltas for one resource."""
+    resource: str
+    some_avg10: float
+    some_avg60: float
+    some_stall_us: int | None
+    full_avg10: float | None
+    full_avg60: float | None
+    full_stall_us: int | None
+
+
+@dataclass(slots=True)
+class PressureData:
+    """Pressure stall information for the host and the current cgroup."""
+    available: bool
+    window_s: float
+    system: list[PressureStats]
+    cgroup: list[PressureStats]
+    cgroup_path: str | None
+
+
+@dataclass(slots=True)
+class CgroupData:
+    """cgroup v2 limits and usage relative to the container's budget."""
+    path: str | None
+    memory_max_bytes: int | None
+    memory_current_bytes: int | None
+    memory_usage_percent: float | None
+    cpu_quota_cores: float | None
+    effective_cpus: int | None
+    cpu_usage_percent: float | None
+    throttled_usec: int | None
+    throttled_periods_percent: float | None
+
+
+@dataclass(slots=True)
+class DomainStatus:
+    """Freshness of one snapshot domain: fresh, cached (static), stale, or fallback."""
+    state: str
+    age_s: float | None = None
+    duration_ms: float | None = None
+
+
+@dataclass(slots=True)
+class ToolStatus:
+    """Failure and backoff state of an external command."""
+    path: str | None
+    failures: int
+    last_error: str | None
+    retry_in_s: float | None
+
+
+@dataclass(slots=True)
+class SnapshotMeta:
+    """Collection metadata attached to a snapshot."""
+    domains: dict[str, DomainStatus] = field(default_factory=dict)
+    tools: dict[str, ToolStatus] = field(default_factory=dict)
+    elapsed_ms: float | None = None
+
+
+@dataclass(slots=True)
 class Snapshot:
     """Top-level aggregate snapshot of all domains."""
     system: SystemData
@@ -99,7 +393,93 @@ class Snapshot:
     motherboard: MotherboardData
     network: NetworkData
     performance: PerformanceData
+    processes: ProcessData | None = None
+    pressure: PressureData | None = None
+    cgroup: CgroupData | None = None
+    numa: NumaData | None = None
+    thermal: ThermalData | None = None
+    interrupts: InterruptData | None = None
+    scheduler: SchedulerData | None = None
+    tcp: TcpData | None = None
+    burst: BurstData | None = None
+    extra: dict[str, object] = field(default_factory=dict)
+    meta: SnapshotMeta = field(default_factory=SnapshotMeta)
+
+    def to_dict(self, redact: bool = False) -> dict:
+        """Serialize to nested dictionaries, redacting sensitive fields if asked.
+
+        Unlike ``dataclasses.asdict`` nothing is deep-copied: lists of plain
+        values are shared with the snapshot.
+        """
+        return serializer(Snapshot)(self, redact)
+
+
+_Serializer = Callable[[object, bool], dict]
+_SERIALIZERS: dict[type, _Serializer] = {}
+
+
+def _model_type(hint: object) -> type | None:
+    """Return the dataclass in ``X`` or ``X | None``, else None."""
+    if isinstance(hint, types.UnionType):
+        members = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        hint = members[0] if len(members) == 1 else None
+    return hint if isinstance(hint, type) and is_dataclass(hint) else None
+
+
+def _plain(value: object, redact: bool) -> object:
+    """Serialize a value whose type is only known at runtime (plugin domains)."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return serializer(type(value))(value, redact)
+    if isinstance(value, (list, tuple)):
+        return [_plain(item, redact) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item, redact) for key, item in value.items()}
+    return value
+
+
+def _field_expr(name: str, hint: object, sensitive: bool, namespace: dict[str, object]) -> str:
+    """Return the source expression that serializes ``obj.<name>``."""
+    value = f"obj.{name}"
+    model = _model_type(hint)
+    if model is not None:
+        namespace[f"_{model.__name__}"] = serializer(model)
+        call = f"_{model.__name__}({value}, redact)"
+        return call if model is hint else f"(None if {value} is None else {call})"
+    origin, args = typing.get_origin(hint), typing.get_args(hint)
+    if origin is list and args and _model_type(args[0]) is not None:
+        item = args[0].__name__
+        namespace[f"_{item}"] = serializer(args[0])
+        return f"[_{item}(item, redact) for item in {value}]"
+    if origin is dict and len(args) == 2 and _model_type(args[1]) is not None:
+        item = args[1].__name__
+        namespace[f"_{item}"] = serializer(args[1])
+        return f"{{key: _{item}(item, redact) for key, item in {value}.items()}}"
+    if origin is dict and len(args) == 2 and args[1] is object:
+        namespace["_plain"] = _plain
+        return f"{{key: _plain(item, redact) for key, item in {value}.items()}}"
+    if sensitive:
+        if origin is list:
+            return f"([REDACTED] * len({value}) if redact else {value})"
+        return f"(REDACTED if redact else {value})"
+    return value
+
+
+def serializer(cls: type) -> _Serializer:
+    """Return a generated ``(obj, redact) -> dict`` function for a model class.
 
-    def to_dict(self) -> dict:
-        """Serialize snapshot dataclasses to nested dictionaries."""
-        return asdict(self)
+    The function is compiled once per class with one dict display per model,
+    so serializing a snapshot costs no reflection and no intermediate copies.
+    """
+    cached = _SERIALIZERS.get(cls)
+    if cached is not None:
+        return cached
+    hints = typing.get_type_hints(cls)
+    namespace: dict[str, object] = {"REDACTED": REDACTED}
+    items = [
+        f"{item.name!r}: {_field_expr(item.name, hints[item.name], bool(item.metadata.get('sensitive')), namespace)}"
+        for item in fields(cls)
+    ]
+    source = f"def _serialize(obj, redact):\n    return {{{', '.join(items)}}}\n"
+    exec(compile(source, f"<serializer {cls.__name__}>", "exec"), namespace)
+    _SERIALIZERS[cls] = namespace["_serialize"]  # type: ignore[assignment]
+    return _SERIALIZERS[cls]
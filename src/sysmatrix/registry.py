@@ -0,0 +1,168 @@
+"""Collector metadata, dependency planning and third-party collector plugins.
+
+Each snapshot domain is described by a ``CollectorSpec``: its collector and
+fallback, the domains it consumes, a cost class and whether its value is
+static for the life of the process. The snapshot engine, ``sysmatrix
+check`` and watch mode all plan from these specs.
+
+Third-party packages add domains through the ``sysmatrix.collectors``
+entry-point group. An entry point may name a ``CollectorSpec``, an iterable
+of specs, or a callable returning either::
+
+    [project.entry-points."sysmatrix.collectors"]
+    ups = "sysmatrix_ups:SPEC"
+
+Plugin domains are reported under ``Snapshot.extra``. Scanning entry
+points imports ``importlib.metadata`` and reads every installed
+distribution's metadata, so it only happens once ``load_plugins`` is called
+(the CLI's ``--plugins``); snapshots otherwise only see specs added with
+``register_collector``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+LOGGER = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "sysmatrix.collectors"
+
+# Cost classes, cheapest first.
+CHEAP = "cheap"  # procfs/sysfs reads only
+SAMPLING = "sampling"  # rates from a CounterBaseline; waits for the shared settle window
+SUBPROCESS = "subprocess"  # runs external tools
+PRIVILEGED = "privileged"  # needs root for complete data (e.g. smartctl)
+COST_CLASSES = (CHEAP, SAMPLING, SUBPROCESS, PRIVILEGED)
+
+
+def _no_value() -> None:
+    """Fallback for collectors that do not declare one."""
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class CollectorSpec:
+    """How to collect one snapshot domain.
+
+    ``collect`` may be sync or async and receives each dependency's value as
+    a keyword argument named after that domain. Sync collectors run in a
+    worker thread. A ``static`` domain is collected once per process and
+    reused by later snapshots.
+    """
+
+    domain: str
+    collect: Callable[..., object]
+    fallback: Callable[[], object] = _no_value
+    depends: tuple[str, ...] = ()
+    cost: str = CHEAP
+    static: bool = False
+
+    def __post_init__(self) -> None:
+        if self.cost not in COST_CLASSES:
+            raise ValueError(f"unknown cost class {self.cost!r} for domain {self.domain!r}")
+        if not self.domain.isidentifier():
+            raise ValueError(f"invalid domain name {self.domain!r}")
+
+
+_LOCK = threading.Lock()
+_REGISTERED: dict[str, CollectorSpec] = {}
+_PLUGINS: list[CollectorSpec] | None = None
+
+
+def register_collector(spec: CollectorSpec) -> None:
+    """Register an extra collector programmatically (replacing one of the same domain)."""
+    with _LOCK:
+        _REGISTERED[spec.domain] = spec
+
+
+def unregister_collector(domain: str) -> None:
+    """Remove a collector added with ``register_collector``."""
+    with _LOCK:
+        _REGISTERED.pop(domain, None)
+
+
+def _specs_from(obj: object) -> list[CollectorSpec]:
+    """Normalize an entry point's target to a list of specs."""
+    if callable(obj) and not isinstance(obj, CollectorSpec):
+        obj = obj()
+    if isinstance(obj, CollectorSpec):
+        return [obj]
+    if isinstance(obj, Iterable):
+        specs = list(obj)
+        if all(isinstance(spec, CollectorSpec) for spec in specs):
+            return specs
+    raise TypeError(f"expected CollectorSpec(s), got {type(obj).__name__}")
+
+
+def _load_entry_points() -> list[CollectorSpec]:
+    """Load every ``sysmatrix.collectors`` entry point, skipping broken ones."""
+    from importlib.metadata import entry_points
+
+    specs: list[CollectorSpec] = []
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            specs.extend(_specs_from(entry_point.load()))
+        except Exception:
+            LOGGER.warning("could not load collector plugin %r", entry_point.value, exc_info=True)
+    return specs
+
+
+def load_plugins() -> list[CollectorSpec]:
+    """Scan the entry-point group (once per process) and return its specs."""
+    global _PLUGINS
+    with _LOCK:
+        if _PLUGINS is None:
+            _PLUGINS = _load_entry_points()
+        return list(_PLUGINS)
+
+
+def plugin_specs() -> list[CollectorSpec]:
+    """Return loaded entry-point specs followed by registered ones, without scanning."""
+    with _LOCK:
+        return [*(_PLUGINS or ()), *_REGISTERED.values()]
+
+
+def reload_plugins() -> None:
+    """Forget loaded entry points so the next ``load_plugins`` scans them again."""
+    global _PLUGINS
+    with _LOCK:
+        _PLUGINS = None
+
+
+def plan(specs: dict[str, CollectorSpec], wanted: Iterable[str]) -> list[str]:
+    """Return ``wanted`` plus transitive dependencies in dependency order.
+
+    Ties keep the order of ``specs``, so built-in domains stay in schema
+    order. Raises ``ValueError`` for unknown domains or dependency cycles.
+    """
+    wanted = list(wanted)
+    unknown = sorted(set(wanted) - set(specs))
+    if unknown:
+        raise ValueError(f"unknown snapshot domain(s): {', '.join(unknown)}")
+
+    needed: set[str] = set()
+    stack = list(wanted)
+    while stack:
+        domain = stack.pop()
+        if domain in needed:
+            continue
+        needed.add(domain)
+        for dep in specs[domain].depends:
+            if dep not in specs:
+                raise ValueError(f"domain {domain!r} depends on unknown domain {dep!r}")
+            stack.append(dep)
+
+    order: list[str] = []
+    placed: set[str] = set()
+    remaining = [domain for domain in specs if domain in needed]
+    while remaining:
+        ready = [domain for domain in remaining if placed.issuperset(specs[domain].depends)]
+        if not ready:
+            raise ValueError(f"dependency cycle between domains: {', '.join(remaining)}")
+        order.extend(ready)
+        placed.update(ready)
+        remaining = [domain for domain in remaining if domain not in placed]
+    return order
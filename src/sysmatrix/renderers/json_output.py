@@ -3,16 +3,64 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 
 from sysmatrix.config import RuntimeConfig
 from sysmatrix.models import Snapshot
-from sysmatrix.utils.formatting import maybe_redact
+
+JSON_STYLES = ("pretty", "compact")
+
+# style -> encoder returning UTF-8 bytes without a trailing newline.
+_Encoder = Callable[[dict, str], bytes]
+
+
+def _encode_stdlib(data: dict, style: str) -> bytes:
+    """Encode with the standard library ``json`` module."""
+    if style == "compact":
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+def _encode_orjson(data: dict, style: str) -> bytes:
+    """Encode with ``orjson`` (install the ``fast`` extra)."""
+    import orjson
+
+    if style == "compact":
+        return orjson.dumps(data)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+
+JSON_BACKENDS: dict[str, _Encoder] = {"json": _encode_stdlib, "orjson": _encode_orjson}
+_DEFAULT_BACKEND: str | None = None
+
+
+def default_backend() -> str:
+    """Return ``orjson`` when it is importable, else the stdlib ``json``."""
+    global _DEFAULT_BACKEND
+    if _DEFAULT_BACKEND is None:
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            _DEFAULT_BACKEND = "json"
+        else:
+            _DEFAULT_BACKEND = "orjson"
+    return _DEFAULT_BACKEND
+
+
+def encode_json(data: dict, style: str = "pretty", backend: str | None = None) -> bytes:
+    """Encode a snapshot dict in the given style with the chosen backend.
+
+    ``pretty`` is indented with sorted keys; ``compact`` has no whitespace
+    and keeps the schema's field order.
+    """
+    return JSON_BACKENDS[backend or default_backend()](data, style)
+
+
+def render_json_bytes(snapshot: Snapshot, config: RuntimeConfig) -> bytes:
+    """Render snapshot data as UTF-8 JSON with optional redaction."""
+    return encode_json(snapshot.to_dict(redact=config.opsec), config.json_style)
 
 
 def render_json(snapshot: Snapshot, config: RuntimeConfig) -> str:
-    """Render snapshot data as formatted JSON with optional redaction."""
-    data = snapshot.to_dict()
-    data["system"]["user"] = maybe_redact(data["system"]["user"], config.opsec)
-    data["system"]["hostname"] = maybe_redact(data["system"]["hostname"], config.opsec)
-    data["network"]["ip"] = maybe_redact(data["network"]["ip"], config.opsec)
-    return json.dumps(data, indent=2, sort_keys=True)
+    """Render snapshot data as JSON text with optional redaction."""
+    return render_json_bytes(snapshot, config).decode("utf-8")
@@ -0,0 +1,25 @@
+"""Collection profile renderer for ``--profile``."""
+
+from __future__ import annotations
+
+from sysmatrix.models import Snapshot
+
+
+def render_profile(snapshot: Snapshot) -> str:
+    """Render per-domain timings and external tool backoff state."""
+    meta = snapshot.meta
+    total = "N/A" if meta.elapsed_ms is None else f"{meta.elapsed_ms:.1f} ms"
+    lines = ["PROFILE", f"Total: {total}"]
+    for domain, status in sorted(
+        meta.domains.items(),
+        key=lambda item: item[1].duration_ms or 0.0,
+        reverse=True,
+    ):
+        duration = "N/A" if status.duration_ms is None else f"{status.duration_ms:.1f} ms"
+        lines.append(f"  {domain:<12} {duration:>10}  {status.state}")
+    if meta.tools:
+        lines.append("Tools:")
+        for command, tool in meta.tools.items():
+            retry = "" if tool.retry_in_s is None else f", retry in {tool.retry_in_s:.0f}s"
+            lines.append(f"  {command}: {tool.last_error} x{tool.failures}{retry}")
+    return "\n".join(lines)
@@ -0,0 +1,82 @@
+"""Incremental terminal frame writer used by watch mode."""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+from typing import TextIO
+
+CLEAR = "\033[2J\033[H"
+CLEAR_LINE = "\033[K"
+_ANSI = re.compile(r"\033\[[0-9;]*[A-Za-z]")
+
+
+def _visible_len(line: str) -> int:
+    """Return the printed width of ``line`` ignoring ANSI escape sequences."""
+    return len(_ANSI.sub("", line))
+
+
+def _clip_line(line: str, width: int) -> str:
+    """Cut ``line`` to ``width`` printed columns, keeping every escape sequence."""
+    if _visible_len(line) <= width:
+        return line
+    out = []
+    visible = pos = 0
+    for match in _ANSI.finditer(line):
+        text = line[pos : match.start()][: width - visible]
+        out.append(text)
+        visible += len(text)
+        out.append(match.group())
+        pos = match.end()
+    out.append(line[pos:][: width - visible])
+    return "".join(out)
+
+
+class DiffScreen:
+    """Redraw only the lines that changed since the previous frame.
+
+    On a TTY each frame is clipped to the terminal (rows past the last but
+    one are dropped and lines are cut at the right edge, escape sequences
+    kept), so rows always map to screen lines and the frame never wraps or
+    scrolls. The first frame and frames after a terminal resize are drawn
+    in full. Non-TTY streams always get full, unclipped redraws.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self._tty = stream.isatty()
+        self._previous: list[str] | None = None
+        self._size: os.terminal_size | None = None
+
+    @staticmethod
+    def _clip(lines: list[str], size: os.terminal_size) -> list[str]:
+        # The last row stays free for the cursor, so a full redraw never scrolls.
+        return [_clip_line(line, size.columns) for line in lines[: max(size.lines - 1, 1)]]
+
+    def draw(self, frame: str) -> None:
+        """Write ``frame`` and remember it as the baseline for the next diff."""
+        lines = frame.split("\n")
+        size = shutil.get_terminal_size() if self._tty else None
+        if size is not None:
+            lines = self._clip(lines, size)
+        if self._previous is not None and size is not None and size == self._size:
+            out = self._diff(self._previous, lines)
+        else:
+            out = [CLEAR, "\n".join(lines), "\n"]
+        self._stream.write("".join(out))
+        self._stream.flush()
+        self._previous, self._size = lines, size
+
+    @staticmethod
+    def _diff(previous: list[str], lines: list[str]) -> list[str]:
+        out = []
+        for row, line in enumerate(lines, start=1):
+            if row > len(previous) or previous[row - 1] != line:
+                # Clear first: erasing after a full-width line would eat its last cell.
+                out.append(f"\033[{row};1H{CLEAR_LINE}{line}")
+        for row in range(len(lines) + 1, len(previous) + 1):
+            out.append(f"\033[{row};1H{CLEAR_LINE}")
+        # Park the cursor below the frame, where a full redraw would leave it.
+        out.append(f"\033[{len(lines) + 1};1H")
+        return out
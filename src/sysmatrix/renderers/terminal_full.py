@@ -3,10 +3,307 @@
 from __future__ import annotations
 
 from sysmatrix.config import RuntimeConfig
-from sysmatrix.models import Snapshot
+from sysmatrix.models import (
+    BurstData,
+    CgroupData,
+    InterfaceStats,
+    InterruptData,
+    MemoryData,
+    NumaData,
+    PressureData,
+    PressureStats,
+    ProcessData,
+    ProcessStats,
+    SchedulerData,
+    Snapshot,
+    TcpData,
+    ThermalData,
+)
 from sysmatrix.utils.formatting import color_usage, maybe_redact
 
 
+def _interface_lines(interfaces: list[InterfaceStats], opsec: bool) -> list[str]:
+    """Render one traffic line per reported network interface."""
+    lines = []
+    for item in interfaces:
+        addresses = ", ".join(maybe_redact(addr, opsec) for addr in item.addresses) or "N/A"
+        util = (
+            "N/A"
+            if item.utilization_percent is None
+            else f"{item.utilization_percent:.1f}% of {item.speed_mbps} Mb/s"
+        )
+        lines.append(
+            f"  {item.name}: down {item.rx_bytes_per_s / 1024 / 1024:.2f} MB/s"
+            f" | up {item.tx_bytes_per_s / 1024 / 1024:.2f} MB/s"
+            f" | Util: {util}"
+            f" | Err: {item.rx_errors}/{item.tx_errors} | Drop: {item.rx_dropped}/{item.tx_dropped}"
+            f" | Addr: {addresses}"
+        )
+    return lines
+
+
+def _top_list(items: list[ProcessStats], value: str) -> str:
+    """Format a top-N process list as ``name(pid) value`` entries."""
+    return ", ".join(f"{item.name}({item.pid}) {value.format(item=item)}" for item in items) or "N/A"
+
+
+def _process_lines(processes: ProcessData | None) -> list[str]:
+    """Render the process summary section, if collected."""
+    if processes is None:
+        return []
+    return [
+        "",
+        "PROCESSES",
+        (
+            f"Total: {processes.total} | Running: {processes.running} "
+            f"| Uninterruptible (D): {processes.uninterruptible}"
+        ),
+        "Top CPU: " + _top_list(processes.top_cpu, "{item.cpu_percent:.1f}%"),
+        "Top Memory: " + _top_list(processes.top_memory, "{item.rss_mb:.1f} MiB"),
+        "Top I/O: "
+        + _top_list(
+            processes.top_io,
+            "{item.read_bytes_per_s:.0f}/{item.write_bytes_per_s:.0f} B/s",
+        ),
+    ]
+
+
+def _pct(value: float | None) -> str:
+    """Format an optional percentage."""
+    return "N/A" if value is None else f"{value:.1f}%"
+
+
+def _pressure_line(stats: PressureStats, window_s: float) -> str:
+    """Format PSI averages and the stall time seen during sampling."""
+    line = f"  {stats.resource}: some {stats.some_avg10:.1f}/{stats.some_avg60:.1f}%"
+    if stats.full_avg10 is not None and stats.full_avg60 is not None:
+        line += f" | full {stats.full_avg10:.1f}/{stats.full_avg60:.1f}%"
+    if stats.some_stall_us is not None:
+        line += f" | stalled {stats.some_stall_us / 1000:.1f} ms in {window_s:.2f}s"
+    return line
+
+
+def _pressure_lines(pressure: PressureData | None) -> list[str]:
+    """Render PSI for the host and, when present, the current cgroup."""
+    if pressure is None or not pressure.available:
+        return []
+    lines = ["", "PRESSURE (avg10/avg60)"]
+    lines.extend(_pressure_line(stats, pressure.window_s) for stats in pressure.system)
+    if pressure.cgroup:
+        lines.append(f"cgroup {pressure.cgroup_path}:")
+        lines.extend(_pressure_line(stats, pressure.window_s) for stats in pressure.cgroup)
+    return lines
+
+
+def _cgroup_lines(cgroup: CgroupData | None) -> list[str]:
+    """Render container limits and usage when running under cgroup v2."""
+    if cgroup is None or cgroup.path is None:
+        return []
+    if cgroup.memory_max_bytes is None:
+        memory_limit = "unlimited"
+    else:
+        memory_limit = f"{cgroup.memory_max_bytes / 1024 / 1024 / 1024:.1f} GiB"
+    memory_used = (
+        "N/A"
+        if cgroup.memory_current_bytes is None
+        else f"{cgroup.memory_current_bytes / 1024 / 1024 / 1024:.1f} GiB"
+    )
+    quota = "unlimited" if cgroup.cpu_quota_cores is None else f"{cgroup.cpu_quota_cores:g} cores"
+    throttled = "N/A" if cgroup.throttled_usec is None else f"{cgroup.throttled_usec / 1000:.1f} ms"
+    return [
+        "",
+        "CONTAINER (cgroup v2)",
+        f"Path: {cgroup.path}",
+        f"Memory: {memory_used}/{memory_limit} ({_pct(cgroup.memory_usage_percent)} of limit)",
+        (
+            f"CPU Quota: {quota} | Effective CPUs: {cgroup.effective_cpus or 'N/A'}"
+            f" | Usage: {_pct(cgroup.cpu_usage_percent)} of limit"
+        ),
+        f"Throttled: {throttled} | Throttled Periods: {_pct(cgroup.throttled_periods_percent)}",
+    ]
+
+
+def _mb(value: float | None) -> str:
+    return "N/A" if value is None else f"{value:.0f} MiB"
+
+
+def _rate(value: float | None) -> str:
+    return "N/A" if value is None else f"{value:.0f}/s"
+
+
+def _memory_detail_lines(mem: MemoryData) -> list[str]:
+    """Render the meminfo breakdown and vmstat paging rates, when collected."""
+    lines = []
+    detail = mem.breakdown
+    if detail is not None:
+        hugepages = (
+            "N/A"
+            if detail.hugepages_total is None
+            else f"{detail.hugepages_free}/{detail.hugepages_total} free"
+        )
+        lines.append(
+            f"  Cached: {_mb(detail.cached_mb)} | Buffers: {_mb(detail.buffers_mb)}"
+            f" | Dirty: {_mb(detail.dirty_mb)} | Writeback: {_mb(detail.writeback_mb)}"
+            f" | Shmem: {_mb(detail.shmem_mb)}"
+        )
+        lines.append(
+            f"  Slab: {_mb(detail.slab_mb)} ({_mb(detail.slab_reclaimable_mb)} reclaimable)"
+            f" | THP: {_mb(detail.anon_huge_mb)} | HugePages: {hugepages}"
+            f" | Zswap: {_mb(detail.zswap_mb)} for {_mb(detail.zswapped_mb)}"
+        )
+    rates = mem.vmstat
+    if rates is not None:
+        lines.append(
+            f"  Faults: {_rate(rates.pgfault_per_s)} (major {_rate(rates.pgmajfault_per_s)})"
+            f" | Swap in: {_rate(rates.pswpin_per_s)} | Swap out: {_rate(rates.pswpout_per_s)}"
+            f" | Direct reclaim (pages): {_rate(rates.direct_reclaim_pages_per_s)}"
+            f" | Alloc stalls: {_rate(rates.allocstall_per_s)}"
+            f" | Compaction stalls: {_rate(rates.compact_stall_per_s)}"
+        )
+    return lines
+
+
+def _numa_lines(numa: NumaData | None) -> list[str]:
+    """Render per-node memory and allocation locality, if NUMA topology is exposed."""
+    if numa is None or not numa.available:
+        return []
+    lines = ["", "NUMA"]
+    for node in numa.nodes:
+        memory = (
+            "N/A"
+            if node.mem_total_mb is None or node.mem_free_mb is None
+            else (
+                f"{node.mem_free_mb / 1024:.1f}/{node.mem_total_mb / 1024:.1f} GiB free"
+                f" ({_pct(node.mem_used_percent)} used)"
+            )
+        )
+        lines.append(
+            f"node{node.node} ({node.cpus} CPUs): {memory} | Local: {_pct(node.local_percent)}"
+            f" | Hit: {_rate(node.numa_hit_per_s)} | Miss: {_rate(node.numa_miss_per_s)}"
+            f" | Foreign: {_rate(node.numa_foreign_per_s)} | Other node: {_rate(node.other_node_per_s)}"
+        )
+    return lines
+
+
+def _watts(value: float | None) -> str:
+    return "N/A" if value is None else f"{value:.1f} W"
+
+
+def _events(value: int | None) -> str:
+    return "N/A" if value is None else str(value)
+
+
+def _thermal_lines(thermal: ThermalData | None) -> list[str]:
+    """Render per-package RAPL power and throttle events, if the counters are exposed."""
+    if thermal is None or not thermal.available:
+        return []
+    lines = ["", "THERMAL / POWER"]
+    for item in thermal.packages:
+        lines.append(
+            f"package{item.package}: Package {_watts(item.package_watts)} | Core {_watts(item.core_watts)}"
+            f" | DRAM {_watts(item.dram_watts)} | Throttle events: core {_events(item.core_throttle_events)}"
+            f", package {_events(item.package_throttle_events)} over {thermal.window_s:.1f}s"
+        )
+    return lines
+
+
+def _interrupt_lines(interrupts: InterruptData | None) -> list[str]:
+    """Render interrupt totals, hot CPUs and sources concentrated on one CPU."""
+    if interrupts is None or not interrupts.available:
+        return []
+    lines = [
+        "",
+        "INTERRUPTS",
+        f"IRQ: {_rate(interrupts.irq_per_s)} | SoftIRQ: {_rate(interrupts.softirq_per_s)}"
+        f" across {interrupts.cpu_count} CPUs",
+    ]
+    if interrupts.hot_cpus:
+        lines.append(
+            "Hot CPUs: "
+            + ", ".join(
+                f"cpu{item.cpu} {item.irq_per_s + item.softirq_per_s:.0f}/s ({item.share_percent:.0f}%)"
+                for item in interrupts.hot_cpus
+            )
+        )
+    for source in interrupts.imbalanced:
+        label = f"{source.name} {source.description}".strip()
+        lines.append(
+            f"  Imbalanced {source.kind} {label}: {source.per_s:.0f}/s,"
+            f" {source.top_cpu_percent:.0f}% on cpu{source.top_cpu}"
+        )
+    return lines
+
+
+def _tcp_lines(tcp: TcpData | None) -> list[str]:
+    """Render TCP socket states and retransmit, reset and listen-queue rates."""
+    if tcp is None or not tcp.available:
+        return []
+    states = ", ".join(f"{name} {count}" for name, count in list(tcp.states.items())[:4]) or "N/A"
+    lines = [f"TCP: {tcp.sockets} sockets ({states})"]
+    rates = tcp.rates
+    if rates is not None:
+        retrans = "" if tcp.retrans_percent is None else f" ({tcp.retrans_percent:.2f}%)"
+        lines.append(
+            f"  Retrans: {_rate(rates.retrans_segs_per_s)}{retrans}"
+            f" | Resets sent: {_rate(rates.resets_sent_per_s)}"
+            f" | Estab resets: {_rate(rates.estab_resets_per_s)}"
+            f" | Listen overflows: {_rate(rates.listen_overflows_per_s)}"
+            f" | Listen drops: {_rate(rates.listen_drops_per_s)}"
+        )
+    return lines
+
+
+def _scheduler_lines(scheduler: SchedulerData | None) -> list[str]:
+    """Render context switch/fork rates, runnable/blocked tasks and run-queue wait."""
+    if scheduler is None or not scheduler.available:
+        return []
+    line = (
+        f"Scheduler: {_rate(scheduler.context_switches_per_s)} ctxsw | {_rate(scheduler.forks_per_s)} forks"
+        f" | Runnable: {_events(scheduler.procs_running)} | Blocked: {_events(scheduler.procs_blocked)}"
+    )
+    if scheduler.run_queue_wait_ms_per_s is not None:
+        avg = "N/A" if scheduler.avg_wait_us is None else f"{scheduler.avg_wait_us:.0f} us"
+        line += f" | Run-queue wait: {scheduler.run_queue_wait_ms_per_s:.1f} ms/s (avg {avg})"
+    return [line]
+
+
+def _thermal_summary(headroom_c: float | None, status: str) -> str:
+    """Format temperature headroom with the thermal status."""
+    if headroom_c is None:
+        return status
+    return f"{headroom_c:.1f} C headroom ({status})"
+
+
+def _burst_line(burst: BurstData | None) -> list[str]:
+    """Render per-tick peaks from the high-frequency sampler, if running."""
+    if burst is None:
+        return []
+    rx = "N/A" if burst.rx_peak_bytes_per_s is None else f"{burst.rx_peak_bytes_per_s / 1024 / 1024:.2f} MB/s"
+    tx = "N/A" if burst.tx_peak_bytes_per_s is None else f"{burst.tx_peak_bytes_per_s / 1024 / 1024:.2f} MB/s"
+    return [
+        (
+            f"Burst ({burst.hz:g} Hz, {burst.samples} samples): CPU peak {_pct(burst.cpu_peak_percent)}"
+            f" | RAM peak {_pct(burst.memory_peak_percent)} | down peak {rx} | up peak {tx}"
+        )
+    ]
+
+
+def _freshness_lines(snapshot: Snapshot) -> list[str]:
+    """Note domains that missed the collection deadline or fell back to defaults."""
+    stale = [
+        f"{domain} ({status.age_s:.1f}s old)"
+        for domain, status in snapshot.meta.domains.items()
+        if status.state == "stale" and status.age_s is not None
+    ]
+    fallback = [domain for domain, status in snapshot.meta.domains.items() if status.state == "fallback"]
+    lines = []
+    if stale:
+        lines.append("Stale: " + ", ".join(stale))
+    if fallback:
+        lines.append("Unavailable: " + ", ".join(fallback))
+    return ["", *lines] if lines else []
+
+
 def render_full(snapshot: Snapshot, config: RuntimeConfig) -> str:
     """Render the complete multi-section terminal report."""
     system = snapshot.system
@@ -35,7 +332,10 @@ def render_full(snapshot: Snapshot, config: RuntimeConfig) -> str:
         "",
         "RESOURCES",
         f"CPU: {cpu.model}",
-        f"Cores: {cpu.cores} | Usage: {color_usage(cpu.usage_percent, config.plain)}",
+        (
+            f"Cores: {cpu.cores} | Usage: {color_usage(cpu.usage_percent, config.plain)}"
+            f" | IOWait: {_pct(cpu.iowait_percent)} | Steal: {_pct(cpu.steal_percent)}"
+        ),
         (
             f"GPU: {gpu.model} ({gpu.vendor}) | Usage: "
             + ("N/A" if gpu.utilization_percent is None else color_usage(gpu.utilization_percent, config.plain))
@@ -55,6 +355,7 @@ def render_full(snapshot: Snapshot, config: RuntimeConfig) -> str:
             f"({color_usage(mem.usage_percent, config.plain)})"
         ),
         f"Swap: {mem.swap_used_gb:.1f}/{mem.swap_total_gb:.1f} GiB",
+        *_memory_detail_lines(mem),
         "",
         "STORAGE",
         (
@@ -73,17 +374,24 @@ def render_full(snapshot: Snapshot, config: RuntimeConfig) -> str:
         f"IP: {maybe_redact(network.ip, config.opsec)} | Interface: {network.interface}",
         f"Throughput: {network.throughput}",
         f"Wi-Fi: {network.wifi_chipset} | Bluetooth: {network.bluetooth_chipset}",
+        *_interface_lines(network.interfaces, config.opsec),
+        *_tcp_lines(snapshot.tcp),
         "",
         "PERFORMANCE",
         f"Load Average: {perf.load_average}",
+        *_scheduler_lines(snapshot.scheduler),
         "CPU Perf: "
         + ("N/A" if perf.cpu_perf_score is None else f"{perf.cpu_perf_score:.1f}%")
         + " | Thermal: "
-        + (
-            "N/A"
-            if perf.thermal_headroom_c is None
-            else f"{perf.thermal_headroom_c:.1f} C headroom ({perf.thermal_status})"
-        ),
+        + _thermal_summary(perf.thermal_headroom_c, perf.thermal_status),
         f"Bottleneck: {perf.bottleneck}",
+        *_burst_line(snapshot.burst),
+        *_cgroup_lines(snapshot.cgroup),
+        *_numa_lines(snapshot.numa),
+        *_thermal_lines(snapshot.thermal),
+        *_interrupt_lines(snapshot.interrupts),
+        *_pressure_lines(snapshot.pressure),
+        *_process_lines(snapshot.processes),
+        *_freshness_lines(snapshot),
     ]
     return "\n".join(lines)
@@ -2,28 +2,67 @@
 
 from __future__ import annotations
 
-import time
+import sys
 
+from sysmatrix.collectors.burst import BurstSampler
 from sysmatrix.config import RuntimeConfig
-from sysmatrix.renderers.json_output import render_json
+from sysmatrix.renderers.json_output import render_json, render_json_bytes
+from sysmatrix.renderers.screen import DiffScreen
 from sysmatrix.renderers.terminal_full import render_full
 from sysmatrix.renderers.terminal_short import render_short
 from sysmatrix.snapshot import collect_snapshot
+from sysmatrix.utils.scheduling import FixedRateScheduler
 
 
 def run_watch(config: RuntimeConfig) -> int:
-    """Continuously redraw output until interrupted by the user."""
+    """Continuously redraw output until interrupted by the user.
+
+    Ticks follow a fixed-rate, wall-clock aligned schedule and overruns are
+    reported as missed ticks. On a terminal only changed lines are rewritten
+    each tick (see ``DiffScreen``). With compact JSON the screen is not
+    redrawn; one document is written per tick as an NDJSON stream. With
+    ``burst_hz`` a ``BurstSampler`` adds per-tick peaks to each snapshot;
+    if it cannot start or stops with an error, watch mode reports it on
+    stderr and exits with status 1.
+    """
+    ndjson = config.json and config.json_style == "compact"
+    screen = DiffScreen(sys.stdout)
+    scheduler = FixedRateScheduler(config.watch_interval)
+    sampler = None
     try:
+        if config.burst_hz is not None:
+            sampler = BurstSampler(config.burst_hz)
+            try:
+                sampler.start()
+            except OSError as exc:
+                print(f"sysmatrix: burst sampling unavailable: {exc}", file=sys.stderr)
+                return 1
         while True:
-            snapshot = collect_snapshot()
-            print("\033[2J\033[H", end="")
+            snapshot = collect_snapshot(config.deadline_s, config.include_virtual)
+            if sampler is not None:
+                try:
+                    snapshot.burst = sampler.drain()
+                except RuntimeError as exc:
+                    print(f"sysmatrix: burst sampling failed: {exc.__cause__ or exc}", file=sys.stderr)
+                    return 1
+            if ndjson:
+                sys.stdout.buffer.write(render_json_bytes(snapshot, config) + b"\n")
+                sys.stdout.flush()
+                scheduler.wait()
+                continue
             if config.json:
-                print(render_json(snapshot, config))
+                body = render_json(snapshot, config)
             elif config.short:
-                print(render_short(snapshot, config))
+                body = render_short(snapshot, config)
             else:
-                print(render_full(snapshot, config))
-            print(f"\nRefreshing every {config.watch_interval}s. Press Ctrl+C to exit.")
-            time.sleep(config.watch_interval)
+                body = render_full(snapshot, config)
+            missed = f" ({scheduler.missed} missed ticks)" if scheduler.missed else ""
+            screen.draw(
+                f"{body}\n\nRefreshing every {config.watch_interval:g}s{missed}. Press Ctrl+C to exit."
+            )
+            scheduler.wait()
     except KeyboardInterrupt:
         return 0
+    finally:
+        if sampler is not None:
+            sampler.stop()
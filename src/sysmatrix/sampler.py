@@ -0,0 +1,104 @@
+"""Long-lived background sampler for embedding sysmatrix in other programs."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from sysmatrix.models import Snapshot
+from sysmatrix.snapshot import collect_snapshot_async, collection_runner
+from sysmatrix.utils.scheduling import FixedRateScheduler
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Sampler:
+    """Collect snapshots at a fixed rate on a background thread.
+
+    Collection runs on one long-lived event loop, so counter baselines,
+    static domains, resolved tools and probe caches stay warm between ticks
+    and rates need no settle sleep after the first one. Each tick builds a
+    new ``Snapshot`` off to the side and publishes it by swapping a single
+    reference, so ``latest`` never blocks and never sees a half-built
+    snapshot. Published snapshots are not touched again by the sampler;
+    readers share them and must treat them as read-only.
+
+    ``deadline_s`` bounds each collection (see ``collect_snapshot``) and
+    defaults to the interval, so a slow probe delays no more than one tick.
+    ``include_virtual`` lists virtual network interfaces as well.
+    """
+
+    def __init__(
+        self,
+        interval_s: float = 1.0,
+        deadline_s: float | None = None,
+        include_virtual: bool = False,
+    ) -> None:
+        # Validate the interval up front rather than on the sampling thread.
+        FixedRateScheduler(interval_s)
+        self.interval_s = interval_s
+        self.deadline_s = interval_s if deadline_s is None else deadline_s
+        self.include_virtual = include_virtual
+        self._latest: tuple[Snapshot, float] | None = None
+        self._ready = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.ticks = 0
+        self.errors = 0
+
+    @property
+    def latest(self) -> Snapshot | None:
+        """The most recent snapshot, or None before the first one is ready."""
+        latest = self._latest
+        return None if latest is None else latest[0]
+
+    @property
+    def age_s(self) -> float | None:
+        """Seconds since the latest snapshot was published."""
+        latest = self._latest
+        return None if latest is None else time.monotonic() - latest[1]
+
+    def wait(self, timeout: float | None = None) -> Snapshot | None:
+        """Block until a snapshot is available (or ``timeout`` passes) and return it."""
+        with self._ready:
+            self._ready.wait_for(lambda: self._latest is not None, timeout)
+        return self.latest
+
+    def start(self) -> Sampler:
+        """Start the sampling thread (idempotent)."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="sysmatrix-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop sampling after the current tick; the latest snapshot stays readable."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> Sampler:
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
+
+    def _publish(self, snapshot: Snapshot) -> None:
+        self._latest = (snapshot, time.monotonic())
+        self.ticks += 1
+        with self._ready:
+            self._ready.notify_all()
+
+    def _run(self) -> None:
+        scheduler = FixedRateScheduler(self.interval_s, align=False, sleep=self._stop.wait)
+        with collection_runner() as runner:
+            while not self._stop.is_set():
+                try:
+                    self._publish(runner.run(collect_snapshot_async(self.deadline_s, self.include_virtual)))
+                except Exception:
+                    self.errors += 1
+                    LOGGER.warning("background snapshot collection failed", exc_info=True)
+                scheduler.wait()
@@ -0,0 +1,223 @@
+"""Publish snapshots through POSIX shared memory for local readers.
+
+One publisher collects; any number of readers attach to the segment and
+read the latest snapshot without running collectors. The segment has a
+fixed layout (little-endian)::
+
+    offset  size  field
+    0       8     magic b"SYSMTRX1"
+    8       8     sequence (odd while a write is in progress)
+    16      8     published_ns (time.time_ns() of the payload)
+    24      4     payload length in bytes
+    28      4     reserved
+    32      ...   payload: compact JSON of Snapshot.to_dict()
+
+Readers follow the seqlock protocol: read the sequence, copy the payload,
+re-read the sequence and retry if it was odd or changed. No lock is shared
+between processes, so a stalled reader never blocks the publisher.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from sysmatrix.config import RuntimeConfig
+from sysmatrix.models import Snapshot
+from sysmatrix.renderers.json_output import encode_json
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_NAME = "sysmatrix"
+DEFAULT_CAPACITY = 1 << 20
+MAGIC = b"SYSMTRX1"
+_HEADER = struct.Struct("<8sQQI4x")
+_SEQUENCE = struct.Struct("<Q")
+_SEQUENCE_OFFSET = 8
+PAYLOAD_OFFSET = _HEADER.size
+READ_RETRIES = 100
+
+# Segments published by this process; see ``_attach``.
+_PUBLISHED: set[str] = set()
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to an existing segment without handing it to the resource tracker.
+
+    Before Python 3.13 every attach registers the segment with the
+    resource tracker, which unlinks it when the attaching process exits and
+    would pull the segment from under the publisher. Segments published by
+    this same process stay registered for the publisher's own cleanup.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    shm = SharedMemory(name=name)
+    if name not in _PUBLISHED:
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+class SnapshotPublisher:
+    """Write each new snapshot into a named shared-memory segment.
+
+    An existing segment with the same layout is reused (readers that are
+    already attached keep working across publisher restarts); the segment is
+    unlinked on ``close`` unless ``unlink=False``.
+    """
+
+    def __init__(self, name: str = DEFAULT_NAME, capacity: int = DEFAULT_CAPACITY, redact: bool = False) -> None:
+        self.redact = redact
+        size = PAYLOAD_OFFSET + capacity
+        try:
+            self._shm = SharedMemory(name=name, create=True, size=size)
+            self._sequence = 0
+            _HEADER.pack_into(self._shm.buf, 0, MAGIC, 0, 0, 0)
+        except FileExistsError:
+            self._shm = SharedMemory(name=name)
+            magic, sequence, _ns, _length = _HEADER.unpack_from(self._shm.buf, 0)
+            if magic != MAGIC or self._shm.size < size:
+                self._shm.close()
+                raise ValueError(f"shared memory segment {name!r} exists with a different layout") from None
+            # Resume on an even sequence so readers never see it go backwards.
+            self._sequence = sequence + (sequence & 1)
+        self.name = name
+        self.capacity = self._shm.size - PAYLOAD_OFFSET
+        _PUBLISHED.add(name)
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the last completed write (always even)."""
+        return self._sequence
+
+    def publish_bytes(self, payload: bytes) -> int:
+        """Publish an encoded payload and return its sequence number."""
+        if len(payload) > self.capacity:
+            raise ValueError(f"snapshot of {len(payload)} bytes exceeds segment capacity {self.capacity}")
+        buf = self._shm.buf
+        _SEQUENCE.pack_into(buf, _SEQUENCE_OFFSET, self._sequence + 1)
+        buf[PAYLOAD_OFFSET : PAYLOAD_OFFSET + len(payload)] = payload
+        self._sequence += 2
+        _HEADER.pack_into(buf, 0, MAGIC, self._sequence - 1, time.time_ns(), len(payload))
+        _SEQUENCE.pack_into(buf, _SEQUENCE_OFFSET, self._sequence)
+        return self._sequence
+
+    def publish(self, snapshot: Snapshot) -> int:
+        """Serialize and publish a snapshot; returns its sequence number."""
+        return self.publish_bytes(encode_json(snapshot.to_dict(redact=self.redact), "compact"))
+
+    def close(self, unlink: bool = True) -> None:
+        """Detach from the segment, removing it unless ``unlink`` is false."""
+        _PUBLISHED.discard(self.name)
+        self._shm.close()
+        if unlink:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> SnapshotPublisher:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+class SnapshotReader:
+    """Attach to a publisher's segment and read consistent snapshots.
+
+    Raises ``FileNotFoundError`` when no publisher has created the segment.
+    The reader only maps memory and decodes JSON; it imports no collectors.
+    """
+
+    def __init__(self, name: str = DEFAULT_NAME) -> None:
+        self._shm = _attach(name)
+        magic = bytes(self._shm.buf[: len(MAGIC)])
+        if magic != MAGIC:
+            self._shm.close()
+            raise ValueError(f"shared memory segment {name!r} is not a sysmatrix snapshot")
+        self.name = name
+
+    def read_bytes(self, retries: int = READ_RETRIES) -> tuple[int, int, bytes] | None:
+        """Return ``(sequence, published_ns, payload)``, or None before the first publish.
+
+        Raises ``TimeoutError`` if no consistent copy was obtained within
+        ``retries`` attempts (the publisher kept writing).
+        """
+        buf = self._shm.buf
+        for _ in range(retries):
+            before = _SEQUENCE.unpack_from(buf, _SEQUENCE_OFFSET)[0]
+            if before & 1:
+                time.sleep(0)
+                continue
+            _magic, _seq, published_ns, length = _HEADER.unpack_from(buf, 0)
+            payload = bytes(buf[PAYLOAD_OFFSET : PAYLOAD_OFFSET + min(length, len(buf) - PAYLOAD_OFFSET)])
+            if _SEQUENCE.unpack_from(buf, _SEQUENCE_OFFSET)[0] == before:
+                return None if before == 0 else (before, published_ns, payload)
+        raise TimeoutError(f"no consistent snapshot in shared memory {self.name!r} after {retries} attempts")
+
+    def read(self) -> dict | None:
+        """Return the latest snapshot as a dict (the JSON schema), or None before the first publish."""
+        result = self.read_bytes()
+        return None if result is None else json.loads(result[2])
+
+    @property
+    def sequence(self) -> int:
+        """Current sequence number; changes whenever a new snapshot is published."""
+        return _SEQUENCE.unpack_from(self._shm.buf, _SEQUENCE_OFFSET)[0]
+
+    def close(self) -> None:
+        """Detach from the segment (the publisher keeps it alive)."""
+        self._shm.close()
+
+    def __enter__(self) -> SnapshotReader:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+def read_snapshot(name: str = DEFAULT_NAME) -> dict | None:
+    """Attach, read the latest published snapshot as a dict, and detach."""
+    with SnapshotReader(name) as reader:
+        return reader.read()
+
+
+def _interrupt(_signum: int, _frame: object) -> None:
+    raise KeyboardInterrupt
+
+
+def run_publisher(config: RuntimeConfig) -> int:
+    """Collect at the watch interval and publish every snapshot until interrupted.
+
+    SIGTERM is treated like Ctrl+C so service managers stopping the
+    publisher still unlink the segment.
+    """
+    import signal
+
+    from sysmatrix.snapshot import collect_snapshot_async, collection_runner
+    from sysmatrix.utils.scheduling import FixedRateScheduler
+
+    signal.signal(signal.SIGTERM, _interrupt)
+    scheduler = FixedRateScheduler(config.watch_interval)
+    with SnapshotPublisher(config.publish or DEFAULT_NAME, redact=config.opsec) as publisher:
+        print(
+            f"Publishing to shared memory {publisher.name!r} every {config.watch_interval:g}s."
+            " Press Ctrl+C to exit.",
+            file=sys.stderr,
+        )
+        try:
+            with collection_runner() as runner:
+                while True:
+                    snapshot = runner.run(collect_snapshot_async(config.deadline_s, config.include_virtual))
+                    try:
+                        publisher.publish(snapshot)
+                    except ValueError:
+                        LOGGER.warning("snapshot not published", exc_info=True)
+                    scheduler.wait()
+        except KeyboardInterrupt:
+            return 0
@@ -2,75 +2,448 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
+import inspect
 import logging
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TypeVar
 
 from sysmatrix.collectors import (
+    collect_board_async,
+    collect_cgroup,
     collect_cpu,
-    collect_gpu,
+    collect_gpu_async,
+    collect_interrupts,
     collect_memory,
-    collect_motherboard,
-    collect_network,
-    collect_performance,
-    collect_storage,
-    collect_system,
+    collect_network_async,
+    collect_numa,
+    collect_performance_async,
+    collect_pressure,
+    collect_processes,
+    collect_scheduler,
+    collect_storage_async,
+    collect_system_async,
+    collect_tcp,
+    collect_thermal,
+    read_vrm_temp_async,
 )
 from sysmatrix.defaults import (
+    default_cgroup,
     default_cpu,
     default_gpu,
+    default_interrupts,
     default_memory,
     default_motherboard,
     default_network,
+    default_numa,
     default_performance,
+    default_pressure,
+    default_processes,
+    default_scheduler,
     default_storage,
     default_system,
+    default_tcp,
+    default_thermal,
 )
-from sysmatrix.models import Snapshot
+from sysmatrix.models import (
+    CpuData,
+    DomainStatus,
+    GpuData,
+    MotherboardData,
+    PerformanceData,
+    PressureData,
+    SchedulerData,
+    Snapshot,
+    SnapshotMeta,
+    ThermalData,
+)
+from sysmatrix.registry import PRIVILEGED, SAMPLING, SUBPROCESS, CollectorSpec, plan, plugin_specs
+from sysmatrix.utils.sampling import max_settle_wait, prime_all
+from sysmatrix.utils.tools import TOOLS
 
 T = TypeVar("T")
 LOGGER = logging.getLogger(__name__)
 
+# Share of a deadline that may be spent waiting for counter baselines to settle.
+DEADLINE_SETTLE_SHARE = 0.5
+
+# Last successful value per domain: (value, monotonic timestamp).
+_LAST_KNOWN: dict[str, tuple[object, float]] = {}
+
+
+class _AbandoningExecutor(ThreadPoolExecutor):
+    """Run each call on its own daemon thread and never wait at shutdown.
+
+    ``asyncio.to_thread`` uses the loop's default executor, whose shutdown
+    joins every worker, so a collector blocked in a read would hold
+    ``asyncio.run`` (and the process) past the deadline. Threads of
+    abandoned calls finish in the background and die with the process.
+    """
+
+    def submit(self, fn: Callable[..., T], /, *args: object, **kwargs: object) -> Future[T]:
+        future: Future[T] = Future()
+
+        def _run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+        threading.Thread(target=_run, name="sysmatrix-collector", daemon=True).start()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        pass
+
+
+def collection_runner() -> asyncio.Runner:
+    """Return an ``asyncio.Runner`` whose loop can abandon blocked sync collectors.
+
+    Use it instead of ``asyncio.run``/``asyncio.Runner`` to drive
+    ``collect_snapshot_async`` so a deadline also bounds when the runner
+    closes.
+    """
+    runner = asyncio.Runner()
+    runner.get_loop().set_default_executor(_AbandoningExecutor(max_workers=1))
+    return runner
+
 
 def _callable_name(func: Callable[..., object]) -> str:
     """Return a readable callable name for diagnostics."""
+    if isinstance(func, functools.partial):
+        func = func.func
     return getattr(func, "__name__", func.__class__.__name__)
 
 
-def _safe_collect(collector: Callable[[], T], fallback: Callable[[], T]) -> T:
-    """Run a collector and return fallback data on any exception."""
+def _log_failure(collector: Callable[..., object], fallback: Callable[..., object]) -> None:
+    """Log a collector failure with the fallback that replaces it."""
+    LOGGER.warning(
+        "collector '%s' failed; using fallback '%s'",
+        _callable_name(collector),
+        _callable_name(fallback),
+        exc_info=True,
+    )
+
+
+def _elapsed_ms(started: float) -> float:
+    """Return milliseconds since ``started`` (a monotonic timestamp)."""
+    return round((time.monotonic() - started) * 1000.0, 1)
+
+
+def _remember(domain: str, collector: Callable[..., T], inputs: dict[str, object]) -> T:
+    """Run a sync collector and record its result as the domain's last-known value."""
+    value = collector(**inputs)
+    _LAST_KNOWN[domain] = (value, time.monotonic())
+    return value
+
+
+async def _collect_domain(
+    domain: str,
+    collector: Callable[..., T] | Callable[..., Awaitable[T]],
+    fallback: Callable[[], T],
+    statuses: dict[str, DomainStatus],
+    settle_s: float = 0.0,
+    inputs: dict[str, object] | None = None,
+) -> T:
+    """Collect one domain, falling back to defaults on any exception.
+
+    Async collectors run on the loop. Sync collectors only touch procfs and
+    sysfs; they run in a worker thread so a deadline can abandon them, and
+    a late result still refreshes the last-known cache. ``inputs`` holds
+    dependency values, passed as keyword arguments.
+    """
+    inputs = inputs or {}
+    started = time.monotonic()
     try:
-        return collector()
-    except Exception:  # pragma: no cover - branch behavior validated via caplog tests
-        LOGGER.warning(
-            "collector '%s' failed; using fallback '%s'",
-            _callable_name(collector),
-            _callable_name(fallback),
-            exc_info=True,
-        )
+        if settle_s > 0:
+            await asyncio.sleep(settle_s)
+            started = time.monotonic()
+        if inspect.iscoroutinefunction(collector):
+            value = await collector(**inputs)
+            _LAST_KNOWN[domain] = (value, time.monotonic())
+        else:
+            value = await asyncio.to_thread(_remember, domain, collector, inputs)
+    except Exception:
+        _log_failure(collector, fallback)
+        statuses[domain] = DomainStatus(state="fallback", duration_ms=_elapsed_ms(started))
+        return fallback()
+    statuses[domain] = DomainStatus(state="fresh", duration_ms=_elapsed_ms(started))
+    return value
+
+
+def _last_known_or_fallback(domain: str, fallback: Callable[[], T], statuses: dict[str, DomainStatus]) -> T:
+    """Return a domain's last-known value marked stale, else its fallback."""
+    cached = _LAST_KNOWN.get(domain)
+    if cached is None:
+        statuses[domain] = DomainStatus(state="fallback")
         return fallback()
+    value, taken = cached
+    statuses[domain] = DomainStatus(state="stale", age_s=round(time.monotonic() - taken, 3))
+    return value  # type: ignore[return-value]
+
+
+async def _collect_motherboard(dmi: MotherboardData) -> MotherboardData:
+    """Add the current VRM temperature to the static DMI board identity."""
+    return dataclasses.replace(dmi, vrm_temp_c=await read_vrm_temp_async())
 
 
-def collect_snapshot() -> Snapshot:
-    """Collect a full system snapshot across all collector domains."""
-    system = _safe_collect(collect_system, default_system)
-    cpu = _safe_collect(collect_cpu, default_cpu)
-    memory = _safe_collect(collect_memory, default_memory)
-    gpu = _safe_collect(collect_gpu, default_gpu)
-    storage = _safe_collect(collect_storage, default_storage)
-    motherboard = _safe_collect(collect_motherboard, default_motherboard)
-    network = _safe_collect(collect_network, default_network)
-    performance = _safe_collect(
-        lambda: collect_performance(cpu_usage=cpu.usage_percent, gpu_usage=gpu.utilization_percent),
-        default_performance,
+async def _collect_performance(
+    cpu: CpuData,
+    gpu: GpuData,
+    pressure: PressureData,
+    thermal: ThermalData,
+    scheduler: SchedulerData,
+) -> PerformanceData:
+    """Derive the performance domain from the CPU, GPU, PSI, thermal and scheduler domains."""
+    return await collect_performance_async(
+        cpu_usage=cpu.usage_percent,
+        gpu_usage=gpu.utilization_percent,
+        iowait=cpu.iowait_percent,
+        steal=cpu.steal_percent,
+        pressure=pressure,
+        thermal=thermal,
+        scheduler=scheduler,
     )
+
+
+# Built-in snapshot domains in schema order (the domain fields of ``Snapshot``).
+DOMAINS = (
+    "system",
+    "cpu",
+    "memory",
+    "gpu",
+    "storage",
+    "motherboard",
+    "network",
+    "performance",
+    "processes",
+    "pressure",
+    "cgroup",
+    "numa",
+    "thermal",
+    "interrupts",
+    "scheduler",
+    "tcp",
+)
+# Built-in domains that only feed other domains: collected and reported in
+# ``meta.domains``, but neither a ``Snapshot`` field nor part of ``extra``.
+INTERNAL_DOMAINS = ("dmi",)
+# Snapshot fields a plugin domain may not take.
+_RESERVED = frozenset({*DOMAINS, *INTERNAL_DOMAINS, "burst", "extra", "meta"})
+_IGNORED_PLUGINS: set[str] = set()
+
+
+def builtin_specs(include_virtual: bool = False) -> list[CollectorSpec]:
+    """Describe the built-in domains in schema order.
+
+    Built at call time so module-level collectors can be swapped (tests)
+    without rebuilding a registry. ``include_virtual`` keeps virtual
+    interfaces in the network domain's per-interface list. The internal
+    ``dmi`` domain is static: the board identity is read (possibly through
+    ``dmidecode``) once per process, and later snapshots only re-read the
+    VRM temperature.
+    """
+    network = collect_network_async
+    if include_virtual:
+        network = functools.partial(collect_network_async, include_virtual=True)
+    return [
+        CollectorSpec("system", collect_system_async, default_system),
+        CollectorSpec("cpu", collect_cpu, default_cpu, cost=SAMPLING),
+        CollectorSpec("memory", collect_memory, default_memory, cost=SAMPLING),
+        CollectorSpec("gpu", collect_gpu_async, default_gpu, cost=SUBPROCESS),
+        CollectorSpec("storage", collect_storage_async, default_storage, cost=PRIVILEGED),
+        CollectorSpec("dmi", collect_board_async, default_motherboard, cost=SUBPROCESS, static=True),
+        CollectorSpec(
+            "motherboard",
+            _collect_motherboard,
+            default_motherboard,
+            depends=("dmi",),
+            cost=SUBPROCESS,
+        ),
+        CollectorSpec("network", network, default_network, cost=SUBPROCESS),
+        CollectorSpec(
+            "performance",
+            _collect_performance,
+            default_performance,
+            depends=("cpu", "gpu", "pressure", "thermal", "scheduler"),
+            cost=SUBPROCESS,
+        ),
+        CollectorSpec("processes", collect_processes, default_processes, cost=SAMPLING),
+        CollectorSpec("pressure", collect_pressure, default_pressure, cost=SAMPLING),
+        CollectorSpec("cgroup", collect_cgroup, default_cgroup, cost=SAMPLING),
+        CollectorSpec("numa", collect_numa, default_numa, cost=SAMPLING),
+        CollectorSpec("thermal", collect_thermal, default_thermal, cost=SAMPLING),
+        CollectorSpec("interrupts", collect_interrupts, default_interrupts, cost=SAMPLING),
+        CollectorSpec("scheduler", collect_scheduler, default_scheduler, cost=SAMPLING),
+        CollectorSpec("tcp", collect_tcp, default_tcp, cost=SAMPLING),
+    ]
+
+
+def collector_specs(include_virtual: bool = False) -> dict[str, CollectorSpec]:
+    """Return built-in and plugin collector specs by domain.
+
+    Plugins cannot replace built-in domains; such specs are ignored with a
+    warning (once per domain).
+    """
+    specs = {spec.domain: spec for spec in builtin_specs(include_virtual)}
+    for spec in plugin_specs():
+        if spec.domain in _RESERVED:
+            if spec.domain not in _IGNORED_PLUGINS:
+                _IGNORED_PLUGINS.add(spec.domain)
+                LOGGER.warning("ignoring plugin collector for reserved domain %r", spec.domain)
+            continue
+        specs[spec.domain] = spec
+    return specs
+
+
+def known_domains() -> tuple[str, ...]:
+    """Return every collectable domain: built-ins in schema order, then plugins."""
+    return tuple(collector_specs())
+
+
+def expand_domains(domains: Iterable[str], specs: dict[str, CollectorSpec] | None = None) -> list[str]:
+    """Return ``domains`` plus their transitive dependencies, in dependency order."""
+    return plan(collector_specs() if specs is None else specs, domains)
+
+
+async def _run_spec(
+    spec: CollectorSpec,
+    dependencies: dict[str, asyncio.Task],
+    statuses: dict[str, DomainStatus],
+    settle_s: float,
+) -> object:
+    """Collect one domain once its dependencies finish; static domains reuse their first value."""
+    cached = _LAST_KNOWN.get(spec.domain) if spec.static else None
+    if cached is not None:
+        value, taken = cached
+        statuses[spec.domain] = DomainStatus(state="cached", age_s=round(time.monotonic() - taken, 3))
+        return value
+    values = await asyncio.gather(*dependencies.values())
+    inputs = dict(zip(dependencies, values))
+    return await _collect_domain(spec.domain, spec.collect, spec.fallback, statuses, settle_s, inputs)
+
+
+def start_domain_tasks(
+    domains: Iterable[str],
+    statuses: dict[str, DomainStatus],
+    settle_s: float = 0.0,
+    specs: dict[str, CollectorSpec] | None = None,
+) -> dict[str, asyncio.Task]:
+    """Start one task per requested domain (and its dependencies).
+
+    Every task starts at once and only waits for its own dependencies, so
+    the collector DAG runs with maximum parallelism. ``sampling`` domains
+    wait ``settle_s`` before reading, for callers that have primed
+    baselines; with the default of zero each collector settles its own
+    baseline, so only the baselines actually needed are sampled. ``specs``
+    defaults to ``collector_specs()``.
+    """
+    specs = collector_specs() if specs is None else specs
+    tasks: dict[str, asyncio.Task] = {}
+    for domain in expand_domains(domains, specs):
+        spec = specs[domain]
+        dependencies = {dep: tasks[dep] for dep in spec.depends}
+        settle = settle_s if spec.cost == SAMPLING else 0.0
+        tasks[domain] = asyncio.create_task(_run_spec(spec, dependencies, statuses, settle))
+    return tasks
+
+
+async def cancel_pending(tasks: Iterable[asyncio.Task]) -> None:
+    """Cancel unfinished domain tasks and wait for them to unwind."""
+    pending = [task for task in tasks if not task.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def domain_results(tasks: dict[str, asyncio.Task], statuses: dict[str, DomainStatus]) -> dict[str, object]:
+    """Return each domain's value, substituting last-known/fallback for cancelled tasks."""
+    specs = collector_specs()
+    results = {}
+    for domain, task in tasks.items():
+        if task.cancelled():
+            results[domain] = _last_known_or_fallback(domain, specs[domain].fallback, statuses)
+        else:
+            results[domain] = task.result()
+    return results
+
+
+async def collect_snapshot_async(deadline_s: float | None = None, include_virtual: bool = False) -> Snapshot:
+    """Collect a full system snapshot on the running event loop.
+
+    Every counter baseline is primed first (on a worker thread, counted
+    against the deadline), then subprocess-backed
+    collectors run concurrently while one shared settle window elapses.
+    ``sampling`` collectors (CPU, memory/vmstat, processes, PSI, cgroup,
+    NUMA, thermal/RAPL, interrupts, scheduler, TCP) only read procfs/sysfs once
+    their baselines have settled.
+
+    With ``deadline_s`` the snapshot is returned when the budget runs out:
+    unfinished domains are cancelled and report their last-known value
+    (``stale``) or the default fallback; ``snapshot.meta`` records which.
+    Domains contributed by collector plugins are returned in
+    ``snapshot.extra``. ``include_virtual`` lists virtual network
+    interfaces alongside physical ones.
+    """
+    started = time.monotonic()
+    statuses: dict[str, DomainStatus] = {}
+    specs = collector_specs(include_virtual)
+    domains = tuple(specs)
+    # First samples (e.g. the /proc process scan) can take a while on big
+    # hosts: take them off the loop, and within the deadline.
+    priming = asyncio.ensure_future(asyncio.to_thread(prime_all))
+    done, _pending = await asyncio.wait({priming}, timeout=deadline_s)
+    if done:
+        settle_s = priming.result()
+    else:
+        priming.cancel()
+        settle_s = 0.0
+    if deadline_s is not None:
+        remaining = max(deadline_s - (time.monotonic() - started), 0.0)
+        settle_s = min(settle_s, remaining * DEADLINE_SETTLE_SHARE)
+
+    # With a deadline, rates use the (possibly shortened) shared window rather than sleeping again.
+    with max_settle_wait(None if deadline_s is None else 0.0):
+        tasks = start_domain_tasks(domains, statuses, settle_s, specs)
+        timeout = None if deadline_s is None else max(deadline_s - (time.monotonic() - started), 0.0)
+        await asyncio.wait(tasks.values(), timeout=timeout)
+        await cancel_pending(tasks.values())
+
+    results = domain_results(tasks, statuses)
     return Snapshot(
-        system=system,
-        cpu=cpu,
-        memory=memory,
-        gpu=gpu,
-        storage=storage,
-        motherboard=motherboard,
-        network=network,
-        performance=performance,
+        **{domain: results[domain] for domain in DOMAINS},
+        extra={domain: results[domain] for domain in domains if domain not in _RESERVED},
+        meta=SnapshotMeta(
+            domains={domain: statuses[domain] for domain in domains},
+            tools=TOOLS.status(),
+            elapsed_ms=_elapsed_ms(started),
+        ),
     )
+
+
+def collect_snapshot(deadline_s: float | None = None, include_virtual: bool = False) -> Snapshot:
+    """Collect a full system snapshot across all collector domains.
+
+    Thin synchronous wrapper around ``collect_snapshot_async``; callers that
+    already run an event loop should await the async variant instead. When
+    called from inside a running loop (which ``asyncio.run`` refuses), the
+    snapshot is collected on a helper thread with its own loop and the
+    calling loop is blocked until it is done.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        with collection_runner() as runner:
+            return runner.run(collect_snapshot_async(deadline_s, include_virtual))
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sysmatrix-snapshot") as pool:
+        return pool.submit(collect_snapshot, deadline_s, include_virtual).result()
@@ -0,0 +1,31 @@
+"""cgroup v2 path discovery helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+CGROUP_MOUNT = "/sys/fs/cgroup"
+
+
+def _unified_path(text: str) -> str | None:
+    """Return the cgroup v2 path from /proc/self/cgroup contents."""
+    for line in text.splitlines():
+        if line.startswith("0::"):
+            return line[3:].strip() or "/"
+    return None
+
+
+def cgroup_v2_dir() -> Path | None:
+    """Return this process's cgroup v2 directory, or None on v1/hybrid-only hosts."""
+    mount = Path(CGROUP_MOUNT)
+    if not (mount / "cgroup.controllers").exists():
+        return None
+    try:
+        relative = _unified_path(Path("/proc/self/cgroup").read_text(encoding="utf-8", errors="ignore"))
+    except OSError:
+        return None
+    if relative is None:
+        return None
+    path = mount / relative.lstrip("/")
+    # Inside a cgroup namespace the reported path may not be visible; fall back to the mount root.
+    return path if path.is_dir() else mount
@@ -2,35 +2,258 @@
 
 from __future__ import annotations
 
+import asyncio
+import errno
 import logging
-import shutil
 import subprocess
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+
+from sysmatrix.utils.tools import TOOLS
 
 LOGGER = logging.getLogger(__name__)
 
+# Probes that several collectors issue within one snapshot reuse results this long by default.
+SHARED_PROBES = frozenset({"sensors", "lspci", "lsusb"})
+SHARED_PROBE_TTL_S = 0.5
+# How long a cancelled probe waits for its killed child to be reaped.
+_REAP_TIMEOUT_S = 1.0
+
+_Key = tuple[str, ...]
+
+
+class _Flight:
+    """One in-flight synchronous execution that other threads can wait on."""
+
+    __slots__ = ("done", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = ""
+
+
+class _SingleFlight:
+    """De-duplicate identical concurrent commands and keep short-lived results.
+
+    Callers passing the same argv while an execution is running wait for it
+    and share its stdout, so concurrent collectors fork once per command.
+    Results can additionally be reused for ``ttl_s`` seconds after finishing.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[_Key, _Flight] = {}
+        self._tasks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_Key, asyncio.Task[str]]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._waiters: dict[asyncio.Task[str], int] = {}
+        self._results: dict[_Key, tuple[str, float]] = {}
+
+    def cached(self, key: _Key) -> str | None:
+        """Return a result still inside its TTL, or None."""
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+            if entry[1] < time.monotonic():
+                del self._results[key]
+                return None
+            return entry[0]
+
+    def store(self, key: _Key, result: str, ttl_s: float) -> None:
+        """Remember a finished result for ``ttl_s`` seconds."""
+        if ttl_s > 0:
+            with self._lock:
+                self._results[key] = (result, time.monotonic() + ttl_s)
+
+    def run(self, key: _Key, execute: Callable[[], str], ttl_s: float) -> str:
+        """Run ``execute`` once for all threads currently asking for ``key``."""
+        cached = self.cached(key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            return flight.result
+        try:
+            flight.result = execute()
+            self.store(key, flight.result, ttl_s)
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    async def run_async(self, key: _Key, execute: Callable[[], Awaitable[str]], ttl_s: float) -> str:
+        """Await one shared execution per event loop for ``key``.
+
+        The child is only cancelled (and killed) once every waiter is gone;
+        the last waiter returns after the killed child has been reaped.
+        """
+        cached = self.cached(key)
+        if cached is not None:
+            return cached
+        tasks = self._tasks.setdefault(asyncio.get_running_loop(), {})
+        task = tasks.get(key)
+        if task is None:
+            task = tasks[key] = asyncio.ensure_future(execute())
+            task.add_done_callback(lambda done: self._finish_async(tasks, key, done, ttl_s))
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters.get(task) == 1:
+                if tasks.get(key) is task:
+                    del tasks[key]
+                task.cancel()
+                # Let the execution reap its child before this cancellation completes.
+                await asyncio.wait({task})
+            raise
+        finally:
+            remaining = self._waiters.get(task, 1) - 1
+            if remaining:
+                self._waiters[task] = remaining
+            else:
+                self._waiters.pop(task, None)
+
+    def _finish_async(self, tasks: dict[_Key, asyncio.Task[str]], key: _Key, task: asyncio.Task[str], ttl_s: float) -> None:
+        if tasks.get(key) is task:
+            del tasks[key]
+        if not task.cancelled() and task.exception() is None:
+            self.store(key, task.result(), ttl_s)
+
+    def clear(self) -> None:
+        """Forget cached results (in-flight executions are unaffected)."""
+        with self._lock:
+            self._results.clear()
+
+
+_SINGLE_FLIGHT = _SingleFlight()
+
 
 def command_exists(name: str) -> bool:
     """Return True when an executable is available on PATH."""
-    return shutil.which(name) is not None
+    return TOOLS.resolve(name) is not None
+
+
+def _default_ttl(args: list[str], ttl_s: float | None) -> float:
+    """Return the result TTL for ``args``, defaulting to the shared-probe policy."""
+    if ttl_s is not None:
+        return ttl_s
+    return SHARED_PROBE_TTL_S if args and args[0] in SHARED_PROBES else 0.0
+
+
+def run_command(args: list[str], timeout_s: float = 2.0, ttl_s: float | None = None) -> str:
+    """Run a command and return stdout, or an empty string on failure.
 
+    Concurrent calls with the same argv share one execution; with ``ttl_s``
+    the result is also reused by calls made shortly afterwards (by default
+    only for ``SHARED_PROBES``).
+    """
+    return _SINGLE_FLIGHT.run(tuple(args), lambda: _run(args, timeout_s), _default_ttl(args, ttl_s))
 
-def run_command(args: list[str], timeout_s: float = 2.0) -> str:
-    """Run a command and return stdout, or an empty string on failure."""
+
+def _start_error(exc: OSError) -> str:
+    """Name the errno of a failed spawn for the tool registry."""
+    return errno.errorcode.get(exc.errno or 0, type(exc).__name__)
+
+
+def _run(args: list[str], timeout_s: float) -> str:
+    executable = TOOLS.acquire(args)
+    if executable is None:
+        return ""
     try:
         result = subprocess.run(
-            args,
+            [executable, *args[1:]],
             check=False,
             text=True,
             capture_output=True,
             timeout=timeout_s,
         )
-    except (OSError, subprocess.TimeoutExpired):
-        LOGGER.debug("command failed to start or timed out: %s", args, exc_info=True)
+    except OSError as exc:
+        LOGGER.debug("command failed to start: %s", args, exc_info=True)
+        TOOLS.record_failure(args, _start_error(exc))
+        return ""
+    except subprocess.TimeoutExpired:
+        LOGGER.debug("command timed out: %s", args)
+        TOOLS.record_failure(args, "timeout")
         return ""
+    stdout = (result.stdout or "").strip()
     if result.returncode != 0:
         LOGGER.debug(
             "command returned non-zero exit (%s): %s",
             result.returncode,
             args,
         )
-    return (result.stdout or "").strip()
+    TOOLS.record_exit(args, result.returncode, bool(stdout))
+    return stdout
+
+
+def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill an async child process, ignoring races with its exit."""
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        pass
+
+
+async def run_command_async(args: list[str], timeout_s: float = 2.0, ttl_s: float | None = None) -> str:
+    """Run a command on the event loop and return stdout, or "" on failure.
+
+    Identical concurrent calls share one child process (see ``run_command``).
+    Cancelling the awaiting task kills the child once no other caller is
+    waiting on it, so callers keep full control over outstanding probes.
+    """
+    return await _SINGLE_FLIGHT.run_async(
+        tuple(args), lambda: _run_async(args, timeout_s), _default_ttl(args, ttl_s)
+    )
+
+
+async def _run_async(args: list[str], timeout_s: float) -> str:
+    executable = TOOLS.acquire(args)
+    if executable is None:
+        return ""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            executable,
+            *args[1:],
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as exc:
+        LOGGER.debug("command failed to start: %s", args, exc_info=True)
+        TOOLS.record_failure(args, _start_error(exc))
+        return ""
+    try:
+        stdout, _stderr = await asyncio.wait_for(proc.communicate(), timeout_s)
+    except asyncio.TimeoutError:
+        LOGGER.debug("command timed out: %s", args)
+        TOOLS.record_failure(args, "timeout")
+        _kill(proc)
+        await proc.wait()
+        return ""
+    except asyncio.CancelledError:
+        _kill(proc)
+        # Reap the child before propagating so it neither lingers as a zombie
+        # nor has its exit reported to a closed loop.
+        try:
+            await asyncio.wait_for(asyncio.shield(proc.wait()), _REAP_TIMEOUT_S)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            pass
+        raise
+    output = stdout.decode("utf-8", errors="replace").strip()
+    if proc.returncode != 0:
+        LOGGER.debug(
+            "command returned non-zero exit (%s): %s",
+            proc.returncode,
+            args,
+        )
+    TOOLS.record_exit(args, proc.returncode or 0, bool(output))
+    return output
@@ -0,0 +1,25 @@
+"""Duration string parsing shared by CLI options and check rules."""
+
+from __future__ import annotations
+
+_UNITS = (("ms", 0.001), ("s", 1.0), ("m", 60.0), ("h", 3600.0))
+
+
+def parse_duration(text: str) -> float:
+    """Parse ``250ms``, ``1.5s``, ``5m``, ``1h`` or bare seconds into seconds.
+
+    Raises ``ValueError`` for malformed or non-positive durations.
+    """
+    value = text.strip().lower()
+    scale = 1.0
+    for suffix, factor in _UNITS:
+        if value.endswith(suffix):
+            value, scale = value[: -len(suffix)], factor
+            break
+    try:
+        seconds = float(value) * scale
+    except ValueError:
+        raise ValueError(f"invalid duration: {text!r}") from None
+    if seconds <= 0:
+        raise ValueError("duration must be positive")
+    return seconds
@@ -0,0 +1,76 @@
+"""Persistent-descriptor readers for high-frequency procfs/sysfs sampling."""
+
+from __future__ import annotations
+
+import os
+
+
+class PersistentFile:
+    """Keep a procfs/sysfs file open and re-read it from offset 0.
+
+    procfs and sysfs regenerate their contents on every read at offset 0,
+    so one descriptor can be sampled repeatedly with ``pread`` into a
+    preallocated buffer, skipping open/close, Python's io stack and text
+    decoding. Returned views alias the buffer and are only valid until the
+    next read.
+    """
+
+    __slots__ = ("path", "_fd", "_buf", "_view")
+
+    def __init__(self, path: str, size: int = 4096) -> None:
+        self.path = path
+        self._fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+        self._buf = bytearray(size)
+        self._view = memoryview(self._buf)
+
+    def _pread(self) -> int:
+        if hasattr(os, "preadv"):
+            return os.preadv(self._fd, [self._buf], 0)
+        data = os.pread(self._fd, len(self._buf), 0)
+        self._buf[: len(data)] = data
+        return len(data)
+
+    def read(self, grow: bool = True) -> memoryview:
+        """Return the file's current contents, growing the buffer if needed.
+
+        With ``grow=False`` only the first ``size`` bytes are returned, for
+        files whose interesting fields sit at the top (e.g. /proc/meminfo).
+        """
+        while True:
+            size = self._pread()
+            if size < len(self._buf) or not grow:
+                return self._view[:size]
+            # Buffer filled: the file may be longer; double it and re-read.
+            self._buf = bytearray(len(self._buf) * 2)
+            self._view = memoryview(self._buf)
+
+    def read_line(self) -> bytes:
+        """Return the first line without the trailing newline.
+
+        Only a buffer-sized prefix is read; the buffer grows only while the
+        first line does not fit, so e.g. the aggregate ``cpu`` line of
+        /proc/stat costs the same on a host with thousands of CPUs.
+        """
+        while True:
+            view = self.read(grow=False)
+            end = self._buf.find(b"\n", 0, len(view))
+            if end >= 0 or len(view) < len(self._buf):
+                return bytes(view[: len(view) if end < 0 else end])
+            self._buf = bytearray(len(self._buf) * 2)
+            self._view = memoryview(self._buf)
+
+    def read_int(self) -> int:
+        """Parse the file as one integer, the format of sysfs counters."""
+        return int(self.read().tobytes())
+
+    def close(self) -> None:
+        """Close the descriptor; further reads raise ``OSError``."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> PersistentFile:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
@@ -0,0 +1,297 @@
+"""Minimal netlink clients: rtnetlink address/route discovery and TCP sock_diag state counts."""
+
+from __future__ import annotations
+
+import os
+import socket
+import struct
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+NETLINK_ROUTE = 0
+NETLINK_SOCK_DIAG = 4
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+
+RTM_NEWADDR = 20
+RTM_GETADDR = 22
+RTM_NEWROUTE = 24
+RTM_GETROUTE = 26
+
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+IFA_LABEL = 3
+IFA_F_TENTATIVE = 0x40
+
+RTA_OIF = 4
+RTA_GATEWAY = 5
+RTA_PRIORITY = 6
+RTA_PREFSRC = 7
+RTA_TABLE = 15
+
+SOCK_DIAG_BY_FAMILY = 20
+IPPROTO_TCP = 6
+TCP_TIME_WAIT = 6
+TCP_SYN_RECV = 3
+TCP_CLOSING = 11
+# Full sockets carry attributes; time-wait and request minisockets do not.
+# Dumping the two groups separately keeps message sizes uniform per dump.
+_FULL_STATES = sum(1 << state for state in range(1, TCP_CLOSING + 1)) & ~(1 << TCP_TIME_WAIT | 1 << TCP_SYN_RECV)
+_MINI_STATES = 1 << TCP_TIME_WAIT | 1 << TCP_SYN_RECV
+
+RT_TABLE_MAIN = 254
+RTN_UNICAST = 1
+RT_SCOPE_UNIVERSE = 0
+
+_NLMSGHDR = struct.Struct("=IHHII")
+_IFADDRMSG = struct.Struct("=BBBBI")
+_RTMSG = struct.Struct("=BBBBBBBBI")
+_RTATTR = struct.Struct("=HH")
+_U32 = struct.Struct("=I")
+# inet_diag_req_v2: family, protocol, ext, pad, states, then a zeroed 48-byte inet_diag_sockid.
+_INET_DIAG_REQ = struct.Struct("=BBBxI48x")
+# Offset of inet_diag_msg.idiag_state within a reply message.
+_STATE_OFFSET = _NLMSGHDR.size + 1
+_RECV_BUFSIZE = 65536
+
+
+@dataclass
+class InterfaceAddress:
+    """One address assigned to a network interface."""
+    index: int
+    name: str
+    family: int
+    address: str
+    prefixlen: int
+    scope: int
+
+
+@dataclass
+class DefaultRoute:
+    """A default route in the main routing table."""
+    index: int
+    name: str
+    family: int
+    gateway: str | None
+    prefsrc: str | None
+    priority: int
+
+
+@dataclass
+class RoutingState:
+    """Addresses and default routes from a single netlink session."""
+    addresses: list[InterfaceAddress]
+    default_routes: list[DefaultRoute]
+
+    def addresses_for(self, index: int) -> list[InterfaceAddress]:
+        """Return addresses assigned to the interface with ``index``."""
+        return [item for item in self.addresses if item.index == index]
+
+
+def _align(length: int) -> int:
+    """Round a netlink length up to the 4-byte attribute alignment."""
+    return (length + 3) & ~3
+
+
+def _iter_messages(data: bytes) -> Iterator[tuple[int, int, bytes]]:
+    """Yield (type, seq, payload) for each netlink message in a datagram."""
+    offset = 0
+    while offset + _NLMSGHDR.size <= len(data):
+        length, msg_type, _flags, seq, _pid = _NLMSGHDR.unpack_from(data, offset)
+        if length < _NLMSGHDR.size or offset + length > len(data):
+            break
+        yield msg_type, seq, data[offset + _NLMSGHDR.size : offset + length]
+        offset += _align(length)
+
+
+def _iter_attrs(payload: bytes, offset: int) -> Iterator[tuple[int, bytes]]:
+    """Yield (type, value) for each rtattr starting at ``offset``."""
+    while offset + _RTATTR.size <= len(payload):
+        length, attr_type = _RTATTR.unpack_from(payload, offset)
+        if length < _RTATTR.size or offset + length > len(payload):
+            break
+        yield attr_type, payload[offset + _RTATTR.size : offset + length]
+        offset += _align(length)
+
+
+def _ntop(family: int, raw: bytes) -> str | None:
+    """Convert a packed address to text, ignoring malformed values."""
+    try:
+        return socket.inet_ntop(family, raw)
+    except (OSError, ValueError):
+        return None
+
+
+def parse_address(payload: bytes, names: dict[int, str]) -> InterfaceAddress | None:
+    """Decode an RTM_NEWADDR payload."""
+    if len(payload) < _IFADDRMSG.size:
+        return None
+    family, prefixlen, flags, scope, index = _IFADDRMSG.unpack_from(payload)
+    if family not in (socket.AF_INET, socket.AF_INET6) or flags & IFA_F_TENTATIVE:
+        return None
+    attrs = dict(_iter_attrs(payload, _IFADDRMSG.size))
+    # For IPv4 IFA_LOCAL is the local end; IFA_ADDRESS may be a point-to-point peer.
+    raw = attrs.get(IFA_LOCAL) or attrs.get(IFA_ADDRESS)
+    address = _ntop(family, raw) if raw else None
+    if address is None:
+        return None
+    label = attrs.get(IFA_LABEL, b"").split(b"\0", 1)[0].decode("utf-8", "replace")
+    return InterfaceAddress(
+        index=index,
+        name=names.get(index, label),
+        family=family,
+        address=address,
+        prefixlen=prefixlen,
+        scope=scope,
+    )
+
+
+def parse_default_route(payload: bytes, names: dict[int, str]) -> DefaultRoute | None:
+    """Decode an RTM_NEWROUTE payload, keeping only main-table default routes."""
+    if len(payload) < _RTMSG.size:
+        return None
+    family, dst_len, _src_len, _tos, table, _proto, _scope, route_type, _flags = _RTMSG.unpack_from(payload)
+    if dst_len != 0 or route_type != RTN_UNICAST:
+        return None
+    attrs = dict(_iter_attrs(payload, _RTMSG.size))
+    if RTA_TABLE in attrs:
+        table = _U32.unpack(attrs[RTA_TABLE][:4])[0]
+    if table != RT_TABLE_MAIN or RTA_OIF not in attrs:
+        return None
+    index = _U32.unpack(attrs[RTA_OIF][:4])[0]
+    priority = _U32.unpack(attrs[RTA_PRIORITY][:4])[0] if RTA_PRIORITY in attrs else 0
+    return DefaultRoute(
+        index=index,
+        name=names.get(index, str(index)),
+        family=family,
+        gateway=_ntop(family, attrs[RTA_GATEWAY]) if RTA_GATEWAY in attrs else None,
+        prefsrc=_ntop(family, attrs[RTA_PREFSRC]) if RTA_PREFSRC in attrs else None,
+        priority=priority,
+    )
+
+
+def _dump(sock: socket.socket, msg_type: int, body: bytes, seq: int) -> Iterator[tuple[int, bytes]]:
+    """Send a dump request and yield (type, payload) until NLMSG_DONE."""
+    header = _NLMSGHDR.pack(_NLMSGHDR.size + len(body), msg_type, NLM_F_REQUEST | NLM_F_DUMP, seq, 0)
+    sock.sendall(header + body)
+    while True:
+        data = sock.recv(_RECV_BUFSIZE)
+        if not data:
+            raise OSError("netlink socket closed during dump")
+        for reply_type, reply_seq, payload in _iter_messages(data):
+            if reply_seq != seq:
+                continue
+            if reply_type == NLMSG_DONE:
+                return
+            if reply_type == NLMSG_ERROR:
+                errno = -struct.unpack_from("=i", payload)[0] if len(payload) >= 4 else 0
+                if errno:
+                    raise OSError(errno, os.strerror(errno))
+                continue
+            yield reply_type, payload
+
+
+def read_routing_state(timeout_s: float = 1.0) -> RoutingState:
+    """Dump interface addresses and default routes over one rtnetlink socket.
+
+    Raises ``OSError`` when netlink is unavailable (non-Linux hosts, seccomp
+    sandboxes) so callers can fall back to command-based discovery.
+    """
+    family = getattr(socket, "AF_NETLINK", None)
+    if family is None:
+        raise OSError("AF_NETLINK is not supported on this platform")
+    names = dict(socket.if_nameindex())
+    with socket.socket(family, socket.SOCK_RAW | socket.SOCK_CLOEXEC, NETLINK_ROUTE) as sock:
+        sock.settimeout(timeout_s)
+        sock.bind((0, 0))
+        # The kernel runs one dump per socket at a time, so the two requests go back to back.
+        addresses = [
+            item
+            for msg_type, payload in _dump(sock, RTM_GETADDR, _IFADDRMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0), 1)
+            if msg_type == RTM_NEWADDR and (item := parse_address(payload, names)) is not None
+        ]
+        routes = [
+            item
+            for msg_type, payload in _dump(sock, RTM_GETROUTE, _RTMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0, 0, 0, 0, 0), 2)
+            if msg_type == RTM_NEWROUTE and (item := parse_default_route(payload, names)) is not None
+        ]
+    return RoutingState(addresses=addresses, default_routes=routes)
+
+
+def _uniform_states(data: bytes | bytearray, size: int) -> bytes | bytearray | None:
+    """Return the state byte of every message in a datagram of equal-sized replies.
+
+    Returns None unless every message in ``data[:size]`` is a
+    SOCK_DIAG_BY_FAMILY reply with the header of the first one, i.e. the
+    same length and type. Each check and the extraction is one strided
+    slice, so no per-message Python code runs.
+    """
+    length, msg_type, _flags, _seq, _pid = _NLMSGHDR.unpack_from(data)
+    if msg_type != SOCK_DIAG_BY_FAMILY or length <= _STATE_OFFSET or size % length:
+        return None
+    count = size // length
+    if any(data[index:size:length].count(data[index]) != count for index in range(6)):
+        return None
+    return data[_STATE_OFFSET:size:length]
+
+
+def _dump_states(sock: socket.socket, family: int, states: int, seq: int, gathered: bytearray) -> None:
+    """Dump TCP sockets of ``family`` in ``states``, appending one state byte per socket.
+
+    Replies are received into one reusable buffer and never decoded beyond
+    the state byte, so memory stays at one byte per socket.
+    """
+    body = _INET_DIAG_REQ.pack(family, IPPROTO_TCP, 0, states)
+    header = _NLMSGHDR.pack(_NLMSGHDR.size + len(body), SOCK_DIAG_BY_FAMILY, NLM_F_REQUEST | NLM_F_DUMP, seq, 0)
+    sock.sendall(header + body)
+    buf = bytearray(_RECV_BUFSIZE)
+    while True:
+        size = sock.recv_into(buf)
+        if not size:
+            raise OSError("netlink socket closed during dump")
+        uniform = _uniform_states(buf, size)
+        if uniform is not None:
+            gathered += uniform
+            continue
+        for reply_type, reply_seq, payload in _iter_messages(bytes(buf[:size])):
+            if reply_seq != seq:
+                continue
+            if reply_type == NLMSG_DONE:
+                return
+            if reply_type == NLMSG_ERROR:
+                errno = -struct.unpack_from("=i", payload)[0] if len(payload) >= 4 else 0
+                if errno:
+                    raise OSError(errno, os.strerror(errno))
+                continue
+            if reply_type == SOCK_DIAG_BY_FAMILY and len(payload) > 1:
+                gathered.append(payload[1])
+
+
+def count_states(gathered: bytes | bytearray) -> Counter[int]:
+    """Count a buffer of one-byte TCP states with one ``count`` pass per distinct state."""
+    return Counter({state: gathered.count(state) for state in set(gathered)})
+
+
+def read_tcp_states(timeout_s: float = 1.0) -> Counter[int]:
+    """Count IPv4 and IPv6 TCP sockets by kernel state number over sock_diag.
+
+    Raises ``OSError`` when sock_diag is unavailable (non-Linux hosts,
+    kernels without ``inet_diag``/``tcp_diag``, seccomp sandboxes) so
+    callers can fall back to /proc/net/tcp.
+    """
+    family = getattr(socket, "AF_NETLINK", None)
+    if family is None:
+        raise OSError("AF_NETLINK is not supported on this platform")
+    gathered = bytearray()
+    with socket.socket(family, socket.SOCK_RAW | socket.SOCK_CLOEXEC, NETLINK_SOCK_DIAG) as sock:
+        sock.settimeout(timeout_s)
+        sock.bind((0, 0))
+        seq = 0
+        for inet in (socket.AF_INET, socket.AF_INET6):
+            for states in (_FULL_STATES, _MINI_STATES):
+                seq += 1
+                _dump_states(sock, inet, states, seq, gathered)
+    return count_states(gathered)
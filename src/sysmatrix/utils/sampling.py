@@ -0,0 +1,112 @@
+"""Counter baselines shared by rate-based collectors."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+_LIVE: weakref.WeakSet[CounterBaseline] = weakref.WeakSet()
+_MAX_WAIT: ContextVar[float | None] = ContextVar("sysmatrix_max_wait", default=None)
+
+
+@contextmanager
+def max_settle_wait(seconds: float | None) -> Iterator[None]:
+    """Cap how long ``CounterBaseline.pair``/``pair_async`` may sleep in this context.
+
+    Deadline-bound collection sets this so rates are computed over whatever
+    window has elapsed instead of sleeping past the budget.
+    """
+    token = _MAX_WAIT.set(seconds)
+    try:
+        yield
+    finally:
+        _MAX_WAIT.reset(token)
+
+
+class CounterBaseline(Generic[T]):
+    """Keep the previous sample of a counter source between collections.
+
+    ``pair`` returns the previous and current samples plus the elapsed time
+    between them. The first call (or a call after the baseline went stale)
+    takes an extra sample and waits ``settle_s``; later calls reuse the
+    sample from the previous call, so repeated collection (watch mode,
+    long-lived samplers) computes rates without sleeping.
+    """
+
+    def __init__(self, sample: Callable[[], T], settle_s: float = 0.25, max_age_s: float = 60.0) -> None:
+        self._sample = sample
+        self._settle_s = settle_s
+        self._max_age_s = max_age_s
+        self._lock = threading.Lock()
+        self._previous: T | None = None
+        self._taken = 0.0
+        _LIVE.add(self)
+
+    def _stale(self, now: float) -> bool:
+        return self._previous is None or now - self._taken > self._max_age_s
+
+    def prime(self) -> None:
+        """Take a baseline sample now unless a fresh one is already held."""
+        with self._lock:
+            if self._stale(time.monotonic()):
+                self._previous = self._sample()
+                self._taken = time.monotonic()
+
+    def remaining(self) -> float:
+        """Prime the baseline if needed and return seconds until it has settled."""
+        self.prime()
+        with self._lock:
+            return max(self._settle_s - (time.monotonic() - self._taken), 0.0)
+
+    async def pair_async(self) -> tuple[T, T, float]:
+        """Like ``pair`` but waits for the settle window on the event loop.
+
+        The wait honours ``max_settle_wait`` just as ``pair`` does.
+        """
+        wait = self.remaining()
+        cap = _MAX_WAIT.get()
+        if cap is not None:
+            wait = min(wait, cap)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return self.pair()
+
+    def pair(self) -> tuple[T, T, float]:
+        """Return ``(previous, current, elapsed_s)`` and keep current as the new baseline."""
+        with self._lock:
+            if self._stale(time.monotonic()):
+                self._previous = self._sample()
+                self._taken = time.monotonic()
+            wait = self._settle_s - (time.monotonic() - self._taken)
+            cap = _MAX_WAIT.get()
+            if cap is not None:
+                wait = min(wait, cap)
+            if wait > 0:
+                time.sleep(wait)
+            current = self._sample()
+            taken = time.monotonic()
+            previous, elapsed = self._previous, taken - self._taken
+            self._previous, self._taken = current, taken
+        return previous, current, max(elapsed, 1e-6)  # type: ignore[return-value]
+
+    def reset(self) -> None:
+        """Drop the held baseline so the next call samples from scratch."""
+        with self._lock:
+            self._previous = None
+
+
+def prime_all() -> float:
+    """Prime every live baseline and return the longest remaining settle time.
+
+    Collecting a snapshot primes all counter sources up front and waits for
+    one shared window instead of letting each collector sleep in turn.
+    """
+    return max((baseline.remaining() for baseline in list(_LIVE)), default=0.0)
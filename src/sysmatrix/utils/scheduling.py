@@ -0,0 +1,57 @@
+"""Fixed-rate tick scheduling for watch mode and samplers."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+
+# Shortest supported interval; below this collection overhead dominates.
+MIN_INTERVAL_S = 0.05
+
+
+class FixedRateScheduler:
+    """Schedule ticks on a fixed grid of the monotonic clock.
+
+    Tick times are computed from the start time rather than from the end of
+    the previous tick, so the period does not drift by the time spent
+    collecting. With ``align`` the grid is phased to wall-clock multiples of
+    the interval (e.g. whole seconds), keeping samples comparable across
+    hosts. When work overruns one or more ticks, they are skipped and
+    counted in ``missed`` instead of firing in a burst.
+    """
+
+    def __init__(
+        self,
+        interval_s: float,
+        align: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if interval_s < MIN_INTERVAL_S:
+            raise ValueError(f"interval must be >= {MIN_INTERVAL_S} seconds")
+        self.interval_s = interval_s
+        self.missed = 0
+        self._clock = clock
+        self._sleep = sleep
+        now = clock()
+        # Grid point at or before now; the first tick is immediate.
+        self._origin = now - (wall_clock() % interval_s if align else 0.0)
+        self._tick = 0
+
+    def wait(self) -> int:
+        """Sleep until the next tick and return how many ticks were missed."""
+        now = self._clock()
+        due = self._origin + (self._tick + 1) * self.interval_s
+        skipped = math.floor((now - due) / self.interval_s) + 1 if now > due else 0
+        self._tick += 1 + skipped
+        if self._tick == 1 + skipped:
+            # The first tick fired immediately, off-grid; catching up to the
+            # grid after it is alignment rather than an overrun.
+            skipped = 0
+        self.missed += skipped
+        delay = self._origin + self._tick * self.interval_s - now
+        if delay > 0:
+            self._sleep(delay)
+        return skipped
@@ -0,0 +1,124 @@
+"""Availability registry for external tools run by collectors."""
+
+from __future__ import annotations
+
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+
+from sysmatrix.models import ToolStatus
+
+BASE_BACKOFF_S = 5.0
+MAX_BACKOFF_S = 300.0
+# Consecutive non-zero exits without output before a command is backed off.
+NONZERO_LIMIT = 3
+
+
+@dataclass
+class _CommandState:
+    """Failure bookkeeping for one argv."""
+
+    failures: int = 0
+    nonzero: int = 0
+    last_error: str | None = None
+    retry_at: float = 0.0
+
+
+class ToolRegistry:
+    """Resolve executables once and back off commands that keep failing.
+
+    Missing executables (ENOENT), permission errors (EACCES), timeouts and
+    repeated non-zero exits without output count as failures. A failing
+    command is skipped for ``BASE_BACKOFF_S * 2 ** (failures - 1)`` seconds,
+    capped at ``MAX_BACKOFF_S``; one success clears its record.
+    """
+
+    def __init__(
+        self,
+        base_backoff_s: float = BASE_BACKOFF_S,
+        max_backoff_s: float = MAX_BACKOFF_S,
+        nonzero_limit: int = NONZERO_LIMIT,
+    ) -> None:
+        self._base = base_backoff_s
+        self._max = max_backoff_s
+        self._nonzero_limit = nonzero_limit
+        self._lock = threading.Lock()
+        self._paths: dict[str, str | None] = {}
+        self._commands: dict[tuple[str, ...], _CommandState] = {}
+
+    def resolve(self, name: str, refresh: bool = False) -> str | None:
+        """Return the executable path for ``name``, searching PATH only once."""
+        with self._lock:
+            if not refresh and name in self._paths:
+                return self._paths[name]
+        path = shutil.which(name)
+        with self._lock:
+            self._paths[name] = path
+        return path
+
+    def acquire(self, args: list[str]) -> str | None:
+        """Return the executable to run for ``args``, or None to skip this call.
+
+        Commands in backoff are skipped without a PATH search or fork. Once
+        the backoff expires a missing executable is looked up again.
+        """
+        key = tuple(args)
+        now = time.monotonic()
+        with self._lock:
+            state = self._commands.get(key)
+            if state is not None and now < state.retry_at:
+                return None
+            retrying = state is not None and state.failures > 0
+        path = self.resolve(args[0], refresh=retrying)
+        if path is None:
+            self.record_failure(args, "ENOENT")
+        return path
+
+    def record_failure(self, args: list[str], reason: str) -> None:
+        """Count a failure for ``args`` and schedule its next retry."""
+        with self._lock:
+            state = self._commands.setdefault(tuple(args), _CommandState())
+            self._fail(state, reason)
+
+    def _fail(self, state: _CommandState, reason: str) -> None:
+        state.failures += 1
+        state.last_error = reason
+        backoff = min(self._base * 2 ** (state.failures - 1), self._max)
+        state.retry_at = time.monotonic() + backoff
+
+    def record_exit(self, args: list[str], returncode: int, has_output: bool) -> None:
+        """Record a finished run; non-zero exits only count once they repeat."""
+        key = tuple(args)
+        with self._lock:
+            if returncode == 0 or has_output:
+                self._commands.pop(key, None)
+                return
+            state = self._commands.setdefault(key, _CommandState())
+            state.nonzero += 1
+            state.last_error = f"exit {returncode}"
+            if state.nonzero >= self._nonzero_limit:
+                self._fail(state, f"exit {returncode}")
+
+    def status(self) -> dict[str, ToolStatus]:
+        """Return one status per tracked command, keyed by its command line."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                " ".join(key): ToolStatus(
+                    path=self._paths.get(key[0]),
+                    failures=state.failures,
+                    last_error=state.last_error,
+                    retry_in_s=round(state.retry_at - now, 1) if state.retry_at > now else None,
+                )
+                for key, state in sorted(self._commands.items())
+            }
+
+    def reset(self) -> None:
+        """Forget resolved paths and failure records."""
+        with self._lock:
+            self._paths.clear()
+            self._commands.clear()
+
+
+TOOLS = ToolRegistry()
@@ -54,4 +54,28 @@ def test_cli_version() -> None:
 def test_cli_rejects_invalid_watch_interval() -> None:
     proc = _run_sysmatrix(["--watch", "0"])
     assert proc.returncode != 0
-    assert "watch interval must be >= 1 second" in proc.stderr
+    assert "watch interval must be >= 0.05 seconds" in proc.stderr
+
+
+def test_cli_compact_json_mode() -> None:
+    proc = _run_sysmatrix(["--json=compact"])
+    assert proc.returncode == 0
+    assert proc.stdout.count("\n") == 1
+    payload = json.loads(proc.stdout)
+    assert list(payload)[:2] == ["system", "cpu"]
+
+
+def test_cli_check_exit_codes(tmp_path) -> None:
+    state = ["--state-file", str(tmp_path / "state.json")]
+    proc = _run_sysmatrix(["check", "--rule", "memory.total_gb > 0", *state])
+    assert proc.returncode == 2
+    assert proc.stdout.startswith("SYSMATRIX CRITICAL - ")
+
+    rules = tmp_path / "rules.txt"
+    rules.write_text("# comment\nwarn: memory.total_gb < 0\n")
+    proc = _run_sysmatrix(["check", "--rules-file", str(rules), *state])
+    assert proc.returncode == 0
+    assert proc.stdout.startswith("SYSMATRIX OK - ")
+
+    proc = _run_sysmatrix(["check", "--rule", "memory usage > 1"])
+    assert proc.returncode == 3
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Total self import time of the whole `--version` import tree (interpreter
+# startup included), in microseconds, taken as the best of STARTUP_RUNS runs.
+# The tree sums to ~46-70 ms on a developer machine; the minimum filters out
+# scheduling noise, and 120 ms still fails if a heavy stack (asyncio, json,
+# the collectors: ~75 ms more) slips back into the path.
+STARTUP_BUDGET_US = 120_000
+STARTUP_RUNS = 3
+
+# Collection/rendering stacks that must not load just to print the version.
+HEAVY_MODULES = {
+    "asyncio",
+    "subprocess",
+    "json",
+    "dataclasses",
+    "sysmatrix.snapshot",
+    "sysmatrix.collectors",
+    "sysmatrix.renderers.terminal_full",
+}
+
+
+def _import_times(args: list[str]) -> dict[str, int]:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(ROOT / "src")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "sysmatrix", *args],
+        cwd=ROOT,
+        text=True,
+        capture_output=True,
+        check=False,
+        env=env,
+    )
+    assert proc.returncode == 0, proc.stderr
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def test_version_startup_stays_within_import_budget() -> None:
+    runs = [_import_times(["--version"]) for _ in range(STARTUP_RUNS)]
+    for times in runs:
+        assert "sysmatrix.cli" in times
+        assert not HEAVY_MODULES & times.keys()
+    assert min(sum(times.values()) for times in runs) < STARTUP_BUDGET_US
+
+
+def test_help_does_not_resolve_package_metadata() -> None:
+    times = _import_times(["--help"])
+    # importlib.metadata pulls in email/ipaddress; neither is needed for help.
+    assert "importlib.metadata" not in times
+    assert "ipaddress" not in times
+    assert not HEAVY_MODULES & times.keys()
+
+
+def test_snapshot_does_not_scan_plugins_unless_asked() -> None:
+    times = _import_times(["--json=compact", "--deadline", "500ms"])
+    assert "sysmatrix.snapshot" in times
+    assert "importlib.metadata" not in times
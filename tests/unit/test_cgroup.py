@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import sysmatrix.collectors.cgroup as cgroup_mod
+from sysmatrix.utils.sampling import CounterBaseline
+
+
+def _cgroup_dir(root: Path, relative: str, files: dict[str, str]) -> Path:
+    path = root / relative
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "cgroup.controllers").write_text("cpu memory\n", encoding="utf-8")
+    for name, content in files.items():
+        (path / name).write_text(content, encoding="utf-8")
+    return path
+
+
+def test_parse_cpuset_counts_ranges() -> None:
+    assert cgroup_mod._parse_cpuset("0-3,8,10-11\n") == 7
+
+
+def test_collect_cgroup_reports_limits_and_throttling(tmp_path, monkeypatch) -> None:
+    _cgroup_dir(tmp_path, ".", {"memory.max": "max\n", "cpu.max": "max 100000\n"})
+    _cgroup_dir(tmp_path, "kubepods", {"memory.max": "2147483648\n", "cpu.max": "400000 100000\n"})
+    pod = _cgroup_dir(
+        tmp_path,
+        "kubepods/pod1",
+        {
+            "memory.max": "max\n",
+            "memory.current": "536870912\n",
+            "cpu.max": "200000 100000\n",
+            "cpuset.cpus.effective": "0-7\n",
+        },
+    )
+    stats = iter(
+        [
+            {"usage_usec": 1_000_000, "nr_periods": 100, "nr_throttled": 10, "throttled_usec": 50_000},
+            {"usage_usec": 2_000_000, "nr_periods": 110, "nr_throttled": 15, "throttled_usec": 90_000},
+        ]
+    )
+    monkeypatch.setattr(cgroup_mod, "cgroup_v2_dir", lambda: pod)
+    monkeypatch.setattr(cgroup_mod, "_BASELINE", CounterBaseline(lambda: next(stats), settle_s=0.0))
+
+    data = cgroup_mod.collect_cgroup()
+    assert data.memory_max_bytes == 2147483648
+    assert data.memory_usage_percent == 25.0
+    assert data.cpu_quota_cores == 2.0
+    assert data.effective_cpus == 8
+    assert data.throttled_usec == 40_000
+    assert data.throttled_periods_percent == 50.0
+    assert data.cpu_usage_percent is not None and data.cpu_usage_percent > 0
+
+
+def test_collect_cgroup_without_v2_hierarchy(monkeypatch) -> None:
+    monkeypatch.setattr(cgroup_mod, "cgroup_v2_dir", lambda: None)
+    assert cgroup_mod.collect_cgroup().path is None
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import sysmatrix.snapshot as snapshot_mod
+from sysmatrix.check import (
+    CRITICAL,
+    OK,
+    UNKNOWN,
+    WARNING,
+    RuleResult,
+    evaluate,
+    overall_status,
+    parse_rule,
+    render_results,
+    run_checks_async,
+)
+from sysmatrix.models import MemoryData
+
+
+def _memory(usage: float) -> MemoryData:
+    return MemoryData(total_gb=16.0, used_gb=usage * 0.16, usage_percent=usage, swap_total_gb=0.0, swap_used_gb=0.0)
+
+
+def test_parse_rule_variants() -> None:
+    rule = parse_rule("warn: memory.usage_percent >= 90 for 5m clear 80")
+    assert rule.path == ("memory", "usage_percent")
+    assert rule.op == ">="
+    assert rule.value == 90.0
+    assert rule.severity == WARNING
+    assert rule.duration_s == 300.0
+    assert rule.clear == 80.0
+
+    rule = parse_rule("performance.thermal_status == 'Critical'")
+    assert rule.value == "Critical"
+    assert rule.severity == CRITICAL
+    assert not rule.stateful
+
+
+@pytest.mark.parametrize("text", ["memory > 1", "nope.field > 1", "memory.usage_percent ~ 3", "cpu.cores > 1 for soon"])
+def test_parse_rule_rejects_invalid(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse_rule(text)
+
+
+def test_evaluate_hysteresis_keeps_rule_active_until_clear_level() -> None:
+    rule = parse_rule("memory.usage_percent > 90 clear 80")
+    state: dict[str, dict] = {}
+    assert evaluate(rule, _memory(95.0), state, now=0).status == CRITICAL
+    assert evaluate(rule, _memory(85.0), state, now=1).status == CRITICAL
+    assert evaluate(rule, _memory(79.0), state, now=2).status == OK
+    assert evaluate(rule, _memory(85.0), state, now=3).status == OK
+
+
+def test_evaluate_duration_requires_sustained_breach() -> None:
+    rule = parse_rule("warn: memory.usage_percent > 90 for 60s")
+    state: dict[str, dict] = {}
+    assert evaluate(rule, _memory(95.0), state, now=100).status == OK
+    assert evaluate(rule, _memory(95.0), state, now=130).status == OK
+    assert evaluate(rule, _memory(95.0), state, now=161).status == WARNING
+    assert evaluate(rule, _memory(50.0), state, now=170).status == OK
+    assert evaluate(rule, _memory(95.0), state, now=171).status == OK
+
+
+def test_evaluate_missing_field_is_unknown() -> None:
+    assert evaluate(parse_rule("memory.nope > 1"), _memory(1.0), {}, now=0).status == UNKNOWN
+
+
+def test_overall_status_precedence() -> None:
+    rule = parse_rule("memory.usage_percent > 1")
+    assert overall_status([RuleResult(rule, OK), RuleResult(rule, UNKNOWN)]) == UNKNOWN
+    assert overall_status([RuleResult(rule, UNKNOWN), RuleResult(rule, WARNING)]) == WARNING
+    assert overall_status([RuleResult(rule, WARNING), RuleResult(rule, CRITICAL)]) == CRITICAL
+
+
+def test_render_results_has_status_line_and_perfdata() -> None:
+    rule = parse_rule("memory.usage_percent > 90")
+    text = render_results([RuleResult(rule, CRITICAL, 93.5)])
+    assert text.splitlines()[0] == "SYSMATRIX CRITICAL - memory.usage_percent > 90 (93.5) | 'memory.usage_percent'=93.5"
+
+
+def test_checks_collect_only_referenced_domains(monkeypatch) -> None:
+    called: list[str] = []
+
+    async def _storage():
+        called.append("storage")
+        raise AssertionError("storage must not be collected")
+
+    monkeypatch.setattr(snapshot_mod, "collect_storage_async", _storage)
+    monkeypatch.setattr(snapshot_mod, "collect_memory", lambda: _memory(50.0))
+    results = asyncio.run(run_checks_async([parse_rule("memory.usage_percent > 90")], {}))
+    assert [result.status for result in results] == [OK]
+    assert called == []
+
+
+def test_checks_stop_early_once_critical(monkeypatch) -> None:
+    async def _slow():
+        await asyncio.sleep(5)
+
+    monkeypatch.setattr(snapshot_mod, "collect_system_async", _slow)
+    monkeypatch.setattr(snapshot_mod, "collect_memory", lambda: _memory(95.0))
+    rules = [parse_rule("memory.usage_percent > 90"), parse_rule("system.hostname == 'x'")]
+    results = asyncio.run(asyncio.wait_for(run_checks_async(rules, {}), timeout=2))
+    assert [result.status for result in results] == [CRITICAL, UNKNOWN]
+
+
+def test_failed_collector_is_unknown_not_evaluated(monkeypatch) -> None:
+    def _boom():
+        raise RuntimeError("meminfo unreadable")
+
+    monkeypatch.setattr(snapshot_mod, "collect_memory", _boom)
+    results = asyncio.run(run_checks_async([parse_rule("memory.usage_percent > 90")], {}))
+    assert [(result.status, result.value) for result in results] == [(UNKNOWN, None)]
+    assert render_results(results).startswith("SYSMATRIX UNKNOWN - memory.usage_percent > 90 (memory collector failed)")
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+
+import pytest
+
+from sysmatrix.cli import _config_from_args, _parse_duration, build_parser
+
+
+@pytest.mark.parametrize(
+    ("text", "seconds"),
+    [("250ms", 0.25), ("1.5s", 1.5), ("2", 2.0), (" 40MS ", 0.04)],
+)
+def test_parse_duration(text: str, seconds: float) -> None:
+    assert _parse_duration(text) == pytest.approx(seconds)
+
+
+@pytest.mark.parametrize("text", ["", "fast", "0ms", "-1s"])
+def test_parse_duration_rejects_invalid(text: str) -> None:
+    with pytest.raises(argparse.ArgumentTypeError):
+        _parse_duration(text)
+
+
+def test_deadline_option() -> None:
+    args = build_parser().parse_args(["--deadline", "250ms"])
+    assert args.deadline == pytest.approx(0.25)
+
+
+@pytest.mark.parametrize(
+    ("argv", "style"),
+    [(["--json"], "pretty"), (["--json=compact"], "compact"), (["-j", "compact"], "compact")],
+)
+def test_json_style_option(argv: list[str], style: str) -> None:
+    config = _config_from_args(build_parser().parse_args(argv))
+    assert config.json
+    assert config.json_style == style
+
+
+def test_burst_requires_watch() -> None:
+    with pytest.raises(ValueError, match="--burst requires --watch"):
+        _config_from_args(build_parser().parse_args(["--burst"]))
+    config = _config_from_args(build_parser().parse_args(["--watch", "0.5", "--burst", "20"]))
+    assert config.watch_interval == 0.5
+    assert config.burst_hz == 20
+
+
+def test_publish_option() -> None:
+    config = _config_from_args(build_parser().parse_args(["--publish", "--watch", "0.5"]))
+    assert config.publish == "sysmatrix"
+    assert config.watch_interval == 0.5
+    assert _config_from_args(build_parser().parse_args(["--publish=host"])).publish == "host"
+    with pytest.raises(ValueError, match="segment name"):
+        _config_from_args(build_parser().parse_args(["--publish=/"]))
+
+
+def test_include_virtual_option() -> None:
+    assert not _config_from_args(build_parser().parse_args([])).include_virtual
+    assert _config_from_args(build_parser().parse_args(["--include-virtual"])).include_virtual
+
+
+def test_plugins_option() -> None:
+    assert not _config_from_args(build_parser().parse_args([])).plugins
+    assert _config_from_args(build_parser().parse_args(["--plugins"])).plugins
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 from pathlib import Path
 
 import sysmatrix.collectors.gpu as gpu_mod
 import sysmatrix.collectors.network as network_mod
 import sysmatrix.collectors.storage as storage_mod
+import sysmatrix.collectors.system as system_mod
 
 
 FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "collectors"
@@ -92,44 +95,54 @@ def test_detect_card_path_prefers_boot_vga(tmp_path, monkeypatch) -> None:
     assert selected == card1
 
 
-def test_network_throughput_uses_elapsed_and_clamps_negative(tmp_path, monkeypatch) -> None:
-    stats_dir = tmp_path / "sys" / "class" / "net" / "eth0" / "statistics"
-    stats_dir.mkdir(parents=True)
-    rx = stats_dir / "rx_bytes"
-    tx = stats_dir / "tx_bytes"
-    rx.write_text("2000", encoding="utf-8")
-    tx.write_text("3000", encoding="utf-8")
+def _net_dev(rows: dict[str, tuple[int, int, int, int]]) -> str:
+    header = _fixture("proc_net_dev.txt").splitlines()[:2]
+    lines = [
+        f"{name}: {rx} {rx_pkts} 0 0 0 0 0 0 {tx} {tx_pkts} 0 0 0 0 0 0"
+        for name, (rx, rx_pkts, tx, tx_pkts) in rows.items()
+    ]
+    return "\n".join([*header, *lines]) + "\n"
 
-    monkeypatch.setattr(network_mod, "Path", lambda value: tmp_path / value.lstrip("/"))
-    perf = iter([10.0, 10.5])
-    monkeypatch.setattr(network_mod.time, "perf_counter", lambda: next(perf))
 
-    def _sleep(_seconds: float) -> None:
-        rx.write_text("1000", encoding="utf-8")
-        tx.write_text("1200", encoding="utf-8")
+def test_network_parses_all_interfaces_from_proc_net_dev() -> None:
+    counters = network_mod._parse_net_dev(_fixture("proc_net_dev.txt"))
+    assert sorted(counters) == ["docker0", "eth0", "lo", "vethab12"]
+    assert counters["eth0"] == (9000000, 7000, 3, 5, 4000000, 3000, 1, 2)
 
-    monkeypatch.setattr(network_mod.time, "sleep", _sleep)
-    assert network_mod._throughput("eth0") == "down 0.00 MB/s | up 0.00 MB/s (eth0)"
+
+def test_network_throughput_uses_elapsed_and_clamps_negative(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(network_mod, "Path", lambda value: tmp_path / value.lstrip("/"))
+    first = network_mod._parse_net_dev(_net_dev({"eth0": (2000, 10, 3000, 10)}))
+    second = network_mod._parse_net_dev(_net_dev({"eth0": (1000, 5, 1200, 5)}))
+    stats = network_mod._interface_stats(first, second, 0.5, set())
+    assert network_mod._throughput(stats[0]) == "down 0.00 MB/s | up 0.00 MB/s (eth0)"
 
 
 def test_network_throughput_calculates_rate_from_elapsed(tmp_path, monkeypatch) -> None:
-    stats_dir = tmp_path / "sys" / "class" / "net" / "wlan0" / "statistics"
-    stats_dir.mkdir(parents=True)
-    rx = stats_dir / "rx_bytes"
-    tx = stats_dir / "tx_bytes"
-    rx.write_text("0", encoding="utf-8")
-    tx.write_text("0", encoding="utf-8")
-
     monkeypatch.setattr(network_mod, "Path", lambda value: tmp_path / value.lstrip("/"))
-    perf = iter([20.0, 20.5])
-    monkeypatch.setattr(network_mod.time, "perf_counter", lambda: next(perf))
+    first = network_mod._parse_net_dev(_net_dev({"wlan0": (0, 0, 0, 0)}))
+    second = network_mod._parse_net_dev(_net_dev({"wlan0": (1_048_576, 100, 524_288, 50)}))
+    stats = network_mod._interface_stats(first, second, 0.5, set())
+    assert network_mod._throughput(stats[0]) == "down 2.00 MB/s | up 1.00 MB/s (wlan0)"
+    assert stats[0].rx_packets_per_s == 200.0
 
-    def _sleep(_seconds: float) -> None:
-        rx.write_text(str(1_048_576), encoding="utf-8")
-        tx.write_text(str(524_288), encoding="utf-8")
 
-    monkeypatch.setattr(network_mod.time, "sleep", _sleep)
-    assert network_mod._throughput("wlan0") == "down 2.00 MB/s | up 1.00 MB/s (wlan0)"
+def test_network_filters_virtual_and_computes_utilization(tmp_path, monkeypatch) -> None:
+    speed = tmp_path / "sys" / "class" / "net" / "eth0" / "speed"
+    speed.parent.mkdir(parents=True)
+    speed.write_text("1000\n", encoding="utf-8")
+    monkeypatch.setattr(network_mod, "Path", lambda value: tmp_path / value.lstrip("/"))
+
+    # 12.5 MB/s received on a 1 Gb/s link is 10% utilisation.
+    first = network_mod._parse_net_dev(_net_dev({"docker0": (0, 0, 0, 0), "eth0": (0, 0, 0, 0)}))
+    second = network_mod._parse_net_dev(
+        _net_dev({"docker0": (50_000_000, 10, 0, 0), "eth0": (12_500_000, 10, 0, 0)})
+    )
+    stats = network_mod._interface_stats(first, second, 1.0, {"docker0"})
+    network = network_mod._network_data(stats, None, "10.0.0.2", "N/A", "N/A", include_virtual=False)
+    assert network.interface == "eth0"
+    assert [item.name for item in network.interfaces] == ["eth0"]
+    assert network.interfaces[0].utilization_percent == 10.0
 
 
 def test_network_ip_prefers_non_loopback_hostname_address(monkeypatch) -> None:
@@ -189,3 +202,30 @@ def test_storage_wear_parses_media_wearout_indicator(monkeypatch) -> None:
     fixture = _fixture("smartctl_sata_media_wearout.txt")
     monkeypatch.setattr(storage_mod, "run_command", lambda _args: fixture)
     assert storage_mod._wear_from_smart("sda") == 6
+
+
+def test_network_async_reads_routing_off_the_loop(monkeypatch) -> None:
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def _routing():
+        threads.append(threading.get_ident())
+        return None
+
+    monkeypatch.setattr(network_mod, "_routing_state", _routing)
+    asyncio.run(network_mod.collect_network_async())
+    assert threads and threads[0] != loop_thread
+
+
+def test_system_uptime_matches_uptime_p_format(tmp_path, monkeypatch) -> None:
+    assert system_mod._format_uptime_seconds(59.9) == "0 minutes"
+    assert system_mod._format_uptime_seconds(3720.5) == "1 hour, 2 minutes"
+    assert system_mod._format_uptime_seconds(8 * 86400 + 60) == "1 week, 1 day, 1 minute"
+    uptime = tmp_path / "uptime"
+    uptime.write_text("90061.25 170000.10\n")
+    monkeypatch.setattr(system_mod, "_UPTIME", uptime)
+    monkeypatch.setattr(system_mod, "run_command", lambda _args: "unused")
+    assert system_mod._read_uptime() == "1 day, 1 hour, 1 minute"
+    monkeypatch.setattr(system_mod, "_UPTIME", tmp_path / "missing")
+    monkeypatch.setattr(system_mod, "run_command", lambda _args: "up 3 hours")
+    assert system_mod._read_uptime() == "3 hours"
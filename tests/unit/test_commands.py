@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+
+import pytest
+
+import sysmatrix.utils.commands as commands_mod
+from sysmatrix.utils.commands import run_command, run_command_async
+from sysmatrix.utils.tools import TOOLS
+
+
+@pytest.fixture(autouse=True)
+def _fresh_single_flight(monkeypatch):
+    """Give each test its own single-flight table and TTL cache, and no tool backoff."""
+    monkeypatch.setattr(commands_mod, "_SINGLE_FLIGHT", commands_mod._SingleFlight())
+    TOOLS.reset()
+    yield
+    TOOLS.reset()
+
+
+def test_run_command_async_returns_stdout() -> None:
+    out = asyncio.run(run_command_async([sys.executable, "-c", "print(' hello ')"]))
+    assert out == "hello"
+
+
+def test_run_command_async_missing_executable_returns_empty() -> None:
+    assert asyncio.run(run_command_async(["sysmatrix-definitely-missing-tool"])) == ""
+
+
+def test_run_command_async_times_out() -> None:
+    out = asyncio.run(run_command_async([sys.executable, "-c", "import time; time.sleep(5)"], timeout_s=0.2))
+    assert out == ""
+
+
+def test_run_command_async_cancellation_kills_child(tmp_path) -> None:
+    marker = tmp_path / "survived"
+    script = f"import time; time.sleep(0.5); open({str(marker)!r}, 'w').close()"
+
+    async def _scenario() -> None:
+        task = asyncio.create_task(run_command_async([sys.executable, "-c", script]))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await asyncio.sleep(1.0)
+
+    asyncio.run(_scenario())
+    assert not marker.exists()
+
+
+def test_run_command_async_cancellation_reaps_child(monkeypatch) -> None:
+    spawned = []
+    create = asyncio.create_subprocess_exec
+
+    async def _create(*args, **kwargs):
+        proc = await create(*args, **kwargs)
+        spawned.append(proc)
+        return proc
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _create)
+
+    async def _scenario() -> None:
+        task = asyncio.create_task(run_command_async([sys.executable, "-c", "import time; time.sleep(5)"]))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        # Reaped before the cancellation propagated, not by a later event.
+        assert spawned[0].returncode is not None
+
+    asyncio.run(_scenario())
+
+
+def _counting_script(path) -> str:
+    return f"import time; open({str(path)!r}, 'a').write('x'); time.sleep(0.3); print('done')"
+
+
+def test_run_command_shares_concurrent_identical_calls(tmp_path) -> None:
+    log = tmp_path / "runs"
+    args = [sys.executable, "-c", _counting_script(log)]
+    results: list[str] = []
+    threads = [threading.Thread(target=lambda: results.append(run_command(args))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["done"] * 4
+    assert log.read_text() == "x"
+
+
+def test_run_command_async_shares_concurrent_identical_calls(tmp_path) -> None:
+    log = tmp_path / "runs"
+    args = [sys.executable, "-c", _counting_script(log)]
+
+    async def _scenario() -> list[str]:
+        return await asyncio.gather(*(run_command_async(args) for _ in range(3)))
+
+    assert asyncio.run(_scenario()) == ["done"] * 3
+    assert log.read_text() == "x"
+
+
+def test_run_command_ttl_reuses_recent_result(tmp_path) -> None:
+    log = tmp_path / "runs"
+    args = [sys.executable, "-c", f"open({str(log)!r}, 'a').write('x'); print('ok')"]
+    assert run_command(args, ttl_s=5.0) == "ok"
+    assert asyncio.run(run_command_async(args, ttl_s=5.0)) == "ok"
+    assert run_command(args) == "ok"
+    assert log.read_text() == "x"
+
+
+def test_cancelling_one_waiter_keeps_shared_child(tmp_path) -> None:
+    log = tmp_path / "runs"
+    args = [sys.executable, "-c", _counting_script(log)]
+
+    async def _scenario() -> str:
+        first = asyncio.create_task(run_command_async(args))
+        second = asyncio.create_task(run_command_async(args))
+        await asyncio.sleep(0.1)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(_scenario()) == "done"
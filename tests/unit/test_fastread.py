@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+import sysmatrix.collectors.burst as burst_mod
+from sysmatrix.collectors.burst import BurstSampler, _cpu_times, _meminfo_kb
+from sysmatrix.utils.fastread import PersistentFile
+
+
+def test_persistent_file_rereads_from_offset_zero(tmp_path) -> None:
+    path = tmp_path / "counter"
+    path.write_text("12\n")
+    with PersistentFile(str(path), size=16) as handle:
+        assert handle.read_int() == 12
+        path.write_text("345\n")
+        assert handle.read_int() == 345
+
+
+def test_persistent_file_grows_buffer(tmp_path) -> None:
+    path = tmp_path / "stat"
+    body = "cpu  1 2 3 4\n" + "x" * 100 + "\n"
+    path.write_text(body)
+    with PersistentFile(str(path), size=8) as handle:
+        assert handle.read().tobytes() == body.encode()
+        assert handle.read_line() == b"cpu  1 2 3 4"
+        assert len(handle.read(grow=False)) == len(body)
+
+
+def test_persistent_file_prefix_read(tmp_path) -> None:
+    path = tmp_path / "meminfo"
+    path.write_text("MemTotal: 100 kB\n" * 20)
+    with PersistentFile(str(path), size=32) as handle:
+        assert handle.read(grow=False).tobytes() == b"MemTotal: 100 kB\nMemTotal: 100 k"
+
+
+def test_persistent_file_read_line_reads_a_prefix(tmp_path) -> None:
+    path = tmp_path / "stat"
+    path.write_text("cpu  1 2\n" + "cpu0 1 2\n" * 100)
+    with PersistentFile(str(path), size=16) as handle:
+        assert handle.read_line() == b"cpu  1 2"
+        assert len(handle.read(grow=False)) == 16
+        path.write_text("cpu  " + "1 " * 20 + "\ncpu0 1\n")
+        assert handle.read_line() == b"cpu  " + b"1 " * 20
+
+
+def test_burst_parsers() -> None:
+    assert _cpu_times(b"cpu  10 0 5 80 3 1 1 0 0 0") == (80, 100)
+    raw = b"MemTotal:       16000 kB\nMemFree:  1000 kB\nMemAvailable:    4000 kB\n"
+    assert _meminfo_kb(raw, b"MemTotal:") == 16000
+    assert _meminfo_kb(raw, b"MemAvailable:") == 4000
+    assert _meminfo_kb(raw, b"SwapTotal:") is None
+
+
+def test_burst_sampler_reports_peaks() -> None:
+    with BurstSampler(hz=100) as sampler:
+        time.sleep(0.3)
+        data = sampler.drain()
+    assert data.samples > 5
+    assert data.hz == 100
+    assert data.memory_peak_percent is not None
+    assert sampler.drain().samples == 0
+
+
+def test_burst_sampler_rejects_out_of_range_rate() -> None:
+    with pytest.raises(ValueError):
+        BurstSampler(hz=500)
+
+
+def test_burst_sampler_start_raises_when_sources_fail(monkeypatch) -> None:
+    def _unreadable(path: str, size: int = 4096) -> PersistentFile:
+        raise PermissionError(path)
+
+    monkeypatch.setattr(burst_mod, "PersistentFile", _unreadable)
+    sampler = BurstSampler(hz=50)
+    with pytest.raises(PermissionError):
+        sampler.start()
+    sampler.stop()
+
+
+def test_burst_sampler_drain_raises_after_thread_error(monkeypatch) -> None:
+    def _broken(line: bytes) -> tuple[int, int]:
+        raise ValueError(line)
+
+    monkeypatch.setattr(burst_mod, "_cpu_times", _broken)
+    sampler = BurstSampler(hz=50).start()
+    sampler._thread.join(1.0)
+    with pytest.raises(RuntimeError, match="burst sampler stopped"):
+        sampler.drain()
+    sampler.stop()
+
+
+def test_burst_sources_skip_interface_that_vanishes_mid_read(tmp_path) -> None:
+    class _Counter:
+        def __init__(self, value: int | None) -> None:
+            self.value = value
+
+        def read_int(self) -> int:
+            if self.value is None:
+                raise OSError("interface removed")
+            return self.value
+
+    stat = tmp_path / "stat"
+    stat.write_text("cpu  10 0 5 80 3 1 1 0 0 0\n")
+    sources = object.__new__(burst_mod._Sources)
+    sources.stat = PersistentFile(str(stat))
+    gone = (_Counter(1000), _Counter(None))
+    sources.net = [gone, (_Counter(5), _Counter(7))]
+    try:
+        _now, idle, total, rx, tx = sources.sample()
+    finally:
+        sources.stat.close()
+    assert (idle, total, rx, tx) == (80, 100, 5, 7)
+    assert gone not in sources.net
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+
+import sysmatrix.collectors.interrupts as irq_mod
+from sysmatrix.collectors.interrupts import CounterTable, analyze, parse_table, table_deltas
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "collectors"
+
+
+def _fixture(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+def _advance(table: CounterTable, rows: dict[bytes, list[int]]) -> CounterTable:
+    """Return ``table`` with per-CPU increments added to the given rows."""
+    width = len(table.cpus)
+    values = array("Q", table.values)
+    for label, increments in rows.items():
+        row = table.labels.index(label)
+        for col, increment in enumerate(increments):
+            values[row * width + col] += increment
+    return CounterTable(table.cpus, table.labels, table.descriptions, values)
+
+
+def test_parse_interrupts_table() -> None:
+    table = parse_table(_fixture("proc_interrupts.txt"))
+    assert table.cpus == [0, 1, 2, 3]
+    assert table.labels == [b"0", b"24", b"25", b"NMI", b"LOC"]
+    assert table.descriptions[1] == "PCI-MSI 524288-edge eth0-rx-0"
+    assert table.values[4:8].tolist() == [1000, 0, 0, 0]
+    assert len(table.values) == 5 * 4
+
+
+def test_parse_softirqs_table() -> None:
+    table = parse_table(_fixture("proc_softirqs.txt"))
+    assert table.labels == [b"HI", b"TIMER", b"NET_RX"]
+    assert table.descriptions == ["", "", ""]
+
+
+def test_deltas_handle_wrap_and_new_rows() -> None:
+    before = CounterTable([0, 1], [b"24", b"LOC"], ["", ""], array("Q", [2**32 - 10, 5, 100, 100]))
+    now = CounterTable([0, 1], [b"24", b"LOC"], ["", ""], array("Q", [20, 15, 150, 100]))
+    assert table_deltas(before, now) == [30, 10, 50, 0]
+
+    hotplugged = CounterTable([0, 1], [b"24", b"30", b"LOC"], ["", "", ""], array("Q", [20, 15, 7, 7, 150, 100]))
+    assert table_deltas(before, hotplugged) == [30, 10, 0, 0, 50, 0]
+
+
+def test_analyze_flags_hot_cpu_and_imbalanced_sources() -> None:
+    irqs = parse_table(_fixture("proc_interrupts.txt"))
+    softirqs = parse_table(_fixture("proc_softirqs.txt"))
+    irqs_after = _advance(
+        irqs,
+        {b"24": [4000, 0, 0, 0], b"25": [50, 50, 50, 50], b"LOC": [250, 250, 250, 250]},
+    )
+    softirqs_after = _advance(softirqs, {b"NET_RX": [3000, 10, 0, 0], b"TIMER": [250, 250, 250, 250]})
+
+    data = analyze(
+        (irqs_after, table_deltas(irqs, irqs_after)),
+        (softirqs_after, table_deltas(softirqs, softirqs_after)),
+        2.0,
+    )
+    assert data.available
+    assert data.cpu_count == 4
+    assert data.irq_per_s == 2600.0
+    assert data.softirq_per_s == 2005.0
+    assert [item.cpu for item in data.hot_cpus] == [0]
+    assert data.hot_cpus[0].irq_per_s == 2150.0
+    assert data.hot_cpus[0].softirq_per_s == 1625.0
+    assert [(item.kind, item.name) for item in data.imbalanced] == [("irq", "24"), ("softirq", "NET_RX")]
+    assert data.imbalanced[0].description == "PCI-MSI 524288-edge eth0-rx-0"
+    assert data.imbalanced[0].top_cpu_percent == 100.0
+    assert data.imbalanced[1].top_cpu_percent == 99.7
+    assert data.top_sources[0].name == "24"
+
+
+def test_single_cpu_host_is_never_imbalanced() -> None:
+    before = CounterTable([0], [b"24"], ["eth0"], array("Q", [0]))
+    now = CounterTable([0], [b"24"], ["eth0"], array("Q", [100_000]))
+    empty = CounterTable([], [], [], array("Q"))
+    data = analyze((now, table_deltas(before, now)), (empty, []), 1.0)
+    assert data.hot_cpus == [] and data.imbalanced == []
+    assert data.top_sources[0].per_s == 100_000.0
+
+
+def test_collect_interrupts_from_fixture(monkeypatch) -> None:
+    monkeypatch.setattr(irq_mod, "INTERRUPTS_PATH", str(FIXTURES / "proc_interrupts.txt"))
+    monkeypatch.setattr(irq_mod, "SOFTIRQS_PATH", str(FIXTURES / "missing_softirqs"))
+    irq_mod._BASELINE.reset()
+    try:
+        data = irq_mod.collect_interrupts()
+    finally:
+        irq_mod._BASELINE.reset()
+    assert data.available
+    assert data.irq_per_s == 0.0 and data.softirq_per_s == 0.0
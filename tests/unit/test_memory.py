@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import sysmatrix.collectors.memory as memory_mod
+
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "collectors"
+
+
+def _fixture(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+def test_meminfo_breakdown() -> None:
+    mem = memory_mod._parse_meminfo_bytes(_fixture("proc_meminfo.txt"))
+    assert mem["HugePages_Total"] == 8
+    detail = memory_mod._breakdown(mem)
+    assert detail.cached_mb == 7168.0
+    assert detail.buffers_mb == 392.7
+    assert detail.dirty_mb == 2.0
+    assert detail.slab_mb == 800.0
+    assert detail.slab_reclaimable_mb == 600.0
+    assert detail.anon_huge_mb == 200.0
+    assert (detail.hugepages_total, detail.hugepages_free, detail.hugepage_size_kb) == (8, 6, 2048)
+    assert detail.zswap_mb == 10.0
+    assert detail.zswapped_mb == 40.0
+
+
+def test_breakdown_fields_missing_on_older_kernels() -> None:
+    detail = memory_mod._breakdown({"MemTotal": 1024, "MemFree": 512})
+    assert detail.free_mb == 0.5
+    assert detail.zswap_mb is None
+    assert detail.hugepages_total is None
+
+
+def test_vmstat_rates() -> None:
+    before = memory_mod._parse_vmstat(_fixture("proc_vmstat.txt"))
+    now = dict(before)
+    now[b"pgfault"] += 2000
+    now[b"pgmajfault"] += 10
+    now[b"pswpout"] += 50
+    now[b"pgscan_direct"] += 400
+    now[b"allocstall_normal"] += 2
+    now[b"compact_stall"] += 1
+    rates = memory_mod._vmstat_rates(before, now, elapsed=2.0)
+    assert rates.pgfault_per_s == 1000.0
+    assert rates.pgmajfault_per_s == 5.0
+    assert rates.pswpin_per_s == 0.0
+    assert rates.pswpout_per_s == 25.0
+    assert rates.direct_reclaim_pages_per_s == 200.0
+    assert rates.allocstall_per_s == 1.0
+    assert rates.compact_stall_per_s == 0.5
+
+
+def test_vmstat_sample_skips_throttle_counter(monkeypatch) -> None:
+    monkeypatch.setattr(memory_mod, "_read", lambda _path: _fixture("proc_vmstat.txt"))
+    sample = memory_mod._sample_vmstat()
+    assert b"pgscan_direct_throttle" not in sample
+    assert b"nr_free_pages" not in sample
+    assert sample[b"pgscan_direct"] == 3000
+
+
+def test_vmstat_rates_missing_counters_are_none() -> None:
+    rates = memory_mod._vmstat_rates({}, {}, elapsed=1.0)
+    assert rates.pgfault_per_s is None
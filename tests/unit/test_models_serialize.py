@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from sysmatrix import defaults
+from sysmatrix.models import (
+    REDACTED,
+    DomainStatus,
+    InterfaceStats,
+    ProcessStats,
+    Snapshot,
+    SnapshotMeta,
+    ToolStatus,
+)
+
+
+def _snapshot() -> Snapshot:
+    network = defaults.default_network()
+    network.ip = "10.0.0.5"
+    network.interfaces = [
+        InterfaceStats(
+            name="eth0",
+            virtual=False,
+            rx_bytes=10,
+            tx_bytes=20,
+            rx_bytes_per_s=1.0,
+            tx_bytes_per_s=2.0,
+            rx_packets_per_s=0.5,
+            tx_packets_per_s=0.5,
+            rx_errors=0,
+            tx_errors=0,
+            rx_dropped=0,
+            tx_dropped=0,
+            speed_mbps=1000,
+            utilization_percent=0.1,
+            addresses=["10.0.0.5/24", "fe80::1/64"],
+        )
+    ]
+    processes = defaults.default_processes()
+    processes.top_cpu = [ProcessStats(1, "init", "S", 0.5, 12.0, None, 3.0)]
+    return Snapshot(
+        system=defaults.default_system(),
+        cpu=defaults.default_cpu(),
+        memory=defaults.default_memory(),
+        gpu=defaults.default_gpu(),
+        storage=defaults.default_storage(),
+        motherboard=defaults.default_motherboard(),
+        network=network,
+        performance=defaults.default_performance(),
+        processes=processes,
+        pressure=defaults.default_pressure(),
+        cgroup=None,
+        meta=SnapshotMeta(
+            domains={"cpu": DomainStatus(state="stale", age_s=1.5)},
+            tools={"sensors": ToolStatus(path=None, failures=1, last_error="ENOENT", retry_in_s=5.0)},
+        ),
+    )
+
+
+def test_to_dict_matches_asdict() -> None:
+    snapshot = _snapshot()
+    assert snapshot.to_dict() == dataclasses.asdict(snapshot)
+
+
+def test_to_dict_redacts_while_serializing() -> None:
+    snapshot = _snapshot()
+    data = snapshot.to_dict(redact=True)
+    assert data["system"]["user"] == REDACTED
+    assert data["system"]["hostname"] == REDACTED
+    assert data["network"]["ip"] == REDACTED
+    assert data["network"]["interfaces"][0]["addresses"] == [REDACTED, REDACTED]
+    # The snapshot itself is untouched.
+    assert snapshot.network.ip == "10.0.0.5"
+
+
+def test_models_are_slotted() -> None:
+    with pytest.raises(AttributeError):
+        _snapshot().cpu.unknown_field = 1  # type: ignore[attr-defined]
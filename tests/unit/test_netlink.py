@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import socket
+import struct
+
+import pytest
+
+import sysmatrix.collectors.network as network_mod
+from sysmatrix.utils import netlink
+
+
+def _attr(attr_type: int, value: bytes) -> bytes:
+    length = 4 + len(value)
+    return struct.pack("=HH", length, attr_type) + value + b"\0" * ((4 - length % 4) % 4)
+
+
+def _message(msg_type: int, seq: int, payload: bytes) -> bytes:
+    return struct.pack("=IHHII", 16 + len(payload), msg_type, 0, seq, 0) + payload
+
+
+def _addr_payload(family: int, index: int, address: str, scope: int, label: bytes = b"") -> bytes:
+    raw = socket.inet_pton(family, address)
+    body = struct.pack("=BBBBI", family, 24, 0, scope, index) + _attr(netlink.IFA_ADDRESS, raw)
+    if family == socket.AF_INET:
+        body += _attr(netlink.IFA_LOCAL, raw)
+    if label:
+        body += _attr(netlink.IFA_LABEL, label + b"\0")
+    return body
+
+
+def _route_payload(index: int, gateway: str, priority: int, dst_len: int = 0) -> bytes:
+    body = struct.pack("=BBBBBBBBI", socket.AF_INET, dst_len, 0, 0, netlink.RT_TABLE_MAIN, 3, 0, 1, 0)
+    body += _attr(netlink.RTA_OIF, struct.pack("=I", index))
+    body += _attr(netlink.RTA_GATEWAY, socket.inet_pton(socket.AF_INET, gateway))
+    body += _attr(netlink.RTA_PRIORITY, struct.pack("=I", priority))
+    return body
+
+
+def test_netlink_iterates_messages_and_decodes_addresses() -> None:
+    data = _message(netlink.RTM_NEWADDR, 1, _addr_payload(socket.AF_INET, 2, "10.42.0.23", 0, b"eth0"))
+    data += _message(netlink.RTM_NEWADDR, 1, _addr_payload(socket.AF_INET6, 2, "2001:db8::23", 0))
+    data += _message(netlink.NLMSG_DONE, 1, struct.pack("=i", 0))
+
+    messages = list(netlink._iter_messages(data))
+    assert [msg_type for msg_type, _seq, _payload in messages] == [
+        netlink.RTM_NEWADDR,
+        netlink.RTM_NEWADDR,
+        netlink.NLMSG_DONE,
+    ]
+    v4 = netlink.parse_address(messages[0][2], {})
+    v6 = netlink.parse_address(messages[1][2], {2: "eth0"})
+    assert v4 is not None and (v4.name, v4.address) == ("eth0", "10.42.0.23")
+    assert v6 is not None and (v6.name, v6.address) == ("eth0", "2001:db8::23")
+
+
+def test_netlink_keeps_only_default_routes() -> None:
+    default = netlink.parse_default_route(_route_payload(3, "10.42.0.1", 100), {3: "wlan0"})
+    subnet = netlink.parse_default_route(_route_payload(3, "10.42.0.1", 100, dst_len=24), {3: "wlan0"})
+    assert default is not None
+    assert (default.name, default.gateway, default.priority) == ("wlan0", "10.42.0.1", 100)
+    assert subnet is None
+
+
+def test_network_ip_uses_default_route_interface_address() -> None:
+    routing = netlink.RoutingState(
+        addresses=[
+            netlink.InterfaceAddress(1, "lo", socket.AF_INET, "127.0.0.1", 8, 254),
+            netlink.InterfaceAddress(2, "docker0", socket.AF_INET, "172.17.0.1", 16, 0),
+            netlink.InterfaceAddress(3, "wlan0", socket.AF_INET, "10.42.0.23", 24, 0),
+        ],
+        default_routes=[netlink.DefaultRoute(3, "wlan0", socket.AF_INET, "10.42.0.1", None, 600)],
+    )
+    assert network_mod._ip_address(routing) == "10.42.0.23"
+
+
+def _diag(seq: int, state: int, attrs: bytes = b"") -> bytes:
+    """Build an inet_diag_msg reply for one socket in ``state``."""
+    return _message(netlink.SOCK_DIAG_BY_FAMILY, seq, bytes((socket.AF_INET, state)) + bytes(70) + attrs)
+
+
+class _DiagSocket:
+    def __init__(self, datagrams: list[bytes]) -> None:
+        self.datagrams = datagrams
+        self.sent: list[bytes] = []
+
+    def sendall(self, data: bytes) -> None:
+        self.sent.append(data)
+
+    def recv_into(self, buf: bytearray) -> int:
+        data = self.datagrams.pop(0)
+        buf[: len(data)] = data
+        return len(data)
+
+
+def test_uniform_datagram_states_are_sliced_out() -> None:
+    shutdown = _attr(8, b"\0")
+    uniform = b"".join(_diag(1, state, shutdown) for state in (1, 1, 10, 8))
+    assert netlink._uniform_states(uniform, len(uniform)) == bytes((1, 1, 10, 8))
+
+    mixed = _diag(1, 1, shutdown) + _diag(1, 6)
+    assert netlink._uniform_states(mixed, len(mixed)) is None
+    done = _message(netlink.NLMSG_DONE, 1, struct.pack("=i", 0))
+    assert netlink._uniform_states(done, len(done)) is None
+
+
+def test_sock_diag_dump_walks_mixed_datagrams_until_done() -> None:
+    uniform = b"".join(_diag(3, 1, _attr(8, b"\0")) for _ in range(3))
+    mixed = _diag(3, 10, _attr(8, b"\0")) + _diag(3, 6) + _message(netlink.NLMSG_DONE, 3, struct.pack("=i", 0))
+    sock = _DiagSocket([uniform, mixed])
+    gathered = bytearray()
+
+    netlink._dump_states(sock, socket.AF_INET6, netlink._FULL_STATES, 3, gathered)  # type: ignore[arg-type]
+    assert netlink.count_states(gathered) == {1: 3, 10: 1, 6: 1}
+    family, protocol, _ext, states = struct.unpack_from("=BBBxI", sock.sent[0], 16)
+    assert (family, protocol) == (socket.AF_INET6, netlink.IPPROTO_TCP)
+    assert states & 1 << 1 and not states & (1 << netlink.TCP_TIME_WAIT | 1 << netlink.TCP_SYN_RECV)
+
+
+def test_sock_diag_dump_raises_kernel_errors() -> None:
+    error = _message(netlink.NLMSG_ERROR, 1, struct.pack("=i", -2) + bytes(16))
+    sock = _DiagSocket([error])
+    with pytest.raises(OSError):
+        netlink._dump_states(sock, socket.AF_INET, netlink._MINI_STATES, 1, bytearray())  # type: ignore[arg-type]
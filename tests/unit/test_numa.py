@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import sysmatrix.collectors.numa as numa_mod
+
+
+def _node(root, node: int, total_kb: int, free_kb: int, hit: int, other: int, cpus: str) -> None:
+    base = root / f"node{node}"
+    base.mkdir()
+    (base / "meminfo").write_text(
+        f"Node {node} MemTotal:       {total_kb} kB\n"
+        f"Node {node} MemFree:        {free_kb} kB\n"
+        f"Node {node} MemUsed:        {total_kb - free_kb} kB\n"
+    )
+    (base / "numastat").write_text(
+        f"numa_hit {hit}\nnuma_miss {other}\nnuma_foreign 0\ninterleave_hit 5\nlocal_node {hit}\nother_node {other}\n"
+    )
+    (base / "cpulist").write_text(cpus + "\n")
+
+
+def test_parsers() -> None:
+    meminfo = b"Node 1 MemTotal:  2048 kB\nNode 1 MemFree:   1024 kB\nNode 1 Dirty: 4 kB\n"
+    assert numa_mod._parse_node_meminfo(meminfo) == {b"MemTotal": 2048, b"MemFree": 1024}
+    assert numa_mod._parse_numastat(b"numa_hit 10\ninterleave_hit 3\nother_node 2\n") == {
+        b"numa_hit": 10,
+        b"other_node": 2,
+    }
+    assert numa_mod._count_cpus(b"0-3,8,10-11") == 7
+
+
+def test_collect_numa_per_node_rates(tmp_path, monkeypatch) -> None:
+    _node(tmp_path, 0, 8 * 1024 * 1024, 512 * 1024, hit=1000, other=0, cpus="0-7")
+    _node(tmp_path, 1, 8 * 1024 * 1024, 6 * 1024 * 1024, hit=500, other=100, cpus="8-15")
+    (tmp_path / "possible").write_text("0-1\n")
+    monkeypatch.setattr(numa_mod, "NODE_ROOT", str(tmp_path))
+    before = numa_mod._sample()
+    numastat = tmp_path / "node1" / "numastat"
+    numastat.write_text("numa_hit 800\nnuma_miss 200\nnuma_foreign 0\nlocal_node 800\nother_node 200\n")
+    now = numa_mod._sample()
+
+    node0 = numa_mod._node_stats(0, before[0], now[0], elapsed=1.0)
+    assert node0.cpus == 8
+    assert node0.mem_total_mb == 8192.0
+    assert node0.mem_free_mb == 512.0
+    assert node0.mem_used_percent == 93.8
+    assert node0.numa_hit_per_s == 0.0
+    assert node0.local_percent is None
+
+    node1 = numa_mod._node_stats(1, before[1], now[1], elapsed=2.0)
+    assert node1.numa_hit_per_s == 150.0
+    assert node1.numa_miss_per_s == 50.0
+    assert node1.other_node_per_s == 50.0
+    assert node1.local_percent == 75.0
+
+
+def test_collect_numa_without_sysfs(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(numa_mod, "NODE_ROOT", str(tmp_path / "missing"))
+    numa_mod._BASELINE.reset()
+    try:
+        data = numa_mod.collect_numa()
+    finally:
+        numa_mod._BASELINE.reset()
+    assert not data.available
+    assert data.nodes == []
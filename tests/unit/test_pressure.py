@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import sysmatrix.collectors.performance as perf_mod
+import sysmatrix.collectors.pressure as pressure_mod
+from sysmatrix.models import PressureData, PressureStats
+from sysmatrix.utils import cgroups
+
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "collectors"
+
+
+def _stats(resource: str, some: float, full: float | None, full_stall_us: int | None = None) -> PressureStats:
+    return PressureStats(
+        resource=resource,
+        some_avg10=some,
+        some_avg60=some,
+        some_stall_us=None,
+        full_avg10=full,
+        full_avg60=full,
+        full_stall_us=full_stall_us,
+    )
+
+
+def test_parse_psi_reads_some_and_full_lines() -> None:
+    parsed = pressure_mod._parse_psi((FIXTURES / "pressure_memory.txt").read_text(encoding="utf-8"))
+    assert parsed["some"] == (12.5, 8.25, 48213377)
+    assert parsed["full"] == (7.4, 4.05, 29011254)
+
+
+def test_pressure_stats_report_stall_deltas() -> None:
+    before = {"some": (1.0, 1.0, 1_000), "full": (0.5, 0.5, 400)}
+    now = {"some": (1.0, 1.0, 26_000), "full": (0.5, 0.5, 400)}
+    stats = pressure_mod._stats("io", before, now)
+    assert stats.some_stall_us == 25_000
+    assert stats.full_stall_us == 0
+
+
+def test_bottleneck_prefers_memory_stalls_over_utilization(monkeypatch) -> None:
+    monkeypatch.setattr(perf_mod, "run_command", lambda _args: "")
+    pressure = PressureData(
+        available=True,
+        window_s=0.5,
+        system=[_stats("cpu", 2.0, None), _stats("memory", 20.0, 9.0, full_stall_us=50_000)],
+        cgroup=[],
+        cgroup_path=None,
+    )
+    perf = perf_mod.collect_performance(cpu_usage=95.0, gpu_usage=10.0, iowait=1.0, steal=0.0, pressure=pressure)
+    assert perf.bottleneck == "Memory Pressure (PSI full: 10.0%)"
+
+
+def test_bottleneck_reports_iowait_without_psi(monkeypatch) -> None:
+    monkeypatch.setattr(perf_mod, "run_command", lambda _args: "")
+    perf = perf_mod.collect_performance(cpu_usage=30.0, gpu_usage=None, iowait=35.0, steal=0.0)
+    assert perf.bottleneck == "I/O Bound (PSI full: N/A, iowait: 35.0%)"
+
+
+def test_cgroup_unified_path_parses_v2_entry() -> None:
+    assert cgroups._unified_path("0::/kubepods/pod1/ctr\n") == "/kubepods/pod1/ctr"
+    assert cgroups._unified_path("4:memory:/docker/abc\n") is None
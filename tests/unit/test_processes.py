@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import sysmatrix.collectors.processes as proc_mod
+from sysmatrix.utils.sampling import CounterBaseline
+
+
+def _write_pid(root: Path, pid: int, comm: str, state: str, ticks: int, rss_pages: int, io: tuple[int, int] | None) -> None:
+    pid_dir = root / str(pid)
+    pid_dir.mkdir(exist_ok=True)
+    # Fields after comm: state ... utime(14) stime(15) ... starttime(22) ... rss(24).
+    rest = [state] + ["0"] * 10 + [str(ticks), "0"] + ["0"] * 6 + ["1000", "0", str(rss_pages)] + ["0"] * 20
+    (pid_dir / "stat").write_text(f"{pid} ({comm}) " + " ".join(rest) + "\n", encoding="utf-8")
+    if io is not None:
+        (pid_dir / "io").write_text(
+            f"rchar: 0\nwchar: 0\nread_bytes: {io[0]}\nwrite_bytes: {io[1]}\n", encoding="utf-8"
+        )
+
+
+def test_parse_stat_handles_spaces_and_parens_in_comm() -> None:
+    data = b"42 (tmux: server (x)) S 1 42 42 0 -1 4194560 0 0 0 0 70 30 0 0 20 0 1 0 555 0 12 0\n"
+    assert proc_mod._parse_stat(data) == ("tmux: server (x)", "S", b"555", 100, 12)
+
+
+def test_collect_processes_reports_top_rates_and_d_state(tmp_path, monkeypatch) -> None:
+    _write_pid(tmp_path, 1, "init", "S", 100, 256, (0, 0))
+    _write_pid(tmp_path, 200, "db", "D", 1000, 25600, (0, 0))
+    _write_pid(tmp_path, 300, "short lived", "R", 10, 10, None)
+    (tmp_path / "self").mkdir()
+
+    scanner = proc_mod._ProcessScanner()
+    samples = []
+
+    def _scan() -> dict:
+        samples.append(1)
+        result = scanner.scan()
+        if len(samples) == 1:
+            # Between samples: db burns 50 ticks and writes 1 MiB, pid 300 exits.
+            _write_pid(tmp_path, 200, "db", "D", 1050, 25600, (0, 1_048_576))
+            for child in (tmp_path / "300").iterdir():
+                child.unlink()
+            (tmp_path / "300").rmdir()
+        return result
+
+    monkeypatch.setattr(proc_mod, "PROC_ROOT", str(tmp_path))
+    monkeypatch.setattr(proc_mod, "_CLK_TCK", 100)
+    monkeypatch.setattr(proc_mod, "_PAGE_SIZE", 4096)
+    monkeypatch.setattr(proc_mod, "_BASELINE", CounterBaseline(_scan, settle_s=0.0))
+
+    data = proc_mod.collect_processes(top_n=1)
+    assert data.total == 2
+    assert data.uninterruptible == 1
+    assert data.top_memory[0].name == "db"
+    assert data.top_memory[0].rss_mb == 100.0
+    assert data.top_cpu[0].pid == 200
+    assert data.top_io[0].write_bytes_per_s is not None and data.top_io[0].write_bytes_per_s > 0
+
+
+def test_counter_baseline_reuses_previous_sample_without_sleeping(monkeypatch) -> None:
+    values = iter([1, 2, 3])
+    baseline = CounterBaseline(lambda: next(values), settle_s=0.0)
+    assert baseline.pair()[:2] == (1, 2)
+    assert baseline.pair()[:2] == (2, 3)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass
+
+import pytest
+
+import sysmatrix.registry as registry
+import sysmatrix.snapshot as snapshot_mod
+from sysmatrix.models import MotherboardData
+from sysmatrix.registry import CHEAP, SAMPLING, CollectorSpec, plan
+
+
+@dataclass(slots=True)
+class UpsData:
+    charge_percent: float
+    on_battery: bool
+
+
+def _spec(domain: str, *depends: str) -> CollectorSpec:
+    return CollectorSpec(domain, lambda **_: None, depends=depends)
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    """Isolate plugin state from installed entry points."""
+    monkeypatch.setattr(registry, "_PLUGINS", [])
+    monkeypatch.setattr(registry, "_REGISTERED", {})
+    monkeypatch.setattr(snapshot_mod, "_LAST_KNOWN", {})
+    return registry
+
+
+def test_plan_orders_dependencies_and_keeps_registration_order() -> None:
+    specs = {spec.domain: spec for spec in (_spec("a", "c"), _spec("b"), _spec("c", "b"), _spec("d"))}
+    assert plan(specs, ["a"]) == ["b", "c", "a"]
+    assert plan(specs, ["d", "b"]) == ["b", "d"]
+
+
+def test_plan_rejects_unknown_domains_and_cycles() -> None:
+    specs = {spec.domain: spec for spec in (_spec("a", "b"), _spec("b", "a"), _spec("c", "missing"))}
+    with pytest.raises(ValueError, match="unknown snapshot domain"):
+        plan(specs, ["nope"])
+    with pytest.raises(ValueError, match="depends on unknown domain 'missing'"):
+        plan(specs, ["c"])
+    with pytest.raises(ValueError, match="dependency cycle"):
+        plan(specs, ["a"])
+
+
+def test_spec_validates_cost_class() -> None:
+    with pytest.raises(ValueError, match="unknown cost class"):
+        CollectorSpec("x", lambda: None, cost="expensive")
+
+
+def test_builtin_specs_declare_performance_dependencies() -> None:
+    specs = snapshot_mod.collector_specs()
+    assert [domain for domain in specs if domain not in snapshot_mod.INTERNAL_DOMAINS] == list(snapshot_mod.DOMAINS)
+    assert specs["performance"].depends == ("cpu", "gpu", "pressure", "thermal", "scheduler")
+    assert specs["cpu"].cost == SAMPLING
+    assert specs["system"].cost == CHEAP
+    assert specs["dmi"].static
+    assert snapshot_mod.expand_domains(["motherboard"]) == ["dmi", "motherboard"]
+    assert snapshot_mod.expand_domains(["performance"]) == [
+        "cpu",
+        "gpu",
+        "pressure",
+        "thermal",
+        "scheduler",
+        "performance",
+    ]
+
+
+def test_entry_point_plugins_are_loaded(monkeypatch) -> None:
+    spec = _spec("ups")
+
+    class _EntryPoint:
+        value = "sysmatrix_ups:SPEC"
+
+        def __init__(self, target):
+            self._target = target
+
+        def load(self):
+            if isinstance(self._target, Exception):
+                raise self._target
+            return self._target
+
+    def _entry_points(group):
+        assert group == registry.ENTRY_POINT_GROUP
+        return [_EntryPoint(spec), _EntryPoint(lambda: [_spec("fans")]), _EntryPoint(ImportError("broken"))]
+
+    monkeypatch.setattr("importlib.metadata.entry_points", _entry_points)
+    assert [item.domain for item in registry._load_entry_points()] == ["ups", "fans"]
+
+
+def test_entry_points_are_only_scanned_on_request(monkeypatch) -> None:
+    scans = []
+
+    def _load():
+        scans.append(1)
+        return [_spec("ups")]
+
+    monkeypatch.setattr(registry, "_PLUGINS", None)
+    monkeypatch.setattr(registry, "_REGISTERED", {})
+    monkeypatch.setattr(registry, "_load_entry_points", _load)
+    assert "ups" not in snapshot_mod.collector_specs()
+    assert scans == []
+    registry.load_plugins()
+    registry.load_plugins()
+    assert "ups" in snapshot_mod.collector_specs()
+    assert scans == [1]
+
+
+def test_static_dmi_domain_is_reused(monkeypatch) -> None:
+    reads = []
+
+    async def _board():
+        reads.append(1)
+        return MotherboardData(vendor="ASUS", model="B550", vrm_temp_c=None)
+
+    async def _vrm():
+        return 41.0 + len(reads)
+
+    monkeypatch.setattr(snapshot_mod, "_LAST_KNOWN", {})
+    monkeypatch.setattr(snapshot_mod, "collect_board_async", _board)
+    monkeypatch.setattr(snapshot_mod, "read_vrm_temp_async", _vrm)
+    first = snapshot_mod.collect_snapshot()
+    second = snapshot_mod.collect_snapshot()
+    assert reads == [1]
+    assert second.meta.domains["dmi"].state == "cached"
+    assert second.motherboard == MotherboardData(vendor="ASUS", model="B550", vrm_temp_c=42.0)
+    assert first.motherboard.vendor == "ASUS"
+    assert "dmi" not in second.extra
+
+
+def test_plugin_domain_lands_in_extra(plugins) -> None:
+    calls = []
+
+    def _ups(cpu):
+        calls.append(cpu.cores)
+        return UpsData(charge_percent=88.0, on_battery=False)
+
+    plugins.register_collector(CollectorSpec("ups", _ups, depends=("cpu",), static=True))
+    plugins.register_collector(_spec("cpu"))  # built-in domains cannot be replaced
+
+    snapshot = snapshot_mod.collect_snapshot()
+    assert snapshot.extra == {"ups": UpsData(charge_percent=88.0, on_battery=False)}
+    assert snapshot.meta.domains["ups"].state == "fresh"
+    assert snapshot.cpu.cores == calls[0]
+    assert json.loads(json.dumps(snapshot.to_dict()))["extra"]["ups"] == {"charge_percent": 88.0, "on_battery": False}
+
+    # Static domains are collected once per process.
+    again = asyncio.run(snapshot_mod.collect_snapshot_async())
+    assert len(calls) == 1
+    assert again.meta.domains["ups"].state == "cached"
+
+
+def test_check_accepts_plugin_domains(plugins) -> None:
+    from sysmatrix.check import parse_rule
+
+    plugins.register_collector(CollectorSpec("ups", lambda: UpsData(50.0, True)))
+    assert parse_rule("ups.charge_percent < 20").domain == "ups"
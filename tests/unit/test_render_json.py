@@ -1,3 +1,7 @@
+import json
+
+import pytest
+
 from sysmatrix.config import RuntimeConfig
 from sysmatrix.models import (
     CpuData,
@@ -71,3 +75,23 @@ def test_json_redacts_sensitive_fields() -> None:
     assert '"user": "[REDACTED]"' in rendered
     assert '"hostname": "[REDACTED]"' in rendered
     assert '"ip": "[REDACTED]"' in rendered
+
+
+def test_encode_json_compact_keeps_schema_order() -> None:
+    from sysmatrix.renderers.json_output import JSON_BACKENDS, encode_json
+
+    data = {"system": {"user": "u"}, "cpu": {"model": "m", "cores": 1}}
+    for backend in JSON_BACKENDS:
+        try:
+            encoded = encode_json(data, "compact", backend)
+        except ImportError:
+            continue
+        assert encoded == b'{"system":{"user":"u"},"cpu":{"model":"m","cores":1}}'
+
+
+def test_encode_json_pretty_backends_agree() -> None:
+    from sysmatrix.renderers.json_output import encode_json
+
+    pytest.importorskip("orjson")
+    data = {"b": [1, 2.5, None], "a": {"nested": "é"}}
+    assert json.loads(encode_json(data, "pretty", "orjson")) == json.loads(encode_json(data, "pretty", "json"))
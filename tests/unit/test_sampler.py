@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import sys
+import threading
+
+import pytest
+
+import sysmatrix
+import sysmatrix.sampler as sampler_mod
+from sysmatrix.defaults import (
+    default_cpu,
+    default_gpu,
+    default_memory,
+    default_motherboard,
+    default_network,
+    default_performance,
+    default_storage,
+    default_system,
+)
+from sysmatrix.models import Snapshot
+
+
+def _snapshot() -> Snapshot:
+    return Snapshot(
+        system=default_system(),
+        cpu=default_cpu(),
+        memory=default_memory(),
+        gpu=default_gpu(),
+        storage=default_storage(),
+        motherboard=default_motherboard(),
+        network=default_network(),
+        performance=default_performance(),
+    )
+
+
+def test_sampler_is_exported_lazily() -> None:
+    assert sysmatrix.Sampler is sampler_mod.Sampler
+    with pytest.raises(AttributeError):
+        sysmatrix.NotThere  # noqa: B018
+    assert "sysmatrix.sampler" in sys.modules
+
+
+def test_sampler_rejects_short_interval() -> None:
+    with pytest.raises(ValueError):
+        sampler_mod.Sampler(interval_s=0.001)
+
+
+def test_sampler_publishes_new_snapshots_without_reusing_them(monkeypatch) -> None:
+    produced: list[Snapshot] = []
+    deadlines: list[float | None] = []
+    enough = threading.Event()
+
+    async def _collect(deadline_s=None, include_virtual=False):
+        deadlines.append(deadline_s)
+        produced.append(_snapshot())
+        if len(produced) >= 3:
+            enough.set()
+        return produced[-1]
+
+    monkeypatch.setattr(sampler_mod, "collect_snapshot_async", _collect)
+    sampler = sampler_mod.Sampler(interval_s=0.05)
+    assert sampler.latest is None and sampler.age_s is None
+    with sampler:
+        first = sampler.wait(timeout=5)
+        assert first is produced[0]
+        assert enough.wait(timeout=5)
+    assert sampler.latest is produced[sampler.ticks - 1]
+    assert sampler.ticks >= 3
+    assert first is not sampler.latest
+    assert sampler.age_s is not None and sampler.age_s >= 0
+    assert set(deadlines) == {0.05}
+
+
+def test_sampler_survives_collection_errors(monkeypatch) -> None:
+    calls = 0
+
+    async def _collect(deadline_s=None, include_virtual=False):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("boom")
+        return _snapshot()
+
+    monkeypatch.setattr(sampler_mod, "collect_snapshot_async", _collect)
+    with sampler_mod.Sampler(interval_s=0.05) as sampler:
+        assert sampler.wait(timeout=5) is not None
+    assert sampler.errors == 1
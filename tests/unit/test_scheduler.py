@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import sysmatrix.collectors.performance as perf_mod
+import sysmatrix.collectors.scheduler as sched_mod
+from sysmatrix.collectors.scheduler import parse_schedstat, parse_stat, scheduler_data
+from sysmatrix.models import SchedulerData
+
+STAT = (
+    b"cpu  100 0 50 1000 10 0 5 0 0 0\n"
+    b"cpu0 100 0 50 1000 10 0 5 0 0 0\n"
+    b"intr 123456 0 9 0 0 0 0 0 0 1 0 0 0 0\n"
+    b"ctxt 5000\n"
+    b"btime 1700000000\n"
+    b"processes 300\n"
+    b"procs_running 3\n"
+    b"procs_blocked 1\n"
+    b"softirq 10 0 1 0 0 0 0 0 0 0 9\n"
+)
+
+SCHEDSTAT = (
+    b"version 15\n"
+    b"timestamp 4295000000\n"
+    b"cpu0 0 0 100 50 80 40 123456 7890000 900\n"
+    b"domain0 00000003 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24 25 26 27 28 29 30 31 32\n"
+    b"cpu1 0 0 100 50 80 40 654321 1000000 100\n"
+)
+
+
+def _sched(wait_ms_per_s: float | None, cpu_count: int = 2) -> SchedulerData:
+    return SchedulerData(
+        available=True,
+        window_s=1.0,
+        cpu_count=cpu_count,
+        context_switches_per_s=1000.0,
+        forks_per_s=5.0,
+        procs_running=16,
+        procs_blocked=0,
+        run_queue_wait_ms_per_s=wait_ms_per_s,
+        avg_wait_us=None if wait_ms_per_s is None else 250.0,
+    )
+
+
+def test_parse_stat_picks_scheduler_counters() -> None:
+    assert parse_stat(STAT) == {b"ctxt": 5000, b"processes": 300, b"procs_running": 3, b"procs_blocked": 1}
+    assert parse_stat(b"cpu  1 2 3\nctxt 7") == {b"ctxt": 7}
+
+
+def test_parse_schedstat_skips_domain_lines() -> None:
+    assert parse_schedstat(SCHEDSTAT) == {0: (7890000, 900), 1: (1000000, 100)}
+    assert parse_schedstat(b"version 15\n") == {}
+
+
+def test_scheduler_data_rates_and_wait() -> None:
+    before = (parse_stat(STAT), parse_schedstat(SCHEDSTAT))
+    now_stat = {b"ctxt": 7000, b"processes": 310, b"procs_running": 2, b"procs_blocked": 0}
+    # cpu0 waited 100 ms over 200 slices, cpu1 waited 20 ms over 200 slices.
+    now_sched = {0: (107890000, 1100), 1: (21000000, 300)}
+    data = scheduler_data(before, (now_stat, now_sched), 2.0)
+
+    assert data.available
+    assert data.cpu_count == 2
+    assert data.context_switches_per_s == 1000.0
+    assert data.forks_per_s == 5.0
+    assert (data.procs_running, data.procs_blocked) == (2, 0)
+    assert data.run_queue_wait_ms_per_s == 60.0
+    assert data.avg_wait_us == 300.0
+    assert [cpu.cpu for cpu in data.top_wait_cpus] == [0, 1]
+    assert data.top_wait_cpus[0].wait_ms_per_s == 50.0
+    assert data.top_wait_cpus[0].avg_wait_us == 500.0
+    assert data.top_wait_cpus[0].timeslices_per_s == 100.0
+
+
+def test_scheduler_data_without_schedstat() -> None:
+    stat = parse_stat(STAT)
+    data = scheduler_data((stat, {}), (stat, {}), 1.0)
+    assert data.run_queue_wait_ms_per_s is None and data.avg_wait_us is None
+    assert data.top_wait_cpus == []
+    assert data.cpu_count > 0
+
+
+def test_collect_scheduler_with_missing_schedstat(tmp_path, monkeypatch) -> None:
+    stat = tmp_path / "stat"
+    stat.write_bytes(STAT)
+    monkeypatch.setattr(sched_mod, "STAT_PATH", str(stat))
+    monkeypatch.setattr(sched_mod, "SCHEDSTAT_PATH", str(tmp_path / "schedstat"))
+    sched_mod._BASELINE.reset()
+    try:
+        data = sched_mod.collect_scheduler()
+    finally:
+        sched_mod._BASELINE.reset()
+    assert data.available
+    assert data.context_switches_per_s == 0.0
+    assert data.run_queue_wait_ms_per_s is None
+
+
+def test_run_queue_wait_drives_bottleneck(monkeypatch) -> None:
+    monkeypatch.setattr(perf_mod, "_read_cpu_freq_pair", lambda: (None, None))
+    monkeypatch.setattr(perf_mod, "_load_average", lambda: "0.00, 0.00, 0.00")
+
+    busy = perf_mod._performance_data(50.0, None, None, None, None, None, scheduler=_sched(400.0))
+    assert busy.bottleneck == "Run-Queue Contention (wait: 200 ms/s per CPU, avg 250 us)"
+
+    calm = perf_mod._performance_data(50.0, None, None, None, None, None, scheduler=_sched(20.0))
+    assert calm.bottleneck == "None detected"
+
+    # A runnable count alone is not evidence of contention.
+    unmeasured = perf_mod._performance_data(50.0, None, None, None, None, None, scheduler=_sched(None))
+    assert unmeasured.bottleneck == "None detected"
+
+    stolen = perf_mod._performance_data(50.0, None, None, 30.0, None, None, scheduler=_sched(400.0))
+    assert stolen.bottleneck.startswith("CPU Steal")
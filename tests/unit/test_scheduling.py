@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+
+from sysmatrix.utils.scheduling import FixedRateScheduler
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _scheduler(clock: _Clock, interval: float, wall: float) -> FixedRateScheduler:
+    return FixedRateScheduler(interval, clock=clock, wall_clock=lambda: wall, sleep=clock.sleep)
+
+
+def test_ticks_do_not_drift_with_work_time() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(clock, 1.0, wall=50.0)
+    ticks = []
+    for _ in range(5):
+        ticks.append(clock.now)
+        clock.now += 0.4  # collection cost
+        scheduler.wait()
+    assert [round(t - ticks[0], 6) for t in ticks] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert scheduler.missed == 0
+
+
+def test_ticks_align_to_wall_clock() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(clock, 0.5, wall=50.3)
+    scheduler.wait()
+    # Wall clock 50.3 -> next half-second boundary is 50.5.
+    assert clock.sleeps == [pytest.approx(0.2)]
+
+
+def test_overrun_skips_and_counts_missed_ticks() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(clock, 0.1, wall=10.0)
+    scheduler.wait()
+    start = clock.now
+    clock.now += 0.35
+    assert scheduler.wait() == 3
+    assert scheduler.missed == 3
+    assert clock.now == pytest.approx(start + 0.4)
+
+
+def test_first_wait_catching_up_is_not_a_miss() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(clock, 0.1, wall=10.09)
+    clock.now += 0.05
+    assert scheduler.wait() == 0
+    assert scheduler.missed == 0
+
+
+def test_rejects_too_short_interval() -> None:
+    with pytest.raises(ValueError):
+        FixedRateScheduler(0.01)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import io
+import os
+
+import sysmatrix.renderers.screen as screen_mod
+from sysmatrix.renderers.screen import CLEAR, DiffScreen
+
+
+class _Tty(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+    def take(self) -> str:
+        value = self.getvalue()
+        self.seek(0)
+        self.truncate()
+        return value
+
+
+def _screen(monkeypatch, columns: int = 80, lines: int = 24) -> tuple[DiffScreen, _Tty]:
+    monkeypatch.setattr(screen_mod.shutil, "get_terminal_size", lambda: os.terminal_size((columns, lines)))
+    stream = _Tty()
+    return DiffScreen(stream), stream
+
+
+def test_first_frame_is_full_redraw(monkeypatch) -> None:
+    screen, stream = _screen(monkeypatch)
+    screen.draw("a\nb")
+    assert stream.take() == f"{CLEAR}a\nb\n"
+
+
+def test_only_changed_lines_are_rewritten(monkeypatch) -> None:
+    screen, stream = _screen(monkeypatch)
+    screen.draw("cpu 10%\nram 1G\nnet 0")
+    stream.take()
+    screen.draw("cpu 12%\nram 1G\nnet 0")
+    out = stream.take()
+    assert out == "\033[1;1H\033[Kcpu 12%\033[4;1H"
+    assert "ram" not in out
+
+
+def test_shorter_frame_clears_leftover_rows(monkeypatch) -> None:
+    screen, stream = _screen(monkeypatch)
+    screen.draw("a\nb\nc")
+    stream.take()
+    screen.draw("a")
+    assert stream.take() == "\033[2;1H\033[K\033[3;1H\033[K\033[2;1H"
+
+
+def test_resize_forces_full_redraw(monkeypatch) -> None:
+    screen, stream = _screen(monkeypatch)
+    screen.draw("a")
+    stream.take()
+    monkeypatch.setattr(screen_mod.shutil, "get_terminal_size", lambda: os.terminal_size((100, 30)))
+    screen.draw("a")
+    assert stream.take().startswith(CLEAR)
+
+
+def test_frame_larger_than_terminal_is_clipped_and_diffed(monkeypatch) -> None:
+    screen, stream = _screen(monkeypatch, columns=10, lines=4)
+    rows = ["\033[31m" + "x" * 12 + "\033[0m", "y" * 11, "c 1", "d", "e", "f"]
+    screen.draw("\n".join(rows))
+    assert stream.take() == f"{CLEAR}\033[31m{'x' * 10}\033[0m\n{'y' * 10}\nc 1\n"
+    rows[2] = "c 2"
+    rows[4] = "e changed"  # below the visible rows: nothing to draw
+    screen.draw("\n".join(rows))
+    assert stream.take() == "\033[3;1H\033[Kc 2\033[4;1H"
+
+
+def test_non_tty_always_redraws_in_full() -> None:
+    stream = io.StringIO()
+    screen = DiffScreen(stream)
+    screen.draw("a")
+    screen.draw("a")
+    assert stream.getvalue() == f"{CLEAR}a\n{CLEAR}a\n"
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+import sysmatrix.shm as shm_mod
+from sysmatrix.shm import SnapshotPublisher, SnapshotReader, read_snapshot
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def name():
+    return f"sysmatrix-test-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+def test_reader_sees_each_publish(name) -> None:
+    with SnapshotPublisher(name, capacity=4096) as publisher, SnapshotReader(name) as reader:
+        assert reader.read() is None
+        assert publisher.publish_bytes(b'{"cpu":{"usage_percent":12.5}}') == 2
+        assert reader.read() == {"cpu": {"usage_percent": 12.5}}
+        publisher.publish_bytes(b"{}")
+        sequence, published_ns, payload = reader.read_bytes()
+        assert (sequence, payload) == (4, b"{}")
+        assert published_ns > 0
+        assert reader.sequence == publisher.sequence == 4
+
+
+def test_reader_retries_while_write_in_progress(name) -> None:
+    with SnapshotPublisher(name, capacity=64) as publisher, SnapshotReader(name) as reader:
+        publisher.publish_bytes(b"{}")
+        shm_mod._SEQUENCE.pack_into(publisher._shm.buf, shm_mod._SEQUENCE_OFFSET, 5)
+        with pytest.raises(TimeoutError):
+            reader.read_bytes(retries=3)
+
+
+def test_publisher_rejects_oversized_snapshot(name) -> None:
+    with SnapshotPublisher(name, capacity=8) as publisher:
+        with pytest.raises(ValueError, match="exceeds segment capacity"):
+            publisher.publish_bytes(b"0123456789")
+
+
+def test_restarted_publisher_reuses_segment_and_sequence(name) -> None:
+    first = SnapshotPublisher(name, capacity=64)
+    first.publish_bytes(b"[1]")
+    first.close(unlink=False)
+    with SnapshotPublisher(name, capacity=64) as second:
+        assert second.publish_bytes(b"[2]") == 4
+        assert read_snapshot(name) == [2]
+
+
+def test_reader_requires_publisher(name) -> None:
+    with pytest.raises(FileNotFoundError):
+        SnapshotReader(name)
+
+
+def test_reader_process_exit_keeps_segment(name) -> None:
+    code = f"from sysmatrix.shm import read_snapshot; print(read_snapshot({name!r}))"
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    with SnapshotPublisher(name, capacity=64) as publisher:
+        publisher.publish_bytes(b'{"ok":true}')
+        for _ in range(2):
+            proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+            assert proc.stdout.strip() == "{'ok': True}"
+            assert "Traceback" not in proc.stderr
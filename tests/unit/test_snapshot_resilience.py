@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+import time
 
 import sysmatrix.snapshot as snapshot_mod
+from sysmatrix.utils.sampling import CounterBaseline
 
 
 def test_snapshot_survives_collector_failure(monkeypatch) -> None:
@@ -25,3 +29,130 @@ def test_snapshot_logs_collector_failure(monkeypatch, caplog) -> None:
         snapshot = snapshot_mod.collect_snapshot()
     assert snapshot.memory.used_gb == 0.0
     assert "collector '_boom' failed; using fallback 'default_memory'" in caplog.text
+
+
+def test_async_snapshot_falls_back_for_async_collector(monkeypatch) -> None:
+    async def _boom():
+        raise RuntimeError("collector failed")
+
+    monkeypatch.setattr(snapshot_mod, "collect_gpu_async", _boom)
+    snapshot = asyncio.run(snapshot_mod.collect_snapshot_async())
+    assert snapshot.gpu.model == "Unknown GPU"
+    assert snapshot.gpu.utilization_percent is None
+
+
+def test_deadline_marks_unfinished_domains(monkeypatch) -> None:
+    async def _slow():
+        await asyncio.sleep(5)
+
+    monkeypatch.setattr(snapshot_mod, "collect_gpu_async", _slow)
+    monkeypatch.setattr(snapshot_mod, "_LAST_KNOWN", {})
+    snapshot = snapshot_mod.collect_snapshot(deadline_s=0.3)
+    assert snapshot.gpu.model == "Unknown GPU"
+    assert snapshot.meta.domains["gpu"].state == "fallback"
+    assert snapshot.meta.domains["memory"].state == "fresh"
+
+
+def test_deadline_reuses_last_known_value(monkeypatch) -> None:
+    async def _slow():
+        await asyncio.sleep(5)
+
+    monkeypatch.setattr(snapshot_mod, "_LAST_KNOWN", {})
+    first = snapshot_mod.collect_snapshot()
+    assert first.meta.domains["gpu"].state == "fresh"
+
+    monkeypatch.setattr(snapshot_mod, "collect_gpu_async", _slow)
+    snapshot = snapshot_mod.collect_snapshot(deadline_s=0.3)
+    assert snapshot.gpu == first.gpu
+    status = snapshot.meta.domains["gpu"]
+    assert status.state == "stale"
+    assert status.age_s is not None and status.age_s >= 0
+
+
+def test_include_virtual_reaches_network_collector(monkeypatch) -> None:
+    seen = []
+
+    async def _network(include_virtual=False):
+        seen.append(include_virtual)
+        raise RuntimeError("stop here")
+
+    monkeypatch.setattr(snapshot_mod, "collect_network_async", _network)
+    snapshot_mod.collect_snapshot()
+    snapshot_mod.collect_snapshot(include_virtual=True)
+    assert seen == [False, True]
+
+
+def test_sync_snapshot_inside_running_loop() -> None:
+    async def _caller():
+        return snapshot_mod.collect_snapshot(deadline_s=2.0)
+
+    snapshot = asyncio.run(_caller())
+    assert set(snapshot.meta.domains) >= set(snapshot_mod.DOMAINS)
+
+
+def test_deadline_abandons_blocked_sync_collector(monkeypatch) -> None:
+    release = threading.Event()
+
+    def _blocked():
+        release.wait(10.0)
+        raise RuntimeError("released")
+
+    monkeypatch.setattr(snapshot_mod, "collect_memory", _blocked)
+    monkeypatch.setattr(snapshot_mod, "_LAST_KNOWN", {})
+    started = time.monotonic()
+    try:
+        snapshot = snapshot_mod.collect_snapshot(deadline_s=0.3)
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+    assert snapshot.meta.domains["memory"].state == "fallback"
+    assert elapsed < 1.0
+
+
+def test_short_deadline_caps_async_settle_window(monkeypatch) -> None:
+    # Like the network baseline: settles for 0.25 s and is awaited on the loop.
+    baseline = CounterBaseline(time.monotonic, settle_s=0.25)
+
+    async def _network(include_virtual=False):
+        await baseline.pair_async()
+        return snapshot_mod.default_network()
+
+    monkeypatch.setattr(snapshot_mod, "collect_network_async", _network)
+    monkeypatch.setattr(snapshot_mod, "_LAST_KNOWN", {})
+    snapshot = snapshot_mod.collect_snapshot(deadline_s=0.2)
+    assert snapshot.meta.domains["network"].state == "fresh"
+
+
+def test_priming_runs_off_the_loop_within_the_deadline() -> None:
+    release = threading.Event()
+
+    def _slow_first_sample() -> float:
+        release.wait(10.0)
+        return time.monotonic()
+
+    baseline = CounterBaseline(_slow_first_sample)
+    ticks = []
+
+    async def _scenario():
+        async def _ticker():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+
+        ticker = asyncio.create_task(_ticker())
+        try:
+            return await snapshot_mod.collect_snapshot_async(deadline_s=0.2)
+        finally:
+            ticker.cancel()
+
+    started = time.monotonic()
+    try:
+        with snapshot_mod.collection_runner() as runner:
+            snapshot = runner.run(_scenario())
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+        del baseline
+    assert elapsed < 1.0
+    assert snapshot.meta.elapsed_ms < 1000
+    assert len(ticks) >= 5  # the caller's loop kept running while baselines primed
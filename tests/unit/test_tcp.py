@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+
+import sysmatrix.collectors.tcp as tcp_mod
+from sysmatrix.collectors.tcp import count_proc_states, parse_snmp, tcp_data
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "collectors"
+
+
+def _padded_table(path: Path, slots: range, state: int = 1) -> None:
+    """Write a /proc/net/tcp-shaped file with rows padded to 149 columns like the kernel's."""
+    rows = ["  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode"]
+    for slot in slots:
+        rows.append(
+            f"{slot:4d}: 0100007F:1F90 0100007F:{slot % 65536:04X} {state:02X} 00000000:00000000"
+            f" 00:00000000 00000000     0        0 {slot + 1000} 1 0000000000000000 20 4 30 10 -1"
+        )
+    path.write_text("".join(f"{row:<149}\n" for row in rows))
+
+
+def test_parse_snmp_and_netstat_tables() -> None:
+    snmp = parse_snmp((FIXTURES / "proc_net_snmp.txt").read_bytes())
+    assert snmp[(b"Tcp", b"RetransSegs")] == 2210
+    assert snmp[(b"Tcp", b"MaxConn")] == -1
+    assert snmp[(b"Udp", b"NoPorts")] == 51
+    netstat = parse_snmp((FIXTURES / "proc_net_netstat.txt").read_bytes())
+    assert netstat[(b"TcpExt", b"ListenOverflows")] == 14
+    assert netstat[(b"IpExt", b"OutOctets")] == 201883311
+
+
+def test_count_proc_states_fixed_and_variable_rows() -> None:
+    counts: Counter[int] = Counter()
+    count_proc_states(str(FIXTURES / "proc_net_tcp.txt"), counts)
+    assert counts == {10: 2, 1: 1, 6: 1, 8: 1}
+    count_proc_states(str(FIXTURES / "proc_net_tcp6.txt"), counts)
+    assert counts == {10: 3, 1: 2, 6: 1, 8: 1, 3: 1}
+
+
+def test_count_proc_states_across_chunks_and_slot_widths(tmp_path, monkeypatch) -> None:
+    table = tmp_path / "tcp"
+    _padded_table(table, range(9990, 10010))
+    monkeypatch.setattr(tcp_mod, "_CHUNK", 1000)  # rows straddle chunks
+    counts: Counter[int] = Counter()
+    count_proc_states(str(table), counts)
+    assert counts == {1: 20}
+
+    # The slot number gains a digit mid-batch; the batch is split, not re-parsed.
+    data = table.read_bytes()
+    start = data.index(b"\n") + 1
+    assert tcp_mod._fixed_states(data, start, len(data)) == {1: 20}
+
+
+def test_count_proc_states_falls_back_per_row(tmp_path) -> None:
+    table = tmp_path / "tcp6"
+    table.write_bytes(
+        (FIXTURES / "proc_net_tcp6.txt").read_bytes() + b"garbage row\n   3: 00:0016 00:0000 0B 0\n"
+    )
+    counts: Counter[int] = Counter()
+    count_proc_states(str(table), counts)
+    assert counts == {10: 1, 1: 1, 3: 1, 11: 1}
+
+
+def test_tcp_data_rates_and_states() -> None:
+    before = parse_snmp((FIXTURES / "proc_net_snmp.txt").read_bytes())
+    before.update(parse_snmp((FIXTURES / "proc_net_netstat.txt").read_bytes()))
+    now = dict(before)
+    now[(b"Tcp", b"OutSegs")] += 4000
+    now[(b"Tcp", b"RetransSegs")] += 40
+    now[(b"Tcp", b"OutRsts")] += 10
+    now[(b"TcpExt", b"ListenOverflows")] += 6
+
+    data = tcp_data(before, now, 2.0, Counter({1: 5, 10: 2, 6: 9}), "procfs")
+    assert data.available
+    assert data.sockets == 16
+    assert data.established == 2
+    assert list(data.states.items()) == [("TIME_WAIT", 9), ("ESTABLISHED", 5), ("LISTEN", 2)]
+    assert data.rates is not None
+    assert data.rates.retrans_segs_per_s == 20.0
+    assert data.rates.resets_sent_per_s == 5.0
+    assert data.rates.listen_overflows_per_s == 3.0
+    assert data.rates.listen_drops_per_s == 0.0
+    assert data.rates.syncookies_sent_per_s == 0.0
+    assert data.retrans_percent == 1.0
+
+    no_netstat = tcp_data(before, {key: value for key, value in now.items() if key[0] == b"Tcp"}, 1.0, Counter(), None)
+    assert no_netstat.rates is not None and no_netstat.rates.listen_overflows_per_s is None
+
+
+def test_collect_tcp_falls_back_to_procfs(monkeypatch) -> None:
+    def _no_sock_diag() -> Counter[int]:
+        raise OSError("sock_diag unavailable")
+
+    monkeypatch.setattr(tcp_mod, "read_tcp_states", _no_sock_diag)
+    monkeypatch.setattr(tcp_mod, "SNMP_PATH", str(FIXTURES / "proc_net_snmp.txt"))
+    monkeypatch.setattr(tcp_mod, "NETSTAT_PATH", str(FIXTURES / "missing_netstat"))
+    monkeypatch.setattr(
+        tcp_mod, "TCP_PATHS", (str(FIXTURES / "proc_net_tcp.txt"), str(FIXTURES / "missing_tcp6"))
+    )
+    tcp_mod._BASELINE.reset()
+    try:
+        data = tcp_mod.collect_tcp()
+    finally:
+        tcp_mod._BASELINE.reset()
+    assert data.state_source == "procfs"
+    assert data.sockets == 5
+    assert data.rates is not None and data.rates.retrans_segs_per_s == 0.0
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import sysmatrix.collectors.performance as perf_mod
+import sysmatrix.collectors.thermal as thermal_mod
+from sysmatrix.models import PackageThermal, ThermalData
+
+
+def _cpu(root, cpu: int, package: int, core: int, core_count: int, package_count: int) -> None:
+    base = root / f"cpu{cpu}"
+    (base / "topology").mkdir(parents=True)
+    (base / "thermal_throttle").mkdir()
+    (base / "topology" / "physical_package_id").write_text(f"{package}\n")
+    (base / "topology" / "core_id").write_text(f"{core}\n")
+    (base / "thermal_throttle" / "core_throttle_count").write_text(f"{core_count}\n")
+    (base / "thermal_throttle" / "package_throttle_count").write_text(f"{package_count}\n")
+
+
+def _zone(root, zone: str, name: str, energy: int, max_range: int = 262143328850) -> None:
+    base = root / zone
+    base.mkdir(exist_ok=True)
+    (base / "name").write_text(name + "\n")
+    (base / "energy_uj").write_text(f"{energy}\n")
+    (base / "max_energy_range_uj").write_text(f"{max_range}\n")
+
+
+def test_energy_delta_handles_wraparound() -> None:
+    assert thermal_mod.energy_delta_uj(1_000, 6_000, 10_000) == 5_000
+    assert thermal_mod.energy_delta_uj(9_000, 2_000, 10_000) == 3_000
+    assert thermal_mod.energy_delta_uj(9_000, 2_000, 0) is None
+
+
+def test_throttle_counts_once_per_core_and_package(tmp_path, monkeypatch) -> None:
+    # cpu0/cpu2 are SMT siblings on package 0; cpu1 is alone on package 1.
+    _cpu(tmp_path, 0, package=0, core=0, core_count=10, package_count=4)
+    _cpu(tmp_path, 2, package=0, core=0, core_count=10, package_count=4)
+    _cpu(tmp_path, 3, package=0, core=1, core_count=5, package_count=4)
+    _cpu(tmp_path, 1, package=1, core=0, core_count=7, package_count=1)
+    (tmp_path / "cpufreq").mkdir()
+    monkeypatch.setattr(thermal_mod, "CPU_ROOT", str(tmp_path))
+    assert thermal_mod._sample_throttle() == {0: (15, 4), 1: (7, 1)}
+
+
+def test_rapl_zones_map_to_packages(tmp_path, monkeypatch) -> None:
+    _zone(tmp_path, "intel-rapl:0", "package-0", 5_000_000)
+    _zone(tmp_path, "intel-rapl:0:0", "core", 3_000_000)
+    _zone(tmp_path, "intel-rapl:0:1", "dram", 1_000_000)
+    _zone(tmp_path, "intel-rapl:1", "psys", 9_000_000)
+    _zone(tmp_path, "intel-rapl-mmio:0", "package-0", 1)
+    monkeypatch.setattr(thermal_mod, "POWERCAP_ROOT", str(tmp_path))
+    sample = thermal_mod._sample_rapl()
+    assert set(sample) == {(0, "package"), (0, "core"), (0, "dram")}
+    assert sample[(0, "package")] == (5_000_000, 262143328850)
+
+
+def test_package_power_and_throttle_deltas() -> None:
+    before = {(0, "package"): (262_143_000_000, 262_143_328_850), (0, "dram"): (1_000_000, 65_712_999_613)}
+    now = {(0, "package"): (20_000_000, 262_143_328_850), (0, "dram"): (3_000_000, 65_712_999_613)}
+    item = thermal_mod._package(0, (15, 4), (18, 4), before, now, elapsed=2.0)
+    assert item.core_throttle_events == 3
+    assert item.package_throttle_events == 0
+    # 328_850 uJ before the wrap plus 20_000_000 after, over two seconds.
+    assert item.package_watts == 10.16
+    assert item.dram_watts == 1.0
+    assert item.core_watts is None
+
+
+def test_collect_thermal_without_sysfs(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(thermal_mod, "CPU_ROOT", str(tmp_path / "missing"))
+    monkeypatch.setattr(thermal_mod, "POWERCAP_ROOT", str(tmp_path / "missing"))
+    thermal_mod._BASELINE.reset()
+    try:
+        data = thermal_mod.collect_thermal()
+    finally:
+        thermal_mod._BASELINE.reset()
+    assert not data.available
+    assert data.packages == []
+
+
+def _thermal(core_events: int | None) -> ThermalData:
+    return ThermalData(
+        available=True,
+        window_s=1.0,
+        packages=[PackageThermal(0, core_events, 0, 30.0, None, None)],
+    )
+
+
+def test_thermal_status_prefers_measured_throttling(monkeypatch) -> None:
+    monkeypatch.setattr(perf_mod, "_read_cpu_freq_pair", lambda: (None, None))
+    monkeypatch.setattr(perf_mod, "_load_average", lambda: "0.00, 0.00, 0.00")
+
+    hot = perf_mod._performance_data(10.0, None, None, None, None, cpu_temp=97.0, thermal=_thermal(0))
+    assert hot.thermal_status == "Critical"
+    assert hot.throttle_events == 0
+
+    cool = perf_mod._performance_data(10.0, None, None, None, None, cpu_temp=60.0, thermal=_thermal(12))
+    assert cool.thermal_status == "THROTTLING"
+    assert cool.throttle_events == 12
+
+    unmeasured = perf_mod._performance_data(10.0, None, None, None, None, cpu_temp=97.0)
+    assert unmeasured.thermal_status == "THROTTLING"
+    assert unmeasured.throttle_events is None
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+import sysmatrix.utils.tools as tools_mod
+from sysmatrix.utils.commands import run_command
+from sysmatrix.utils.tools import ToolRegistry
+
+
+@pytest.fixture(autouse=True)
+def _fresh_tools():
+    """Keep backoff and resolved paths in the global registry from leaking between tests."""
+    tools_mod.TOOLS.reset()
+    yield
+    tools_mod.TOOLS.reset()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_missing_tool_is_resolved_once_and_backed_off(monkeypatch) -> None:
+    clock = _Clock()
+    lookups: list[str] = []
+
+    def _which(name: str) -> None:
+        lookups.append(name)
+        return None
+
+    monkeypatch.setattr(tools_mod.time, "monotonic", clock)
+    monkeypatch.setattr(tools_mod.shutil, "which", _which)
+    registry = ToolRegistry(base_backoff_s=5.0)
+
+    assert registry.acquire(["sensors"]) is None
+    assert registry.acquire(["sensors"]) is None
+    assert lookups == ["sensors"]
+    status = registry.status()["sensors"]
+    assert status.last_error == "ENOENT"
+    assert status.retry_in_s == 5.0
+
+    clock.now += 6
+    assert registry.acquire(["sensors"]) is None
+    assert lookups == ["sensors", "sensors"]
+    assert registry.status()["sensors"].retry_in_s == 10.0
+
+
+def test_backoff_is_capped(monkeypatch) -> None:
+    monkeypatch.setattr(tools_mod.time, "monotonic", _Clock())
+    registry = ToolRegistry(base_backoff_s=5.0, max_backoff_s=20.0)
+    for _ in range(6):
+        registry.record_failure(["smartctl", "-A", "/dev/sda"], "timeout")
+    status = registry.status()["smartctl -A /dev/sda"]
+    assert status.failures == 6
+    assert status.retry_in_s == 20.0
+
+
+def test_repeated_nonzero_exit_without_output_backs_off() -> None:
+    registry = ToolRegistry(nonzero_limit=3)
+    args = ["dmidecode", "-s", "baseboard-manufacturer"]
+    registry.record_exit(args, 1, has_output=False)
+    registry.record_exit(args, 1, has_output=False)
+    assert registry.status()["dmidecode -s baseboard-manufacturer"].retry_in_s is None
+    registry.record_exit(args, 1, has_output=False)
+    assert registry.status()["dmidecode -s baseboard-manufacturer"].retry_in_s is not None
+
+
+def test_success_clears_failures() -> None:
+    registry = ToolRegistry()
+    registry.record_exit(["lspci"], 1, has_output=False)
+    registry.record_exit(["lspci"], 4, has_output=True)
+    assert registry.status() == {}
+
+
+def test_run_command_records_timeouts() -> None:
+    args = [sys.executable, "-c", "import time; time.sleep(5)", "tools-timeout"]
+    assert run_command(args, timeout_s=0.2) == ""
+    status = tools_mod.TOOLS.status()[" ".join(args)]
+    assert status.last_error == "timeout"
+    assert status.retry_in_s is not None
+    # Backed-off commands return immediately without spawning.
+    assert run_command(args, timeout_s=0.2) == ""
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+import sysmatrix.renderers.watch as watch_mod
+from sysmatrix.config import RuntimeConfig
+
+
+class _Sampler:
+    def __init__(self, hz: float, fail_start: bool = False) -> None:
+        self.fail_start = fail_start
+        self.stopped = False
+
+    def start(self) -> _Sampler:
+        if self.fail_start:
+            raise FileNotFoundError("/proc/stat")
+        return self
+
+    def drain(self) -> None:
+        raise RuntimeError("burst sampler stopped") from ValueError("bad /proc/stat line")
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.mark.parametrize(
+    ("fail_start", "message"),
+    [
+        (True, "sysmatrix: burst sampling unavailable: /proc/stat\n"),
+        (False, "sysmatrix: burst sampling failed: bad /proc/stat line\n"),
+    ],
+)
+def test_burst_errors_end_watch_with_one_line(monkeypatch, capsys, fail_start: bool, message: str) -> None:
+    samplers = []
+
+    def _sampler(hz: float) -> _Sampler:
+        samplers.append(_Sampler(hz, fail_start))
+        return samplers[-1]
+
+    monkeypatch.setattr(watch_mod, "BurstSampler", _sampler)
+    monkeypatch.setattr(watch_mod, "collect_snapshot", lambda *_args: SimpleNamespace(burst=None))
+    config = RuntimeConfig(watch=True, watch_interval=0.05, burst_hz=20)
+    assert watch_mod.run_watch(config) == 1
+    assert capsys.readouterr().err == message
+    assert samplers[0].stopped